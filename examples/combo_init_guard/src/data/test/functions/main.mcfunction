@@ -0,0 +1,8 @@
+from bolt_expressions import Expression, Scoreboard
+
+abc = Scoreboard("abc.main", "dummy")
+
+Expression.init_commands.append("say reloaded")
+
+abc["@s"] = (abc["#value"] * 3 + 1) / (abc["#denom"] * 5)
+abc["#max"] = max(abc["#value"], 100) * 7
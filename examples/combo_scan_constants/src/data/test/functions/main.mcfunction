@@ -0,0 +1,5 @@
+from bolt_expressions import Scoreboard
+
+abc = Scoreboard("abc.obj")
+
+abc["@s"] *= 3
@@ -0,0 +1,3 @@
+scoreboard players operation @s abc.obj *= $7 bolt.expr.const
+scoreboard players operation @s abc.obj += $3 bolt.expr.const
+execute if score @s abc.obj matches 10.. run scoreboard players set $tmp bolt.expr.temp 1
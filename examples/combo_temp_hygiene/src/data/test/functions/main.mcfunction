@@ -0,0 +1,38 @@
+from bolt_expressions import Scoreboard, Data
+from nbtlib import Byte
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+nearest = Data.entity("@e[type=pig,limit=1,sort=nearest]")
+
+a, b, c, x = obj["#a", "#b", "#c", "#x"]
+
+function ./scores:
+    a = (x * 2 + b) * (c + 1)
+    b = x * x + c * c
+
+function ./storage:
+    storage.list.append(x)
+    storage.list.append(storage.item + x)
+
+function ./snapshot:
+    a = nearest.Health
+    b = nearest.Air
+    c = nearest.Fire
+
+function ./branch:
+    if x * 3 > b + 2:
+        say greater
+
+function ./chain:
+    if x * 3 > b:
+        say high
+    elif x * 2 > b:
+        say mid
+    else:
+        say low
+
+function ./early:
+    if x * 2 > b:
+        return 1
+    say after
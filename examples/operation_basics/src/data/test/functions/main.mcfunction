@@ -34,6 +34,14 @@ function ./constants:
     abc["$j"] /= 1.5
 
 
+function ./same_score:
+    abc["#c"] = abc["#c"] - abc["#c"]
+    abc["@e"] = abc["@e"] - abc["@e"]
+    abc["@e"] %= abc["@e"]
+    abc["#d"] = min(abc["#c"], abc["#c"])
+    abc["#e"] = max(abc["#c"], abc["#c"])
+    abc["@a"] = min(abc["@a"], abc["@a"])
+
 value = temp["#value"]
 
 if score value.scoreholder value.objective matches 100..:
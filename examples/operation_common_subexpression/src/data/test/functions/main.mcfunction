@@ -0,0 +1,48 @@
+from bolt_expressions import Scoreboard
+
+obj = Scoreboard("obj")
+
+a = obj["$a"]
+b = obj["$b"]
+c = obj["$c"]
+d = obj["$d"]
+x = obj["$x"]
+y = obj["$y"]
+
+function ./structural:
+    d = (a * b) + (a * b) % c
+
+function ./identity:
+    ab = a * b + c
+    d = ab * ab - ab
+
+function ./statements:
+    c = (x + 1) * y
+    d = (x + 1) * y - c
+
+function ./modified:
+    c = (x + 1) * y
+    x += 1
+    d = (x + 1) * y
+
+function ./unrelated:
+    c = (x + 1) * y
+    a += 1
+    d = (x + 1) * y
+
+function ./random:
+    a = obj["@r"] * 3 + obj["@r"] * 3
+    b = obj["@e[sort=random,limit=1]"] * 3
+    c = obj["@e[sort=random,limit=1]"] * 3
+
+function ./wildcard:
+    b = x * y
+    obj["*"] = 7
+    c = x * y
+
+function ./selector:
+    b = x * y
+    c = obj["@p"] * y
+    obj["@a"] = 7
+    d = x * y
+    a = obj["@p"] * y
@@ -0,0 +1,21 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+
+a, b, x = obj["#a", "#b", "#x"]
+
+function ./double:
+    a = x * 2
+    b = (x + 1) * 2
+    obj["@a"] = obj["@a"] * 2
+
+function ./negate:
+    a = x * -1
+    b = x / -1
+    a *= -1
+    b = obj["@a"] * -1
+
+function ./storage_temp:
+    storage.value = Data.cast(x * 10 + 1, "double") / 10
+    storage.small = Data.cast(x + 1, "float") / 10
@@ -0,0 +1,43 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+entity = Data.entity("@s")
+
+a, b, c, x = obj["#a", "#b", "#c", "#x"]
+
+function ./repeated:
+    a = storage.x * storage.x + storage.y
+    b = storage.x + 1
+    c = storage.x - storage.y
+
+function ./forwarding:
+    storage.x = x
+    a = storage.x + 1
+    storage.pos.y = x * 2
+    b = storage.pos.y
+    c = storage.pos.y * 3
+
+function ./aliasing:
+    a = storage.pos.y * entity.Health
+    storage.pos.z = 1
+    b = storage.pos.y * entity.Health
+    storage.pos = {y: 2}
+    entity.Air = 3
+    c = storage.pos.y * entity.Health
+
+function ./invalidation:
+    a = storage.x + 1
+    storage.x = 4
+    b = storage.x + 1
+    c = entity.Health + 1
+    say hi
+    a = entity.Health + 1
+
+function ./plain_loads:
+    a = storage.v
+    b = storage.v
+
+function ./entity_store:
+    entity.CustomTag = x
+    a = entity.CustomTag + 1
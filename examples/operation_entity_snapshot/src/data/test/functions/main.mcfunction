@@ -0,0 +1,44 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+entity = Data.entity("@s")
+nearest = Data.entity("@e[type=pig,limit=1,sort=nearest]")
+
+x, y, z, a = obj["#x", "#y", "#z", "#a"]
+
+function ./position:
+    x = entity.Pos[0]
+    y = entity.Pos[1]
+    z = entity.Pos[2]
+
+function ./different_paths:
+    x = nearest.Health
+    y = nearest.Air
+    z = nearest.Fire
+    a = nearest.Motion[1] * 100
+
+function ./two_reads:
+    x = entity.Pos[0]
+    y = entity.Pos[1]
+
+function ./entity_write:
+    x = entity.Pos[0]
+    y = entity.Pos[1]
+    entity.Motion[1] = 0
+    z = entity.Pos[2]
+    a = entity.Pos[0] + entity.Pos[2]
+
+function ./random:
+    random = Data.entity("@e[sort=random,limit=1]")
+    x = random.Health
+    y = random.Air
+    z = random.Fire
+
+function ./score_selector:
+    marked = Data.entity("@e[scores={obj=1..},limit=1]")
+    x = marked.Health
+    obj["@s"] = 0
+    y = marked.Air
+    z = marked.Fire
+    a = marked.FallDistance
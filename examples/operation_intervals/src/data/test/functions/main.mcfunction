@@ -0,0 +1,36 @@
+from bolt_expressions import Scoreboard, Data
+from nbtlib import Byte, Short
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+
+a, b, c, x = obj["#a", "#b", "#c", "#x"]
+
+function ./clamp:
+    a = max(storage.flag[Byte], -200)
+    b = min(storage.count[Short], 40000)
+    c = max(min(storage.count[Short], 100), 0)
+    x = min(storage.value, 10)
+
+function ./modulo:
+    a = (x % 10) % 20
+    b = (storage.flag[Byte] % 200) % 300
+    c = x % 10 + 5
+
+function ./conditions:
+    a = (x % 10) < 10
+    b = (x % 10) == 15
+    c = storage.flag[Byte] > 127
+
+function ./branches:
+    if (x % 10) > 20:
+        say never
+    if storage.flag[Byte] < 500:
+        say always
+    if (x % 10) > 5:
+        say sometimes
+
+function ./pruned_constant:
+    if (x % 10) > 20:
+        a = b * 37
+    c = 1
@@ -0,0 +1,61 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage("demo:main")
+
+a = obj["#a"]
+b = obj["#b"]
+c = obj["#c"]
+x = obj["#x"]
+
+function ./init:
+    a = 5
+    b = a * 2 + 1
+    c = b - a
+    a += c
+    x = (a + b) % 7
+
+function ./unknown:
+    a = 5
+    b = x + a
+    a = x
+    c = a + 1
+
+function ./raw_command:
+    a = 5
+    b = a + 1
+    scoreboard players add #a obj 1
+    c = a + 1
+
+function ./function_call:
+    a = 5
+    function test:main
+    b = a + 1
+
+function ./execute_context:
+    a = 5
+    as @e[type=pig]:
+        b = a + 1
+    c = a + 1
+
+function ./selector:
+    a = 5
+    b = 6
+    obj["@s"] = 3
+    c = a + b
+    obj["@a"] = 2
+    c = a + b
+
+function ./storage:
+    storage.x = 3
+    storage.nested.y = 4
+    a = storage.x * storage.nested.y
+    storage.nested = {}
+    b = storage.x + storage.nested.y
+    storage.x = a
+    c = storage.x
+
+function ./wildcard:
+    x = 3
+    obj["*"] = 5
+    a = x + 1
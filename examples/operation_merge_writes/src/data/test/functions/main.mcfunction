@@ -0,0 +1,49 @@
+from bolt_expressions import Scoreboard, Data
+from nbtlib import Byte, Double
+
+obj = Scoreboard("obj")
+storage = Data.storage(./temp)
+entity = Data.entity("@s")
+
+x, y = obj["#x", "#y"]
+
+function ./siblings:
+    storage.a.x = 1
+    storage.a.y = 2
+    storage.a.z = "s"
+
+function ./entity_root:
+    entity.Motion = [Double(0), Double(1), Double(0)]
+    entity.Fire = 20
+    entity.NoGravity = Byte(1)
+
+function ./mixed:
+    storage.a.x = 1
+    storage.a.s = x
+    x = 3
+    storage.a.y = 2
+    storage.a.t = y
+    storage.a.z = 3
+
+function ./nested:
+    storage.a.x = 1
+    storage.a.b = {c: 1}
+    storage.a.y = 2
+
+function ./interleaved:
+    storage.a.x = 1
+    y = storage.a.y
+    storage.a.y = 2
+    storage.b.x = 1
+    storage.a.z = 3
+
+function ./same_key:
+    storage.a.x = 1
+    storage.a.y = x
+    storage.a.y = 2
+    storage.a.z = 3
+
+function ./other_entity:
+    entity.Fire = 20
+    Data.entity("@p").Air = 3
+    entity.NoGravity = Byte(1)
@@ -0,0 +1,48 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage("demo:main")
+
+a = obj["$a"]
+b = obj["$b"]
+c = obj["$c"]
+x = obj["$x"]
+
+function ./statements:
+    a = x + 1
+    b = a * 2
+    c = a - b
+
+function ./temporaries:
+    a = (x + 1) * (x + 2)
+    b = (x + 1) * (x - 2)
+    c = a + b * 3
+
+function ./data:
+    storage.value = x * 2
+    storage.other = storage.value
+    a = storage.other
+
+function ./commands:
+    a = x + 1
+    b = a * 2
+    say separate window
+    c = a - b
+    b = c * c
+
+function ./branch:
+    a = x * 2
+    b = a + 1
+
+    if a > 10:
+        c = a - 1
+        b = c * 2
+
+    c = b + a
+
+function ./nested:
+    a = x * 3
+    as @a:
+        b = a + x
+        c = b * b
+    c += 1
@@ -0,0 +1,19 @@
+from bolt_expressions import Scoreboard, Data
+
+obj = Scoreboard("obj")
+storage = Data.storage(demo:temp)
+
+# equal sources are the same object
+say (obj["$a"] is obj["$a"])
+say (obj["$a"] is obj["$b"])
+say (storage.foo.bar is storage.foo.bar)
+say (storage.foo[int] is storage.foo[int])
+say (storage.foo[int] is storage.foo)
+say (storage.foo(scale=0.5) is storage.foo(scale=0.5))
+
+a, b = obj["$a", "$b"]
+say (a is obj["$a"])
+
+obj["$c"] = a + b
+storage.foo.bar = obj["$c"] * 2
+storage.list.append(storage.foo.bar)
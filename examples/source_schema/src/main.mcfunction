@@ -0,0 +1,19 @@
+from bolt_expressions import Data, Scoreboard
+
+Item = Data.schema("item")
+Container = Data.schema("container")
+
+obj = Scoreboard("obj")
+item = Data.storage("demo:item")[Item]
+chest = Data.block("~ ~ ~")[Container]
+
+item.Count = 1
+item.Slot = obj["@s"]
+item.tag.Damage = obj["$damage"] * 2
+item.tag.display.Lore.append("Shiny")
+
+chest.Items.append({"id": "minecraft:stone", "Count": 64})
+chest.Items[0].tag.BlockEntityTag.Items.append(item)
+chest.CustomData.power = 5
+
+obj["$count"] = chest.Items[0].Count
@@ -1,26 +1,144 @@
 __version__ = "0.19.2"
 
-from .api import *
-from .ast import *
-from .ast_converter import *
-from .exceptions import *
-from .literals import *
-from .node import *
-from .operations import *
-from .optimizer import *
-from .plugin import *
-from .sources import *
-from .utils import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .api import *
+    from .ast import *
+    from .ast_converter import *
+    from .exceptions import *
+    from .literals import *
+    from .node import *
+    from .operations import *
+    from .optimizer import *
+    from .plugin import *
+    from .schemas import *
+    from .sources import *
+    from .utils import *
 
-def __monkey_patch():
-    from nbtlib import Compound, List
 
-    def __patched_hash(self):
-        return hash(str(self))
+# Names are resolved the first time they are accessed by importing only the
+# submodule that defines them, which keeps `import bolt_expressions` and the
+# `beet_default` lookup from pulling in the optimizer, mecha and pydantic.
+SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "api": ("Scoreboard", "Objective", "Data"),
+    "ast": (
+        "RunExecuteTransformer",
+        "ConstantScoreChecker",
+        "ObjectiveChecker",
+        "SourceNBTConverter",
+    ),
+    "ast_converter": ("InvalidOperand", "CommandTemplate", "AstConverter"),
+    "exceptions": (
+        "TypeCheckError",
+        "TypeCheckDiagnostic",
+        "SchemaError",
+        "get_exception_chain",
+    ),
+    "literals": ("Literal", "convert_node"),
+    "node": (
+        "ExpressionOptions",
+        "expression_options",
+        "TempScoreManager",
+        "ConstScoreManager",
+        "InitFunction",
+        "ExpressionNode",
+        "Expression",
+        "LazyEntry",
+        "LazyStats",
+        "TempStats",
+        "AstLazyCommand",
+        "LazyEmitter",
+        "OptimizationWindow",
+        "AstWindowCommand",
+        "WindowEmitter",
+    ),
+    "operations": (
+        "ResultType",
+        "Operation",
+        "UnaryOperation",
+        "BinaryOperation",
+        "Remove",
+        "Merge",
+        "InPlaceMerge",
+        "Insert",
+        "Append",
+        "Prepend",
+        "Set",
+        "Enable",
+        "Reset",
+        "Add",
+        "Subtract",
+        "Multiply",
+        "Divide",
+        "Modulus",
+        "Min",
+        "Max",
+    ),
+    "optimizer": (
+        "Rule",
+        "SmartRule",
+        "SmartGenerator",
+        "Optimizer",
+        "CostModel",
+        "use_smart_generator",
+        "smart_generator",
+        "noncommutative_set_collapsing",
+        "commutative_set_collapsing",
+        "data_set_scaling",
+        "data_get_scaling",
+        "multiply_divide_by_fraction",
+        "multiply_divide_by_one_removal",
+        "add_subtract_by_zero_removal",
+        "algebraic_simplification",
+        "KnownValues",
+        "interval_analysis",
+        "instruction_selection",
+        "data_load_forwarding",
+        "entity_snapshot_batching",
+        "sibling_write_merging",
+        "temp_cleanup",
+        "set_to_self_removal",
+        "set_and_get_cleanup",
+        "common_subexpression_elimination",
+        "literal_to_constant_replacement",
+        "DataTargetType",
+        "IrNode",
+        "IrSource",
+        "IrScore",
+        "IrLiteral",
+        "IrOperation",
+        "IrUnary",
+        "IrBinary",
+        "is_op",
+        "is_unary",
+        "is_binary",
+    ),
+    "plugin": ("beet_default", "bolt_expressions"),
+    "schemas": ("SchemaLoader", "parse_schema"),
+    "sources": ("Source", "ScoreSource", "DataSource", "parse_compound"),
+    "utils": (
+        "type_name",
+        "identifier_generator",
+        "patch_nbt_hash",
+        "get_globals",
+        "assert_exception",
+    ),
+}
 
-    Compound.__hash__ = __patched_hash
-    List.__hash__ = __patched_hash
+EXPORTS = {
+    name: module for module, names in SUBMODULE_EXPORTS.items() for name in names
+}
 
+__all__ = list(EXPORTS)
 
-__monkey_patch()
+
+def __getattr__(name: str) -> Any:
+    if (module := EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+
+    return value
@@ -1,3 +1,4 @@
+import re
 from dataclasses import dataclass, field
 from typing import Any, overload
 
@@ -5,6 +6,7 @@ from beet import Context
 from bolt.utils import internal
 
 from .node import Expression
+from .schemas import SchemaLoader
 from .sources import (
     DataSource,
     ScoreSource,
@@ -19,6 +21,9 @@ __all__ = [
 ]
 
 
+CONSTANT_PATTERN = re.compile(r"^[$#]([-+]?\d+)\b")
+
+
 class Scoreboard:
     """API for manipulating scoreboards.
 
@@ -38,9 +43,7 @@ class Scoreboard:
 
     expr: Expression
 
-    constants: set[int]
     objectives: set[str]
-    added_objectives: set[str]
 
     def __init__(self, ctx: Context | Expression):
         if isinstance(ctx, Context):
@@ -50,26 +53,29 @@ class Scoreboard:
 
         opts = self.expr.opts
 
-        self.constants = set()
         self.objectives = {opts.const_objective, opts.temp_objective}
-        self.added_objectives = set()
 
     def add_objective(self, name: str, criteria: str = "dummy"):
-        if name not in self.added_objectives:
-            self.added_objectives.add(name)
+        self.expr.init_function.add_objective(name, criteria)
+
+    def add_constant(self, value: int, count: int = 1):
+        self.expr.init_function.reference_constant(value, count)
 
-            self.expr.init_commands.insert(
-                0, f"scoreboard objectives add {name} {criteria}"
-            )
+    def register_score(self, holder: str, obj: str, count: int = 1):
+        """Add the objective and constant used by an emitted score, if any.
 
-    def add_constant(self, value: int):
-        holder, obj = self.expr.const_score(value)
+        Objectives stay registered when the references are released with a
+        negative count.
+        """
+        if obj not in self.objectives:
+            return
+
+        self.add_objective(obj)
 
-        if value not in self.constants:
-            self.constants.add(value)
-            self.expr.init_commands.append(
-                f"scoreboard players set {holder} {obj} {value}"
-            )
+        if obj == self.expr.opts.const_objective and (
+            match := CONSTANT_PATTERN.match(holder)
+        ):
+            self.add_constant(int(match.group(1)), count)
 
     def objective(
         self, name: str, criteria: str | None = None, prefixed: bool = True
@@ -89,7 +95,7 @@ class Scoreboard:
     __call__ = objective
 
     def score(self, scoreholder: str, objective: str) -> ScoreSource:
-        return ScoreSource(scoreholder, objective, ctx=self.expr)
+        return ScoreSource.create(scoreholder, objective, ctx=self.expr)
 
 
 @dataclass
@@ -107,10 +113,11 @@ class Objective:
         self, scoreholder: str | tuple[str, ...]
     ) -> ScoreSource | tuple[ScoreSource, ...]:
         if isinstance(scoreholder, str):
-            return ScoreSource(scoreholder, self.name, ctx=self.ctx)
+            return ScoreSource.create(scoreholder, self.name, ctx=self.ctx)
 
         return tuple(
-            ScoreSource(holder, self.name, ctx=self.ctx) for holder in scoreholder
+            ScoreSource.create(holder, self.name, ctx=self.ctx)
+            for holder in scoreholder
         )
 
     @internal
@@ -139,13 +146,17 @@ class Data:
         ...
 
     def storage(self, resource_location: str):
-        return DataSource("storage", resource_location, ctx=self.expr)
+        return DataSource.create("storage", resource_location, ctx=self.expr)
 
     def entity(self, entity: str):
-        return DataSource("entity", entity, ctx=self.expr)
+        return DataSource.create("entity", entity, ctx=self.expr)
 
     def block(self, position: str):
-        return DataSource("block", position, ctx=self.expr)
+        return DataSource.create("block", position, ctx=self.expr)
+
+    def schema(self, name: str) -> NbtType:
+        "Return the nbt type defined by the schema file `name`."
+        return self.expr.ctx.inject(SchemaLoader)[name]
 
     def dummy(self, type: NbtType | str = Any):
         "Create a dummy data source in a storage."
@@ -154,7 +165,7 @@ class Data:
             type = literal_types[type]
 
         target_type, target, path = self.expr.temp_data()
-        return DataSource(target_type, target, path, ctx=self.expr)[type]
+        return DataSource.create(target_type, target, path, ctx=self.expr)[type]
 
     def cast(self, value: Any, nbt_type: Any = Any):
         if isinstance(nbt_type, str):
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from functools import cached_property
+from itertools import pairwise
 from typing import Any, Callable, Iterable, cast
 
 from beet.core.utils import required_field
@@ -40,28 +40,20 @@ class ConstantScoreChecker(Reducer):
     callback: Callable[[int], None] = required_field()
     pattern: re.Pattern[str] = re.compile(r"^[$#]([-+]?\d+)\b")
 
-    @cached_property
-    def objective_node(self):
-        return AstObjective(value=self.objective)
-
     @rule(AstCommand)
     def command(self, node: AstCommand):
-        if self.objective_node not in node.arguments:
-            return
-
-        i = node.arguments.index(self.objective_node)
-        name = node.arguments[i - 1]
-
-        if not isinstance(name, AstPlayerName):
-            return
-
-        match = self.pattern.match(name.value)
-
-        if not match:
-            return
-
-        value = int(match.group(1))
-        self.callback(value)
+        arguments = node.arguments
+
+        for name, objective in pairwise(arguments):
+            if not (
+                isinstance(objective, AstObjective)
+                and objective.value == self.objective
+                and isinstance(name, AstPlayerName)
+            ):
+                continue
+
+            if match := self.pattern.match(name.value):
+                self.callback(int(match.group(1)))
 
 
 @dataclass
@@ -1,7 +1,17 @@
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass, field, replace
 from typing import Any, Generator, Iterable, cast
 
-from mecha import AstChildren, AstCommand, AstRoot, Mecha, Visitor, rule
+from mecha import (
+    AstChildren,
+    AstCommand,
+    AstNode,
+    AstRoot,
+    DiagnosticError,
+    Mecha,
+    Visitor,
+    rule,
+)
 from mecha.utils import number_to_string
 from nbtlib import Byte, Double, Float, Int, Long, Short  # type: ignore
 
@@ -20,6 +30,7 @@ from .optimizer import (
     IrNode,
     IrOperation,
     IrRaw,
+    IrRawBlock,
     IrScore,
     IrSet,
     IrSource,
@@ -37,32 +48,93 @@ from .utils import insert_nested_commands, type_name
 
 __all__ = [
     "InvalidOperand",
+    "CommandTemplate",
     "AstConverter",
 ]
 
 
+HOLE_REGEX = re.compile("\x00(\\d+)\x00")
+TEMPLATE_CACHE_SIZE = 4096
+
+HolePath = tuple[int, ...]
+
+
 class InvalidOperand(Exception):
     def __init__(self, op: str, *operands: Any):
         fmt = ", ".join(f"'{type_name(operand)}'" for operand in operands)
         super().__init__(f"Invalid operand(s) for '{op}' operation: {fmt}.")
 
 
+@dataclass(frozen=True, slots=True)
+class CommandTemplate:
+    """Parsed command whose score and data operands are holes.
+
+    `holes` maps the path of an argument node to the operand filling it and the
+    index of the node among the operand's argument nodes.
+    """
+
+    node: AstCommand
+    holes: dict[HolePath, tuple[int, int]]
+    branches: frozenset[HolePath]
+
+    def fill(self, fragments: list[tuple[AstNode, ...]]) -> AstCommand:
+        return self.substitute(self.node, (), fragments)
+
+    def substitute(
+        self, node: AstCommand, path: HolePath, fragments: list[tuple[AstNode, ...]]
+    ) -> AstCommand:
+        arguments: list[AstNode] = []
+
+        for i, argument in enumerate(node.arguments):
+            argument_path = (*path, i)
+
+            if hole := self.holes.get(argument_path):
+                operand, index = hole
+                argument = fragments[operand][index]
+            elif argument_path in self.branches:
+                argument = self.substitute(
+                    cast(AstCommand, argument), argument_path, fragments
+                )
+
+            arguments.append(argument)
+
+        return replace(node, arguments=AstChildren(arguments))
+
+
 @dataclass(kw_only=True)
 class AstConverter(Visitor):
+    """Converts ir operations to commands.
+
+    Rules format commands as strings where score and data operands are holes.
+    Each distinct command shape is parsed once into a `CommandTemplate`, later
+    commands with the same shape are built by filling the template with the
+    argument nodes of their operands, which are parsed once per operand. Both
+    caches are cleared once they reach `TEMPLATE_CACHE_SIZE` entries since
+    literals are part of the command shape.
+    """
+
     default_nbt_type: NbtTypeString
 
     mc: Mecha
     result: list[AstCommand] = field(default_factory=list)
 
+    operands: list[IrScore | IrData] = field(default_factory=list)
+    scores: dict[tuple[str, str], None] = field(default_factory=dict)
+    templates: dict[Any, CommandTemplate | None] = field(default_factory=dict)
+    fragments: dict[str, tuple[AstNode, ...] | None] = field(default_factory=dict)
+
     def __call__(self, nodes: Iterable[IrOperation]) -> AstChildren[AstCommand]:  # type: ignore
         prev_result = self.result
+        prev_operands = self.operands
         self.result = []
+        self.operands = []
 
         for node in nodes:
             self.invoke(node)
 
         result = AstChildren(self.result)
         self.result = prev_result
+        self.operands = prev_operands
         return result
 
     def add_result(
@@ -75,13 +147,161 @@ class AstConverter(Visitor):
             prefix = tuple(self.invoke(s) for s in store)
             cmd = " ".join((*prefix, cmd))
 
-        node = self.mc.parse(cmd, using="command")
+        node = self.build_command(cmd)
 
         if children:
             node = insert_nested_commands(node, AstRoot(commands=children))
 
         self.result.append(node)
 
+    def hole(self, node: IrScore | IrData) -> str:
+        if isinstance(node, IrScore):
+            self.scores.setdefault((node.holder, node.obj))
+
+        self.operands.append(node)
+        return f"\x00{len(self.operands) - 1}\x00"
+
+    def operand_text(self, node: IrScore | IrData) -> str:
+        if isinstance(node, IrScore):
+            return f"{node.holder} {node.obj}"
+        if not len(node.path):
+            return f"{node.type} {node.target}"
+        return f"{node.type} {node.target} {node.path}"
+
+    def build_command(self, cmd: str) -> AstCommand:
+        operands = self.operands
+        self.operands = []
+
+        key = (
+            cmd,
+            tuple(
+                "score"
+                if isinstance(operand, IrScore)
+                else (operand.type, bool(len(operand.path)))
+                for operand in operands
+            ),
+        )
+
+        if template := self.templates.get(key):
+            fragments = [self.fragment(operand) for operand in operands]
+            if None not in fragments:
+                return template.fill(cast(list[tuple[AstNode, ...]], fragments))
+
+        spans: list[tuple[int, int, int]] = []
+        text: list[str] = []
+        length = 0
+        last = 0
+
+        for match in HOLE_REGEX.finditer(cmd):
+            operand = int(match[1])
+            value = self.operand_text(operands[operand])
+
+            text.append(cmd[last : match.start()])
+            length += match.start() - last
+            spans.append((operand, length, length + len(value)))
+            text.append(value)
+            length += len(value)
+            last = match.end()
+
+        text.append(cmd[last:])
+        node = self.mc.parse("".join(text), using="command")
+
+        if key not in self.templates:
+            if len(self.templates) >= TEMPLATE_CACHE_SIZE:
+                self.templates.clear()
+            self.templates[key] = self.create_template(node, operands, spans)
+
+        return node
+
+    def fragment(self, node: IrScore | IrData) -> tuple[AstNode, ...] | None:
+        """Return the argument nodes of a score or data operand."""
+
+        text = self.operand_text(node)
+
+        if isinstance(node, IrScore):
+            cmd = f"scoreboard players reset {text}"
+        elif len(node.path):
+            cmd = f"execute if data {text}"
+        else:
+            cmd = f"data get {text}"
+
+        if cmd in self.fragments:
+            return self.fragments[cmd]
+
+        try:
+            parsed: AstCommand = self.mc.parse(cmd, using="command")
+        except DiagnosticError:
+            fragment = None
+        else:
+            if parsed.identifier == "execute:subcommand":
+                parsed = cast(AstCommand, parsed.arguments[0])
+            fragment = tuple(parsed.arguments)
+
+        if len(self.fragments) >= TEMPLATE_CACHE_SIZE:
+            self.fragments.clear()
+        self.fragments[cmd] = fragment
+        return fragment
+
+    def create_template(
+        self,
+        node: AstCommand,
+        operands: list[IrScore | IrData],
+        spans: list[tuple[int, int, int]],
+    ) -> CommandTemplate | None:
+        fragments = [self.fragment(operand) for operand in operands]
+        matched = [0] * len(spans)
+        holes: dict[HolePath, tuple[int, int]] = {}
+        branches: set[HolePath] = set()
+        valid = True
+
+        def visit(command: AstCommand, path: HolePath) -> bool:
+            nonlocal valid
+            found = False
+
+            for i, argument in enumerate(command.arguments):
+                argument_path = (*path, i)
+                pos = argument.location.pos
+
+                for span_index, (operand, start, end) in enumerate(spans):
+                    if not start <= pos < end:
+                        continue
+
+                    fragment = fragments[operand]
+                    index = matched[span_index]
+
+                    if (
+                        fragment is None
+                        or index >= len(fragment)
+                        or fragment[index] != argument
+                    ):
+                        valid = False
+                    else:
+                        holes[argument_path] = (operand, index)
+
+                    matched[span_index] += 1
+                    found = True
+                    break
+                else:
+                    if isinstance(argument, AstCommand) and visit(
+                        argument, argument_path
+                    ):
+                        branches.add(argument_path)
+                        found = True
+
+            return found
+
+        visit(node, ())
+
+        for (operand, _, _), count in zip(spans, matched, strict=True):
+            fragment = fragments[operand]
+            if fragment is None or count != len(fragment):
+                valid = False
+
+        if not valid:
+            return None
+
+        return CommandTemplate(node, holes, frozenset(branches))
+
     @rule(IrNode)
     def fallback(self, node: IrNode):
         raise TypeError(f"Could not convert object '{node}' to AST.")
@@ -90,15 +310,17 @@ class AstConverter(Visitor):
     def raw(self, node: IrRaw[AstCommand]):
         self.result.append(node.node)
 
+    @rule(IrRawBlock)
+    def raw_block(self, node: IrRawBlock[AstCommand]):
+        self.result.extend(node.commands)
+
     @rule(IrScore)
     def score(self, node: IrScore) -> str:
-        return f"{node.holder} {node.obj}"
+        return self.hole(node)
 
     @rule(IrData)
     def data(self, node: IrData) -> str:
-        if not len(node.path):
-            return f"{node.type} {node.target}"
-        return f"{node.type} {node.target} {node.path}"
+        return self.hole(node)
 
     @rule(IrLiteral)
     def literal(self, node: IrLiteral) -> str:
@@ -230,6 +452,10 @@ class AstConverter(Visitor):
 
     @rule(IrBranch)
     def branch(self, node: IrBranch) -> Generator[IrNode, str, None]:
+        if isinstance(node.target, IrLiteral):
+            self.result.extend(self(node.children))
+            return
+
         target = yield node.target
 
         match node.target:
@@ -17,18 +17,21 @@ from nbtlib import (  # type: ignore
 
 from .optimizer import IrBinary, IrCast, IrData, IrLiteral, IrOperation
 from .typing import (
+    AnySchema,
+    ArraySchema,
+    CompoundSchema,
+    FixedCompoundSchema,
+    ListSchema,
+    NbtSchema,
     NbtType,
     NbtValue,
     NumericNbtValue,
+    NumericSchema,
+    StringSchema,
+    UnionSchema,
     access_type,
+    compile_schema,
     convert_tag,
-    is_array_type,
-    is_compound_type,
-    is_list_type,
-    is_numeric_type,
-    is_string_type,
-    is_union,
-    unwrap_optional_type,
 )
 
 __all__ = [
@@ -36,16 +39,23 @@ __all__ = [
 ]
 
 
+CAST_CACHE_SIZE = 4096
+
+cast_cache: dict[tuple[NbtSchema, type, str], NbtValue | None] = {}
+
+
 def cast_dict(
-    nbt_type: NbtType, value: dict[Any, Any], ctx: Context | None = None
+    nbt_type: NbtType | NbtSchema, value: dict[Any, Any], ctx: Context | None = None
 ) -> Compound | None:
-    if not is_compound_type(nbt_type):
+    schema = compile_schema(nbt_type, ctx)
+
+    if not isinstance(schema, (CompoundSchema, FixedCompoundSchema)):
         return None
 
     result: dict[Any, Any] = {}
 
     for key, val in value.items():
-        key_type = access_type(nbt_type, NamedKey(key), ctx)
+        key_type = schema.access(NamedKey(key))
 
         if not key_type:
             result[key] = val
@@ -59,20 +69,21 @@ def cast_dict(
 
 
 def cast_list(
-    nbt_type: NbtType, value: list[Any] | Array, ctx: Context | None = None
+    nbt_type: NbtType | NbtSchema, value: list[Any] | Array, ctx: Context | None = None
 ) -> List | Array | None:
-    if is_list_type(nbt_type):
+    schema = compile_schema(nbt_type, ctx)
+
+    if isinstance(schema, ArraySchema):
+        cast_type = schema.type
+    elif isinstance(schema, ListSchema):
         cast_type = List
-    elif is_array_type(nbt_type):
-        cast_type = nbt_type
     else:
         return None
 
+    el_type = schema.element
     result: list[Any] = []
 
-    for i, element in enumerate(value):
-        el_type = access_type(nbt_type, ListIndex(i))
-
+    for element in value:
         if el_type is None:
             return None
 
@@ -86,40 +97,71 @@ def cast_list(
     return cast_type(result)
 
 
-def cast_numeric(nbt_type: NbtType, value: int | float) -> NumericNbtValue | None:
-    if not is_numeric_type(nbt_type):
+def cast_numeric(
+    nbt_type: NbtType | NbtSchema, value: int | float
+) -> NumericNbtValue | None:
+    schema = compile_schema(nbt_type)
+
+    if not isinstance(schema, NumericSchema):
         return None
 
     with suppress(OutOfRange):
-        return nbt_type(value)
+        return schema.type(value)
 
 
-def cast_string(nbt_type: NbtType, value: str) -> String | None:
-    if is_string_type(nbt_type):
+def cast_string(nbt_type: NbtType | NbtSchema, value: str) -> String | None:
+    if isinstance(compile_schema(nbt_type), StringSchema):
         return String(value)
 
     return None
 
 
 def cast_value(
-    nbt_type: NbtType, value: NbtValue | Any, ctx: Context | None = None
+    nbt_type: NbtType | NbtSchema, value: NbtValue | Any, ctx: Context | None = None
+) -> NbtValue | None:
+    schema = compile_schema(nbt_type, ctx)
+
+    # scalar literals are immutable, their casts can be shared. the repr tells
+    # apart values that compare equal, like -0.0 and 0.0
+    if isinstance(value, (int, float, str)):
+        key = (schema, type(value), repr(value))
+
+        try:
+            return cast_cache[key]
+        except KeyError:
+            pass
+
+        result = cast_schema(schema, value, ctx)
+
+        if len(cast_cache) >= CAST_CACHE_SIZE:
+            cast_cache.clear()
+        cast_cache[key] = result
+
+        return result
+
+    return cast_schema(schema, value, ctx)
+
+
+def cast_schema(
+    schema: NbtSchema, value: NbtValue | Any, ctx: Context | None = None
 ) -> NbtValue | None:
-    nbt_type = unwrap_optional_type(nbt_type)
+    if isinstance(schema, UnionSchema) and schema.optional:
+        schema = compile_schema(schema.required, ctx)
 
-    if nbt_type in (Any, None, NoneType) or is_union(nbt_type):
+    if isinstance(schema, (AnySchema, UnionSchema)) or schema.type in (None, NoneType):
         return convert_tag(value)
 
     if isinstance(value, dict):
-        return cast_dict(nbt_type, value, ctx)
+        return cast_dict(schema, value, ctx)
 
     if isinstance(value, list):
-        return cast_list(nbt_type, value, ctx)
+        return cast_list(schema, value, ctx)
 
     if isinstance(value, (int, float)):
-        return cast_numeric(nbt_type, value)
+        return cast_numeric(schema, value)
 
     if isinstance(value, str):
-        return cast_string(nbt_type, value)
+        return cast_string(schema, value)
 
     return convert_tag(value)
 
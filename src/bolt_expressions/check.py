@@ -4,25 +4,13 @@ from typing import (
     Any,
     Iterable,
     TypedDict,
-    get_args,
-    get_type_hints,
+    cast,
 )
 
 from beet import Context
 from bolt.utils import internal
 from mecha import Visitor, rule
-from nbtlib import (
-    Array,
-    Byte,
-    Double,
-    Float,
-    Int,
-    ListIndex,
-    Long,
-    NamedKey,
-    Numeric,
-    Short,
-)  # type: ignore
+from nbtlib import Array, Int, ListIndex  # type: ignore
 
 from .exceptions import TypeCheckDiagnostic, TypeCheckError, get_exception_chain
 from .optimizer import (
@@ -35,26 +23,23 @@ from .optimizer import (
     IrSource,
 )
 from .typing import (
+    AnySchema,
+    CompoundSchema,
+    FixedCompoundSchema,
+    ListSchema,
+    NbtSchema,
     NbtType,
     NumericNbtValue,
+    NumericSchema,
+    UnionSchema,
     access_type,
+    compile_schema,
     convert_type,
     format_type,
-    get_dict_fields,
     infer_type,
     is_alias,
-    is_array_type,
-    is_compound_alias,
-    is_fixed_compound,
-    is_list_type,
-    is_numeric_type,
-    is_optional,
     is_type,
-    is_typeddict_guard,
-    is_union,
-    unwrap_optional_type,
 )
-from .utils import get_globals
 
 __all__ = [
     "TypeCheckFlags",
@@ -64,11 +49,14 @@ __all__ = [
     "check_list_type",
     "check_numeric_type",
     "check_type",
+    "match_type",
     "TypeChecker",
 ]
 
 
-NUMERIC_ORDER = (Byte, Short, Int, Long, Float, Double)
+MATCH_CACHE_SIZE = 4096
+
+match_cache: dict[tuple[NbtSchema, NbtSchema, bool | None, bool], bool] = {}
 
 
 class TypeCheckFlags(TypedDict, total=False):
@@ -78,18 +66,21 @@ class TypeCheckFlags(TypedDict, total=False):
 
 
 def check_union_type(
-    write: NbtType,
-    read: NbtType,
+    write: NbtType | NbtSchema,
+    read: NbtType | NbtSchema,
     ctx: Context | None = None,
     **flags: Any,
 ) -> bool:
-    if is_union(read):
-        return all(check_type(write, r, ctx, **flags) for r in get_args(read))
+    write = compile_schema(write, ctx)
+    read = compile_schema(read, ctx)
+
+    if isinstance(read, UnionSchema):
+        return all(check_type(write, r, ctx, **flags) for r in read.members)
 
-    if is_union(write):
+    if isinstance(write, UnionSchema):
         flags = {**flags, "suppress": True}
 
-        if not any(check_type(w, read, ctx, **flags) for w in get_args(write)):
+        if not any(check_type(w, read, ctx, **flags) for w in write.members):
             raise TypeCheckError(
                 f'"{format_type(read)}" is not compatible with "{format_type(write)}".'
             )
@@ -100,12 +91,15 @@ def check_union_type(
 
 
 def check_typeddict_type(
-    write: type[TypedDict],
-    read: NbtType,
+    write: type[TypedDict] | NbtSchema,
+    read: NbtType | NbtSchema,
     ctx: Context | None = None,
     **flags: Any,
 ) -> bool:
-    if not is_fixed_compound(read):
+    write = cast(FixedCompoundSchema, compile_schema(write, ctx))
+    read = compile_schema(read, ctx)
+
+    if not isinstance(read, FixedCompoundSchema):
         raise TypeCheckError(
             f'"{format_type(read)}" is not a compound type with fixed keys and is not compatible with "{format_type(write)}".'
         )
@@ -115,17 +109,12 @@ def check_typeddict_type(
 
     new_flags = {"numeric_match": True, **flags, "ignore_missing_keys": False}
 
-    write_annotations = get_dict_fields(write, ctx)
-    read_annotations = get_dict_fields(read, ctx)
-
-    opt_keys = set(write.__optional_keys__)
-    opt_keys.update(
-        name for name, type in write_annotations.items() if is_optional(type)
-    )
+    write_annotations = write.fields
+    read_annotations = read.fields
 
     for key, key_type in write_annotations.items():
         if key not in read_annotations:
-            if key in opt_keys or flags.get("ignore_missing_keys"):
+            if key in write.optional_keys or flags.get("ignore_missing_keys"):
                 continue
 
             raise TypeCheckError(
@@ -153,35 +142,29 @@ def check_typeddict_type(
 
 
 def check_expandable_compound_type(
-    write: type[dict[str, Any]],
-    read: NbtType,
+    write: type[dict[str, Any]] | NbtSchema,
+    read: NbtType | NbtSchema,
     ctx: Context | None = None,
     **flags: Any,
 ) -> bool:
-    flags = {"numeric_match": True, **flags, "ignore_missing_keys": False}
+    write = cast(CompoundSchema, compile_schema(write, ctx))
+    read = compile_schema(read, ctx)
 
-    child_type = access_type(write, NamedKey(""))
+    flags = {"numeric_match": True, **flags, "ignore_missing_keys": False}
 
-    if is_alias(read, dict):
-        read_child_type = access_type(read, NamedKey(""))
+    child_type = write.value
 
+    if isinstance(read, CompoundSchema) and is_alias(read.type, dict):
         try:
-            return check_type(child_type, read_child_type, ctx, **flags)
+            return check_type(child_type, read.value, ctx, **flags)
         except TypeCheckError as cause_exc:
             exc = TypeCheckError(
                 f'"{format_type(read)}" and "{format_type(write)}" have incompatible key types:'
             )
             raise exc from cause_exc
 
-    if is_fixed_compound(read):
-        if isinstance(read, dict):
-            read_annotations = read
-        else:
-            read_annotations = get_type_hints(read, get_globals(read, ctx))
-
-        for key, type in read_annotations.items():
-            type = unwrap_optional_type(type)
-
+    if isinstance(read, FixedCompoundSchema):
+        for key, type in read.required_types.items():
             try:
                 if not check_type(child_type, type, ctx, **flags):
                     return False
@@ -199,15 +182,18 @@ def check_expandable_compound_type(
 
 
 def check_list_type(
-    write: type[list[Any] | Array],
-    read: NbtType,
+    write: type[list[Any] | Array] | NbtSchema,
+    read: NbtType | NbtSchema,
     ctx: Context | None = None,
     **flags: Any,
 ) -> bool:
+    write = compile_schema(write, ctx)
+    read = compile_schema(read, ctx)
+
     flags = {**flags, "numeric_match": True, "ignore_missing_keys": False}
 
-    subtype = access_type(write, ListIndex(None))
-    read_subtype = access_type(read, ListIndex(None))
+    subtype = write.access(ListIndex(None))
+    read_subtype = read.access(ListIndex(None))
 
     if read_subtype is None:
         raise TypeCheckError(
@@ -223,23 +209,25 @@ def check_list_type(
         raise exc from cause_exc
 
 
-def check_numeric_type(write: type[NumericNbtValue], read: Any, **flags: Any) -> bool:
-    if not issubclass(read, Numeric):
+def check_numeric_type(
+    write: type[NumericNbtValue] | NbtSchema, read: Any, **flags: Any
+) -> bool:
+    write = cast(NumericSchema, compile_schema(write))
+    read = compile_schema(read)
+
+    if not isinstance(read, NumericSchema) or read.order is None or write.order is None:
         raise TypeCheckError(
             f'"{format_type(read)}" is not a numeric type and is not compatible with "{format_type(write)}".'
         )
 
     numeric_match = flags.get("numeric_match", False)
 
-    write_order = NUMERIC_ORDER.index(write)
-    read_order = NUMERIC_ORDER.index(read)
-
-    if numeric_match and write_order < read_order:
+    if numeric_match and write.order < read.order:
         raise TypeCheckError(
             f'"{format_type(read)}" cannot be implicitly narrowed to "{format_type(write)}".'
         )
 
-    if numeric_match and read_order < write_order:
+    if numeric_match and read.order < write.order:
         raise TypeCheckError(
             f'"{format_type(read)}" cannot be implicitly converted to "{format_type(write)}".'
         )
@@ -248,8 +236,8 @@ def check_numeric_type(write: type[NumericNbtValue], read: Any, **flags: Any) ->
 
 
 def check_type(
-    write: NbtType | None,
-    read: NbtType,
+    write: NbtType | NbtSchema | None,
+    read: NbtType | NbtSchema,
     ctx: Context | None = None,
     **flags: Any,
 ) -> bool:
@@ -261,28 +249,31 @@ def check_type(
     result = False
 
     with context:
-        if write is None:
+        write = compile_schema(write, ctx)
+        read = compile_schema(read, ctx)
+
+        if write.type is None:
             return False
 
-        if write is Any or read is Any:
+        if isinstance(write, AnySchema) or isinstance(read, AnySchema):
             return True
 
-        if is_union(write) or is_union(read):
+        if isinstance(write, UnionSchema) or isinstance(read, UnionSchema):
             return check_union_type(write, read, ctx, **flags)
 
-        if is_typeddict_guard(write):
+        if isinstance(write, FixedCompoundSchema):
             return check_typeddict_type(write, read, ctx, **flags)
 
-        if is_compound_alias(write):
+        if isinstance(write, CompoundSchema):
             return check_expandable_compound_type(write, read, ctx, **flags)
 
-        if is_list_type(write) or is_array_type(write):
+        if isinstance(write, ListSchema):
             return check_list_type(write, read, ctx, **flags)
 
-        if is_numeric_type(write):
+        if isinstance(write, NumericSchema):
             return check_numeric_type(write, read, **flags)
 
-        if convert_type(write) != convert_type(read):
+        if convert_type(write.type) != convert_type(read.type):
             raise TypeCheckError(
                 f'"{format_type(read)}" does not match "{format_type(write)}".'
             )
@@ -292,6 +283,37 @@ def check_type(
     return result
 
 
+def match_type(
+    write: NbtType | NbtSchema | None,
+    read: NbtType | NbtSchema,
+    ctx: Context | None = None,
+    **flags: Any,
+) -> bool:
+    """Returns whether `check_type` accepts the types, without raising.
+
+    Results are memoized per schema pair and flags, so the common case where the
+    types are compatible only walks the schemas once.
+    """
+
+    write = compile_schema(write, ctx)
+    read = compile_schema(read, ctx)
+
+    numeric_match: bool | None = flags.get("numeric_match")
+    ignore_missing_keys: bool = flags.get("ignore_missing_keys", False)
+    key = (write, read, numeric_match, ignore_missing_keys)
+
+    if (result := match_cache.get(key)) is not None:
+        return result
+
+    result = check_type(write, read, ctx, **{**flags, "suppress": True})
+
+    if len(match_cache) >= MATCH_CACHE_SIZE:
+        match_cache.clear()
+    match_cache[key] = result
+
+    return result
+
+
 @dataclass(eq=False, kw_only=True)
 class TypeChecker(Visitor):
     ctx: Context | None
@@ -336,6 +358,9 @@ class TypeChecker(Visitor):
         # it fails only if a literal failed to be casted to the right type.
         flags = {"numeric_match": isinstance(latter, IrLiteral), **flags}
 
+        if match_type(write, read, self.ctx, **flags):
+            return True, errors
+
         try:
             match = check_type(write, read, self.ctx, **flags)
         except TypeCheckError as exc:
@@ -1,13 +1,16 @@
-from dataclasses import dataclass, replace
-from typing import Any, Iterable, Tuple
+import json
+from dataclasses import dataclass, field, replace
+from hashlib import sha1
+from typing import Any, Iterable, NamedTuple
 
-from beet import Context
+from beet import Cache, Context
 from beet.core.utils import required_field
 from bolt import InterpolationParser, Runtime
 from bolt.utils import internal
 from mecha import (
     AstChildren,
     AstCommand,
+    AstNbtPath,
     AstNode,
     CommandPrototype,
     CommandSpec,
@@ -16,6 +19,7 @@ from mecha import (
     MutatingReducer,
     rule,
 )
+from mecha import __version__ as mecha_version
 from mecha.contrib.implicit_execute import ImplicitExecuteParser
 from tokenstream import set_location
 
@@ -23,6 +27,19 @@ from bolt_expressions.node import Expression
 from bolt_expressions.sources import DataSource, ScoreSource, Source
 
 DEFAULT_PREFIX = "var"
+TREE_DELTA_FORMAT = 1
+
+
+class TreeBranch(NamedTuple):
+    """Source branch inserted under `parent`, mirroring the tree node at `node`."""
+
+    parent: tuple[str, ...]
+    node: tuple[str, ...]
+    prefix: str
+    name: str
+
+
+tree_deltas: dict[str, list[TreeBranch]] = {}
 
 
 def beet_default(ctx: Context):
@@ -37,16 +54,60 @@ def commands(ctx: Context):
         "source"
     )
 
-    runtime.helpers["interpolate_source"] = SourceConverter(ctx=ctx)
+    converter = SourceConverter(ctx=ctx)
+    runtime.helpers["interpolate_source"] = converter
 
-    mc.transform.extend(SourceTransformer(mc=mc))
+    prototypes = update_tree(mc.spec, ctx.cache["bolt_expressions"])
 
-    prototypes = update_tree(mc.spec)
+    mc.transform.extend(
+        SourceTransformer(mc=mc, converter=converter, prototypes=prototypes)
+    )
 
     update_implicit_execute(mc.spec, prototypes)
 
 
-def update_tree(spec: CommandSpec):
+def update_tree(spec: CommandSpec, cache: Cache | None = None) -> set[str]:
+    """Add the `var` source branches to the command tree.
+
+    The inserted branches only depend on the original tree, so they are
+    computed once and reused across builds, in memory and through the cache.
+    """
+    key = get_tree_key(spec)
+    path = cache.get_path(f"tree-{TREE_DELTA_FORMAT}-{key}.json") if cache else None
+
+    branches = tree_deltas.get(key)
+
+    if branches is None and path and path.is_file():
+        branches = [
+            TreeBranch(tuple(parent), tuple(node), prefix, name)
+            for parent, node, prefix, name in json.loads(path.read_text("utf-8"))
+        ]
+
+    if branches is None:
+        branches = get_tree_branches(spec)
+
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(branches), "utf-8")
+
+    tree_deltas[key] = branches
+
+    for branch in branches:
+        apply_tree_branch(spec.tree, branch)
+
+    previous = set(spec.prototypes)
+
+    spec.update()
+
+    return set(spec.prototypes) - previous
+
+
+def get_tree_key(spec: CommandSpec) -> str:
+    content = "\n".join((mecha_version, *spec.prototypes))
+    return sha1(content.encode()).hexdigest()
+
+
+def get_tree_branches(spec: CommandSpec) -> list[TreeBranch]:
     tree = spec.tree
 
     data_targets = (
@@ -55,22 +116,21 @@ def update_tree(spec: CommandSpec):
         "minecraft:resource_location",
     )
 
-    commands = spec.prototypes.keys()
+    branches: list[TreeBranch] = []
+    prefixed: set[tuple[str, ...]] = set()
 
-    for command in commands:
+    for command in spec.prototypes:
         parsers = get_parsers(tree, command)
-        scope = command.split(":")
+        scope = tuple(command.split(":"))
 
         count = 0
 
         for i in range(0, len(parsers)):
             match parsers[: i + 1]:
                 case [*_, "minecraft:score_holder", "minecraft:objective"]:
-                    parent = tree.get(scope[: i - 1])
-                    last_node = tree.get(scope[: i + 1])
+                    parent_scope = scope[: i - 1]
                 case [*_, None, target, "minecraft:nbt_path"] if target in data_targets:
-                    parent = tree.get(scope[: i - 2])
-                    last_node = tree.get(scope[: i + 1])
+                    parent_scope = scope[: i - 2]
                 case _:
                     continue
 
@@ -78,27 +138,36 @@ def update_tree(spec: CommandSpec):
             name = f"sourceValue{count}"
             count += 1
 
-            if prefix in parent.children:
+            if parent_scope in prefixed or prefix in tree.get(parent_scope).children:
                 continue
 
-            children = last_node.children
+            prefixed.add(parent_scope)
+            branches.append(TreeBranch(parent_scope, scope[: i + 1], prefix, name))
 
-            end = CommandTree(
-                type="argument",
-                parser="bolt_expressions:source",
-                properties={"prefix": prefix},
-                redirect=last_node.redirect,
-                executable=last_node.executable,
-                subcommand=last_node.subcommand,
-                children=None if children is None else dict(children),
-            )
-            parent.children[prefix] = CommandTree(type="literal", children={name: end})
+    return branches
 
-    previous = set(spec.prototypes)
 
-    spec.update()
+def apply_tree_branch(tree: CommandTree, branch: TreeBranch):
+    parent = tree.get(branch.parent)
+    last_node = tree.get(branch.node)
 
-    return set(spec.prototypes) - previous
+    if parent is None or last_node is None or branch.prefix in parent.children:
+        return
+
+    children = last_node.children
+
+    end = CommandTree(
+        type="argument",
+        parser="bolt_expressions:source",
+        properties={"prefix": branch.prefix},
+        redirect=last_node.redirect,
+        executable=last_node.executable,
+        subcommand=last_node.subcommand,
+        children=None if children is None else dict(children),
+    )
+    parent.children[branch.prefix] = CommandTree(
+        type="literal", children={branch.name: end}
+    )
 
 
 def update_implicit_execute(spec: CommandSpec, prototypes: Iterable[CommandPrototype]):
@@ -166,7 +235,7 @@ def get_source_values(source: Source):
         return (source.scoreholder, source.objective)
 
     if isinstance(source, DataSource):
-        return (source._type, source._target, str(source._path))
+        return (source._type, source._target, source._path)
 
 
 @dataclass(frozen=True)
@@ -177,6 +246,7 @@ class AstSourceNode(AstNode):
 @dataclass
 class SourceConverter:
     ctx: Context | Expression
+    pending: int = 0
 
     @internal
     def __call__(self, obj: Any, node: AstNode):
@@ -186,14 +256,16 @@ class SourceConverter:
         if isinstance(obj, Source):
             source = obj.evaluate()
         elif isinstance(obj, tuple) and len(obj) == 2:
-            source = ScoreSource(*obj, ctx=self.ctx)
+            source = ScoreSource.create(*obj, ctx=self.ctx)
         elif isinstance(obj, tuple) and len(obj) == 3:
-            source = DataSource(*obj, ctx=self.ctx)
+            source = DataSource.create(*obj, ctx=self.ctx)
         else:
             raise ValueError(
                 f"Cannot interpolate source of type {type(obj)!r} '{obj}'."
             )
 
+        self.pending += 1
+
         return AstSourceNode(
             value=source, location=node.location, end_location=node.end_location
         )
@@ -202,10 +274,27 @@ class SourceConverter:
 @dataclass
 class SourceTransformer(MutatingReducer):
     mc: Mecha = required_field()
+    converter: SourceConverter = required_field()
+    prototypes: set[str] = required_field()
+
+    parents: dict[tuple[str, int], tuple[tuple[str, ...], tuple[str, ...]]] = field(
+        default_factory=dict
+    )
+    children: dict[tuple[tuple[str, ...], str], tuple[str, CommandTree]] = field(
+        default_factory=dict
+    )
+    parsed: dict[tuple[str, str, tuple[str, ...]], AstNode] = field(
+        default_factory=dict
+    )
 
     def get_argument_parent(
         self, command: AstCommand, arg_i: int
-    ) -> Tuple[CommandTree, Tuple[str]]:
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        key = (command.identifier, arg_i)
+
+        if (result := self.parents.get(key)) is not None:
+            return result
+
         spec = self.mc.spec
 
         prototype = spec.prototypes.get(command.identifier)
@@ -224,11 +313,42 @@ class SourceTransformer(MutatingReducer):
             parent_scope = parent_scope[:-1]
             offset = (prefix, *offset)
 
-        return spec.tree.get(parent_scope), offset
+        result = self.parents[key] = (parent_scope, offset)
+        return result
+
+    def get_child_argument(
+        self, scope: tuple[str, ...], parser: str
+    ) -> tuple[str, CommandTree]:
+        key = (scope, parser)
+
+        if (result := self.children.get(key)) is None:
+            parent = self.mc.spec.tree.get(scope)
+            result = get_child_argument_by_parser(
+                parent, parser if ":" in parser else f"minecraft:{parser}"
+            )
+            self.children[key] = result
+
+        return result
+
+    def create_argument(
+        self, value: Any, parser: str, scope: tuple[str, ...], properties: Any
+    ) -> AstNode:
+        if parser == "nbt_path":
+            return AstNbtPath.from_value(value)
+
+        key = (value, parser, scope)
+
+        if (node := self.parsed.get(key)) is None:
+            node = self.mc.parse(
+                value, using=parser, provide={"properties": properties}
+            )
+            self.parsed[key] = node
+
+        return node
 
     @rule(AstCommand)
     def command(self, cmd_node: AstCommand):
-        if not any(isinstance(n, AstSourceNode) for n in cmd_node.arguments):
+        if not self.converter.pending or cmd_node.identifier not in self.prototypes:
             return cmd_node
 
         identifier = cmd_node.identifier
@@ -239,7 +359,9 @@ class SourceTransformer(MutatingReducer):
                 arguments.append(cmd_arg)
                 continue
 
-            parent, parent_offset = self.get_argument_parent(cmd_node, i)
+            self.converter.pending -= 1
+
+            parent_scope, parent_offset = self.get_argument_parent(cmd_node, i)
 
             source = cmd_arg.value
 
@@ -247,29 +369,27 @@ class SourceTransformer(MutatingReducer):
             values = get_source_values(source)
 
             arg_scope = []
-            arg_parent = parent
+            scope = parent_scope
 
             for parser, value in zip(parsers, values):
                 if parser is None:
                     arg_scope.append(value)
-                    arg_parent = arg_parent.get(value)
+                    scope = (*scope, value)
                     continue
 
-                arg_name, arg_node = get_child_argument_by_parser(
-                    arg_parent, parser if ":" in parser else f"minecraft:{parser}"
-                )
+                arg_name, arg_node = self.get_child_argument(scope, parser)
 
                 if not value:
                     continue
 
-                arg_ast = self.mc.parse(
-                    value, using=parser, provide={"properties": arg_node.properties}
+                arg_ast = self.create_argument(
+                    value, parser, (*scope, arg_name), arg_node.properties
                 )
 
                 arguments.append(arg_ast)
                 arg_scope.append(arg_name)
 
-                arg_parent = arg_node
+                scope = (*scope, arg_name)
 
             identifier = identifier.replace(
                 ":".join(parent_offset), ":".join(arg_scope), 1
@@ -1,6 +1,7 @@
 __all__ = [
     "TypeCheckError",
     "TypeCheckDiagnostic",
+    "SchemaError",
     "get_exception_chain",
 ]
 
@@ -13,6 +14,10 @@ class TypeCheckDiagnostic(Exception):
     """Diagnostic error raised by the type checker."""
 
 
+class SchemaError(Exception):
+    """Invalid nbt schema file."""
+
+
 def get_exception_chain(exc: BaseException) -> tuple[BaseException, ...]:
     exceptions: list[BaseException] = []
 
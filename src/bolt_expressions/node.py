@@ -1,16 +1,28 @@
 import typing as t
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
+from collections import Counter
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import partial
-from typing import Any, Iterable, Union
+from hashlib import sha1
+from typing import Any, Callable, Hashable, Iterable, TypeVar, Union
+from weakref import WeakValueDictionary
 
 from beet import Context, Function, Generator
+from beet.core.utils import required_field
 from bolt import Runtime
 from bolt.contrib.defer import Defer
 from bolt.utils import internal
-from mecha import AstChildren, AstCommand, AstRoot, Mecha
+from mecha import (
+    AstChildren,
+    AstCommand,
+    AstCommandSentinel,
+    AstRoot,
+    Mecha,
+    MutatingReducer,
+    rule,
+)
 from mecha.contrib.nested_location import NestedLocationResolver
 from pydantic import BaseModel
 
@@ -19,22 +31,28 @@ from .casting import TypeCaster
 from .check import TypeChecker
 from .optimizer import (
     ConstScoreManager,
+    CostModel,
     IrBranch,
     IrChildren,
     IrData,
     IrLiteral,
     IrOperation,
+    IrRawBlock,
     IrScore,
     IrSet,
     IrSource,
+    KnownValues,
     NbtValue,
     Optimizer,
+    ScoreTuple,
     SourceTuple,
     TempDataManager,
     TempScoreManager,
     add_subtract_by_zero_removal,
+    algebraic_simplification,
     boolean_condition_propagation,
     branch_condition_propagation,
+    common_subexpression_elimination,
     commutative_set_collapsing,
     composite_literal_expansion,
     compound_match_data_compare,
@@ -44,33 +62,55 @@ from .optimizer import (
     convert_defined_boolean_condition,
     data_get_scaling,
     data_insert_score,
+    data_load_forwarding,
     data_set_scaling,
     data_string_propagation,
     deadcode_elimination,
     discard_casting,
     discard_non_numerical_casting,
+    entity_snapshot_batching,
+    get_temp_cleanup,
     init_score_boolean_result,
+    instruction_selection,
+    interval_analysis,
     literal_to_constant_replacement,
     multiply_divide_by_fraction,
     multiply_divide_by_one_removal,
     noncommutative_set_collapsing,
+    reads_random_selector,
     rename_temp_scores,
     set_and_get_cleanup,
     set_to_self_removal,
+    sibling_write_merging,
     source_copy_elision,
     store_result_inlining,
     store_set_data_compare,
+    temp_cleanup,
 )
 from .typing import NbtTypeString
-from .utils import identifier_generator, insert_nested_commands
+from .utils import (
+    execute_function_command,
+    identifier_generator,
+    patch_nbt_hash,
+    return_command,
+)
 
 __all__ = [
     "ExpressionOptions",
     "expression_options",
     "TempScoreManager",
     "ConstScoreManager",
+    "InitFunction",
     "ExpressionNode",
     "Expression",
+    "LazyEntry",
+    "LazyStats",
+    "TempStats",
+    "AstLazyCommand",
+    "LazyEmitter",
+    "OptimizationWindow",
+    "AstWindowCommand",
+    "WindowEmitter",
 ]
 
 
@@ -88,6 +128,14 @@ class ExpressionOptions(BaseModel):
     default_floating_nbt_type: str = "double"
 
     disable_commands: bool = False
+    intern_sources: bool = False
+    optimize_across_statements: bool = False
+    propagate_known_values: bool = False
+    schemas: list[str] = []
+    command_costs: dict[str, float] = {}
+    scan_constants: bool = False
+    guard_init: bool = False
+    temp_hygiene: bool = False
 
 
 def expression_options(ctx: Context) -> ExpressionOptions:
@@ -108,6 +156,11 @@ class UnrollHelper:
     temporaries: set[SourceTuple] = field(init=False, default_factory=set)
     data: dict[str, Any] = field(default_factory=dict)
 
+    computed_nodes: dict[int, tuple["ExpressionNode", IrSource]] = field(
+        init=False, default_factory=dict
+    )
+    computed_values: dict[Hashable, IrSource] = field(init=False, default_factory=dict)
+
     @contextmanager
     def provide(self, **kwargs: Any):
         prev_data = self.data
@@ -127,6 +180,49 @@ class UnrollHelper:
         if remove:
             self.ignored_sources.remove(source)
 
+    @property
+    def tracks_nodes(self) -> bool:
+        return not self.ignored_sources and not self.data.get("ignore_lazy")
+
+    def reuse(self, node: "ExpressionNode") -> IrSource | None:
+        """Returns the result of a node that was already unrolled."""
+        if not self.tracks_nodes:
+            return None
+
+        if entry := self.computed_nodes.get(id(node)):
+            computed_node, result = entry
+
+            if computed_node is node:
+                return result
+
+        return None
+
+    def lookup(self, key: tuple[Any, ...]) -> IrSource | None:
+        """Returns the result of a structurally identical computation."""
+        if any(reads_random_selector(part) for part in key):
+            return None
+
+        try:
+            return self.computed_values.get(key)
+        except TypeError:
+            return None
+
+    def remember(self, node: "ExpressionNode", key: tuple[Any, ...], result: IrSource):
+        if self.tracks_nodes:
+            self.computed_nodes[id(node)] = (node, result)
+
+        if any(reads_random_selector(part) for part in key):
+            return
+
+        # unhashable keys are never reused
+        with suppress(TypeError):
+            self.computed_values[key] = result
+
+    def invalidate(self):
+        """Forgets computed results after a source was modified in-place."""
+        self.computed_nodes.clear()
+        self.computed_values.clear()
+
     def add_temporary(self, source: SourceTuple):
         self.temporaries.add(source)
 
@@ -144,7 +240,7 @@ class UnrollHelper:
         return IrScore(holder=source.holder, obj=source.obj)
 
 
-@dataclass(order=False, eq=False, kw_only=True)
+@dataclass(order=False, eq=False, kw_only=True, slots=True)
 class ExpressionNode(ABC):
     ctx: Union[Context, "Expression"] = field(repr=False)
     expr: "Expression" = field(init=False, repr=False)
@@ -172,23 +268,239 @@ class Unrolled(ExpressionNode):
 
 ResolveResult = SourceTuple | NbtValue | None
 
+N = TypeVar("N", bound=ExpressionNode)
+
 
 @dataclass(kw_only=True)
 class LazyEntry:
+    """Pending value of a lazy source.
+
+    The expression node is only kept while the value can still be inlined, and the
+    commands only while they can still be emitted.
+    """
+
     source: SourceTuple
-    node: ExpressionNode
-    commands: AstChildren[AstCommand]
+    node: ExpressionNode | None
+    commands: AstChildren[AstCommand] | None
+    scores: tuple[tuple[str, str], ...] = ()
     emit: bool = False
 
+    def release(self):
+        self.node = None
+
+        if not self.emit:
+            self.commands = None
+
+    def flush(self) -> AstChildren[AstCommand] | None:
+        commands = self.commands if self.emit else None
+
+        self.node = None
+        self.commands = None
+
+        return commands
+
+
+@dataclass
+class LazyStats:
+    """Counters for the lazy value subsystem."""
+
+    created: int = 0
+    hits: int = 0
+    emitted: int = 0
+    elided: int = 0
+
+
+@dataclass
+class TempStats:
+    """Largest number of temporaries used by a single block of commands."""
+
+    peak: int = 0
+    peak_location: str | None = None
+
+    def record(self, location: str | None, temporaries: int):
+        if temporaries > self.peak:
+            self.peak = temporaries
+            self.peak_location = location
+
+
+def is_return_command(cmd: Any) -> bool:
+    return isinstance(cmd, AstCommand) and cmd.identifier.startswith("return")
+
+
+def contains_block(nodes: Iterable[IrOperation], commands: list[AstCommand]) -> bool:
+    """Checks whether the optimized nodes still emit the given block of commands."""
+    for node in nodes:
+        if isinstance(node, IrRawBlock) and node.commands is commands:
+            return True
+        if isinstance(node, IrBranch) and contains_block(node.children, commands):
+            return True
+
+    return False
+
+
+def add_return_cleanup(cmd: AstCommand, cleanup: Iterable[AstCommand]) -> AstCommand:
+    """Runs the cleanup commands right before returning."""
+    if cmd.identifier == "return:commands":
+        root = t.cast(AstRoot, cmd.arguments[0])
+        commands = (*cleanup, *root.commands)
+    else:
+        commands = (*cleanup, cmd)
+
+    return return_command(AstRoot(commands=AstChildren(commands)))
+
+
+@dataclass(frozen=True, slots=True)
+class AstLazyCommand(AstCommandSentinel):
+    """Placeholder for the commands of a lazy value."""
+
+    entry: LazyEntry = required_field()
+
+
+@dataclass
+class LazyEmitter(MutatingReducer):
+    """Replaces lazy placeholders with their commands once evaluation is done."""
+
+    stats: LazyStats = required_field()
+    lazy_values: dict[SourceTuple, LazyEntry] = required_field()
+    register: Callable[[Iterable[tuple[str, str]]], None] = required_field()
+    pending: int = 0
+
+    def __call__(self, node: Any, *args: Any, **kwargs: Any) -> Any:
+        if not self.pending:
+            return node
+
+        return super().__call__(node, *args, **kwargs)
+
+    @rule(AstLazyCommand)
+    def lazy_command(self, node: AstLazyCommand) -> AstChildren[AstCommand]:
+        entry = node.entry
+        commands = entry.flush()
+
+        self.pending -= 1
+
+        if self.lazy_values.get(entry.source) is entry:
+            del self.lazy_values[entry.source]
+
+        if commands is None:
+            self.stats.elided += 1
+            return AstChildren()
+
+        self.stats.emitted += 1
+        self.register(entry.scores)
+        return commands
+
+
+@dataclass(kw_only=True)
+class OptimizationWindow:
+    """Operations of consecutive expression statements optimized together.
+
+    Lazy placeholders emitted between the statements are kept along with the offset
+    of the operations they follow.
+    """
+
+    operations: list[IrOperation] = field(default_factory=list)
+    temporaries: set[SourceTuple] = field(default_factory=set)
+    defined: frozenset[SourceTuple] = frozenset()
+    lazy: list[tuple[int, "AstLazyCommand"]] = field(default_factory=list)
+    location: str | None = None
+    commands: AstChildren[AstCommand] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AstWindowCommand(AstCommandSentinel):
+    """Placeholder for the commands of an optimization window."""
+
+    window: OptimizationWindow = required_field()
+
+
+@dataclass
+class WindowEmitter(MutatingReducer):
+    """Replaces window placeholders with their commands once evaluation is done."""
+
+    runtime: Runtime = required_field()
+    flush: Callable[[OptimizationWindow], None] = required_field()
+    pending: int = 0
+
+    def __call__(self, node: Any, *args: Any, **kwargs: Any) -> Any:
+        if not self.pending:
+            return node
+
+        return super().__call__(node, *args, **kwargs)
+
+    @rule(AstWindowCommand)
+    def window_command(self, node: AstWindowCommand) -> AstChildren[AstCommand]:
+        window = node.window
+
+        if window.commands is None:
+            with self.runtime.modules.error_handler(
+                "Optimization window raised an exception."
+            ):
+                self.flush(window)
+
+        self.pending -= 1
+        commands = window.commands or AstChildren()
+        window.commands = None
+
+        return commands
+
+
+@dataclass
+class InitFunction:
+    """Structured contents of the init function.
+
+    Objectives are created in the order they were first registered, followed by
+    every constant with at least one reference, sorted by value, and finally the
+    raw commands.
+    """
+
+    objectives: dict[str, str] = field(default_factory=dict)
+    constants: Counter[int] = field(default_factory=Counter)
+    commands: list[str] = field(default_factory=list)
+
+    def add_objective(self, name: str, criteria: str = "dummy"):
+        self.objectives.setdefault(name, criteria)
+
+    def reference_constant(self, value: int, count: int = 1):
+        self.constants[value] += count
+
+    def build(self, const_score: ConstScoreManager) -> list[str]:
+        return [*self.build_scores(const_score), *self.commands]
+
+    def build_scores(self, const_score: ConstScoreManager) -> list[str]:
+        """Returns the commands creating the objectives and the constants."""
+        commands = [
+            f"scoreboard objectives add {name} {criteria}"
+            for name, criteria in self.objectives.items()
+        ]
+
+        for value in sorted(self.constants):
+            if self.constants[value] > 0:
+                holder, obj = const_score.format(value), const_score.objective
+                commands.append(f"scoreboard players set {holder} {obj} {value}")
+
+        return commands
+
 
 class Expression:
     ctx: Context
     opts: ExpressionOptions
 
     called_init: bool
-    init_commands: list[str]
+    init_function: InitFunction
+    score_callback: Callable[[str, str, int], None] | None
+    score_records: list[list[tuple[str, str, int]]]
     commands: list[AstCommand] | None
     lazy_values: dict[SourceTuple, LazyEntry]
+    lazy_stats: LazyStats
+    temp_stats: TempStats
+    lazy_emitter: LazyEmitter
+    window: OptimizationWindow | None
+    window_emitter: WindowEmitter
+    known_values: KnownValues
+    known_commands: list[AstCommand] | None
+    known_length: int
+    return_cleanup: list[AstCommand]
+    interned_sources: "WeakValueDictionary[Hashable, ExpressionNode]"
 
     type_caster: TypeCaster
     type_checker: TypeChecker
@@ -207,10 +519,22 @@ class Expression:
     generator: Generator
 
     def __init__(self, ctx: Context):
+        patch_nbt_hash()
+
         self.called_init = False
-        self.init_commands = []
+        self.init_function = InitFunction()
+        self.score_callback = None
+        self.score_records = []
         self.commands = None
         self.lazy_values = {}
+        self.lazy_stats = LazyStats()
+        self.temp_stats = TempStats()
+        self.window = None
+        self.known_values = KnownValues()
+        self.known_commands = None
+        self.known_length = 0
+        self.return_cleanup = []
+        self.interned_sources = WeakValueDictionary()
 
         self.ctx = ctx
 
@@ -219,6 +543,20 @@ class Expression:
         self.mc = self.ctx.inject(Mecha)
         self.runtime = self.ctx.inject(Runtime)
         self.defer = self.ctx.inject(Defer)
+        self.lazy_emitter = LazyEmitter(
+            stats=self.lazy_stats,
+            lazy_values=self.lazy_values,
+            register=self.register_scores,
+        )
+        self.window_emitter = WindowEmitter(
+            runtime=self.runtime, flush=self.flush_window
+        )
+        self.mc.steps.insert(
+            self.mc.steps.index(self.defer.handler) + 1, self.lazy_emitter
+        )
+        self.mc.steps.insert(
+            self.mc.steps.index(self.defer.handler) + 1, self.window_emitter
+        )
         self.nested_location = self.ctx.inject(NestedLocationResolver)
         self.generator = self.ctx.generate
 
@@ -242,6 +580,9 @@ class Expression:
             temp_data=self.temp_data,
             const_score=self.const_score,
             default_floating_nbt_type=self.opts.default_floating_nbt_type,
+            costs=CostModel(dict(self.opts.command_costs)),
+            default_nbt_type=self.opts.default_nbt_type,
+            temp_hygiene=self.opts.temp_hygiene,
         )
         self.optimizer.add_rules(
             composite_literal_expansion=partial(
@@ -258,6 +599,9 @@ class Expression:
                 convert_data_order_operation, opt=self.optimizer
             ),
             discard_casting=discard_casting,
+            common_subexpression_elimination=partial(
+                common_subexpression_elimination, opt=self.optimizer
+            ),
             # features
             data_set_scaling=partial(data_set_scaling, opt=self.optimizer),
             data_get_scaling=data_get_scaling,
@@ -267,6 +611,12 @@ class Expression:
             add_subtract_by_zero_removal=add_subtract_by_zero_removal,
             noncommutative_set_collapsing=noncommutative_set_collapsing,
             commutative_set_collapsing=commutative_set_collapsing,
+            algebraic_simplification=partial(
+                algebraic_simplification, opt=self.optimizer
+            ),
+            interval_analysis=interval_analysis,
+            data_load_forwarding=partial(data_load_forwarding, self.optimizer),
+            instruction_selection=partial(instruction_selection, opt=self.optimizer),
             data_string_propagation=data_string_propagation,
             literal_to_constant_replacement=partial(
                 literal_to_constant_replacement, self.optimizer
@@ -287,14 +637,36 @@ class Expression:
             store_result_inlining=store_result_inlining,
             deadcode_elimination=partial(deadcode_elimination, opt=self.optimizer),
             init_score_boolean_result=init_score_boolean_result,
+            sibling_write_merging=sibling_write_merging,
+            entity_snapshot_batching=partial(entity_snapshot_batching, self.optimizer),
             rename_temp_scores=partial(rename_temp_scores, self.optimizer),
+            temp_cleanup=partial(temp_cleanup, self.optimizer),
         )
 
         self.ast_converter = AstConverter(
             default_nbt_type=self.opts.default_nbt_type, mc=self.mc
         )
 
+    def intern(self, key: Hashable, factory: Callable[[], N]) -> N:
+        """Return the interned node for `key`, creating it with `factory` if needed."""
+
+        if not self.opts.intern_sources:
+            return factory()
+
+        try:
+            node = self.interned_sources.get(key)
+        except TypeError:
+            return factory()
+
+        if node is None:
+            node = factory()
+            self.interned_sources[key] = node
+
+        return t.cast(N, node)
+
     def inject_command(self, *cmds: str | AstCommand):
+        self.close_window()
+
         commands = self.commands
         if commands is None:
             commands = self.runtime.commands
@@ -327,9 +699,8 @@ class Expression:
         with self.runtime.scope() as cmds:
             yield location
 
-        cmd = self.mc.parse(f"execute function {location}:\n  ...", using="command")
         root = AstRoot(commands=AstChildren(cmds))
-        self.runtime.commands.append(insert_nested_commands(cmd, root))
+        self.runtime.commands.append(execute_function_command(location, root))
 
     def unroll(
         self, node: ExpressionNode
@@ -354,20 +725,34 @@ class Expression:
             result = score
 
         source = result.to_tuple()
+        self.discard_lazy(source)
 
-        if source in self.lazy_values:
-            del self.lazy_values[source]
+        if self.opts.propagate_known_values:
+            operations = self.propagate_values(operations, helper.temporaries)
 
-        nodes, _ = self.optimizer(operations, temporaries=helper.temporaries)
-        cmds = self.ast_converter(nodes)
+            if lazy:
+                self.known_values.discard((source,))
+
+        if not lazy and self.opts.optimize_across_statements and self.commands is None:
+            self.extend_window(operations, helper.temporaries)
+            self.sync_values()
+            return source
+
+        nodes = self.optimize(operations, helper.temporaries)
+        cmds, scores = self.convert(nodes)
 
         if not lazy:
+            self.register_scores(scores)
             self.inject_command(*cmds)
+            self.sync_values()
             return source
 
-        entry = LazyEntry(source=source, node=node, commands=cmds)
+        entry = LazyEntry(source=source, node=node, commands=cmds, scores=scores)
         self.lazy_values[source] = entry
-        self.defer(partial(self.emit_lazy, entry=entry))
+        self.lazy_stats.created += 1
+        self.lazy_emitter.pending += 1
+        self.runtime.commands.append(AstLazyCommand(entry=entry))
+        self.sync_values()
 
         return source
 
@@ -380,35 +765,270 @@ class Expression:
             return
 
         result_tuple = result.to_tuple()
+        self.discard_lazy(result_tuple)
+        self.close_window()
 
-        if result_tuple in self.lazy_values:
-            del self.lazy_values[result_tuple]
+        body: list[AstCommand] = []
+        branch = IrBranch(
+            target=result, children=IrChildren((IrRawBlock(commands=body),))
+        )
 
-        nodes, temporaries = self.optimizer(
-            operations,
-            temporaries=helper.temporaries,
-            rename_temp_scores=False,
-            deadcode_elimination=False,
+        nodes = self.optimize(
+            (*operations, branch), (*helper.temporaries, result_tuple)
         )
 
-        with self.runtime.scope() as cmds:
+        # the temporaries reset after the branch are also reset before returning
+        # from its body
+        branches = [i for i, node in enumerate(nodes) if isinstance(node, IrBranch)]
+        cleanup = (
+            nodes[branches[-1] + 1 :] if self.opts.temp_hygiene and branches else ()
+        )
+        cleanup_cmds, cleanup_scores = self.convert(cleanup)
+        self.register_scores(cleanup_scores)
+
+        with self.pending_cleanup(cleanup_cmds), self.record_scores() as body_scores:
+            with self.runtime.scope(body):
+                yield
+
+            if len(body) == 1 and is_return_command(body[0]) and self.return_cleanup:
+                body[0] = add_return_cleanup(body[0], self.return_cleanup)
+
+        if not contains_block(nodes, body):
+            # the branch was pruned so the commands of its body are never emitted
+            for holder, obj, count in body_scores:
+                self.register_score(holder, obj, -count)
+
+        cmds, scores = self.convert(nodes)
+        self.register_scores(scores)
+        self.inject_command(*cmds)
+
+    @contextmanager
+    def pending_cleanup(self, cmds: Iterable[AstCommand]):
+        """Commands that need to run before returning from the current function."""
+        count = len(self.return_cleanup)
+        self.return_cleanup.extend(cmds)
+
+        try:
             yield
+        finally:
+            del self.return_cleanup[count:]
 
-        branch = IrBranch(target=result, children=IrChildren.from_ast(cmds))
+    @contextmanager
+    def cleanup_temporaries(self, *sources: SourceTuple):
+        """Cleans up temporaries used across several statements with `temp_hygiene`.
 
-        nodes, _ = self.optimizer(
-            (*nodes, branch),
-            disable_all=True,
-            temporaries=(*temporaries, result_tuple),
-            branch_condition_propagation=True,
-            convert_defined_boolean_condition=True,
-            rename_temp_scores=True,
-            deadcode_elimination=True,
-        )
+        The temporaries are also cleaned up before returning early from the function
+        in the meantime.
+        """
+        if not self.opts.temp_hygiene:
+            yield
+            return
+
+        temporaries = [
+            IrScore(holder=source.holder, obj=source.obj)
+            if isinstance(source, ScoreTuple)
+            else IrData(type=source.type, target=source.target, path=source.path)
+            for source in sources
+        ]
+        cmds, scores = self.convert(get_temp_cleanup(self.optimizer, temporaries))
+        self.register_scores(scores)
+
+        with self.pending_cleanup(cmds):
+            yield
 
-        cmds = self.ast_converter(nodes)
         self.inject_command(*cmds)
 
+    def propagate_values(
+        self, operations: Iterable[IrOperation], temporaries: Iterable[SourceTuple]
+    ) -> tuple[IrOperation, ...]:
+        """Substitutes the values written by the previous expressions of the function.
+
+        The values are forgotten as soon as any other command was added to the
+        function, which covers raw commands, function calls, branches and nested
+        execute blocks.
+        """
+        commands = self.commands if self.commands is not None else self.runtime.commands
+
+        if commands is not self.known_commands or len(commands) != self.known_length:
+            self.known_values.clear()
+
+        operations = self.known_values.propagate(operations)
+        self.known_values.discard(temporaries)
+
+        return operations
+
+    def sync_values(self):
+        """Marks the commands added by the current expression as accounted for."""
+        if not self.opts.propagate_known_values:
+            return
+
+        commands = self.commands if self.commands is not None else self.runtime.commands
+
+        self.known_commands = commands
+        self.known_length = len(commands)
+
+    def extend_window(
+        self, operations: Iterable[IrOperation], temporaries: Iterable[SourceTuple]
+    ):
+        """Buffers the operations of an expression statement.
+
+        The current window is extended as long as its placeholder is only followed by
+        lazy placeholders, otherwise a new window is started.
+        """
+        commands = self.runtime.commands
+        window = self.window
+        index = len(commands) - 1
+
+        while index >= 0 and isinstance(commands[index], AstLazyCommand):
+            index -= 1
+
+        if (
+            window is None
+            or index < 0
+            or not isinstance(placeholder := commands[index], AstWindowCommand)
+            or placeholder.window is not window
+            or window.defined != self.optimizer.defined_sources
+        ):
+            window = OptimizationWindow(
+                defined=frozenset(self.optimizer.defined_sources),
+                location=self.current_location(),
+            )
+            self.window = window
+            self.window_emitter.pending += 1
+            commands.append(AstWindowCommand(window=window))
+        else:
+            offset = len(window.operations)
+            window.lazy.extend((offset, lazy) for lazy in commands[index + 1 :])
+            del commands[index + 1 :]
+
+        window.operations.extend(operations)
+        window.temporaries.update(temporaries)
+
+    def close_window(self):
+        """Prevents the pending window from being extended any further."""
+        self.window = None
+
+    def flush_window(self, window: OptimizationWindow):
+        """Optimizes the operations of a window and converts them to commands.
+
+        The window is split around lazy values that ended up being emitted, the other
+        placeholders are moved after the commands.
+        """
+        if window is self.window:
+            self.window = None
+
+        commands: list[AstCommand] = []
+        elided: list[AstCommand] = []
+        start = 0
+
+        for offset, lazy in window.lazy:
+            if not lazy.entry.emit:
+                elided.append(lazy)
+                continue
+
+            commands.extend(self.optimize_window(window, start, offset))
+            commands.append(lazy)
+            start = offset
+
+        commands.extend(self.optimize_window(window, start, len(window.operations)))
+        commands.extend(elided)
+
+        window.operations.clear()
+        window.lazy.clear()
+        window.commands = AstChildren(commands)
+
+    def optimize_window(
+        self, window: OptimizationWindow, start: int, end: int
+    ) -> AstChildren[AstCommand]:
+        if start == end:
+            return AstChildren()
+
+        defined = self.optimizer.defined_sources
+        self.optimizer.defined_sources = set(window.defined)
+
+        try:
+            nodes = self.optimize(
+                window.operations[start:end], window.temporaries, window.location
+            )
+        finally:
+            marked = self.optimizer.defined_sources - window.defined
+            self.optimizer.defined_sources = defined | marked
+
+        cmds, scores = self.convert(nodes)
+        self.register_scores(scores)
+
+        return cmds
+
+    def current_location(self) -> str | None:
+        try:
+            return self.runtime.modules.current_path
+        except ValueError:
+            return None
+
+    def optimize(
+        self,
+        operations: Iterable[IrOperation],
+        temporaries: Iterable[SourceTuple],
+        location: str | None = None,
+    ) -> tuple[IrOperation, ...]:
+        """Runs the optimizer and keeps track of the temporaries it allocated.
+
+        With the `temp_hygiene` option, the storage temporaries of each function
+        are nested in a compound named after a hash of its path.
+        """
+        if location is None:
+            location = self.current_location()
+
+        if self.opts.temp_hygiene and location is not None:
+            self.optimizer.temp_root = self.ctx.generate.format("{hash}", location)
+
+        try:
+            nodes, _ = self.optimizer(operations, temporaries=temporaries)
+        finally:
+            self.optimizer.temp_root = None
+
+        self.temp_stats.record(location, len(self.optimizer.allocated_temps))
+
+        return tuple(nodes)
+
+    def convert(
+        self, nodes: Iterable[IrOperation]
+    ) -> tuple[AstChildren[AstCommand], tuple[tuple[str, str], ...]]:
+        """Converts operations to commands along with the scores they use."""
+        self.ast_converter.scores.clear()
+        cmds = self.ast_converter(nodes)
+
+        return cmds, tuple(self.ast_converter.scores)
+
+    def register_scores(self, scores: Iterable[tuple[str, str]], count: int = 1):
+        """Notifies the score callback of scores used by emitted commands.
+
+        This is how constants and objectives end up in the init function without
+        scanning every command of the project. The callback runs once per batch of
+        emitted commands referencing a score, which is what constants are counted
+        by. A negative count releases the references of commands that were dropped.
+        """
+        for holder, obj in scores:
+            self.register_score(holder, obj, count)
+
+    def register_score(self, holder: str, obj: str, count: int = 1):
+        for record in self.score_records:
+            record.append((holder, obj, count))
+
+        if self.score_callback is not None:
+            self.score_callback(holder, obj, count)
+
+    @contextmanager
+    def record_scores(self):
+        """Collects the scores registered in the meantime along with their count."""
+        record: list[tuple[str, str, int]] = []
+        self.score_records.append(record)
+
+        try:
+            yield record
+        finally:
+            self.score_records.pop()
+
     def unroll_lazy(
         self, source: SourceTuple, helper: UnrollHelper
     ) -> tuple[Iterable[IrOperation], IrSource | IrLiteral] | None:
@@ -419,7 +1039,11 @@ class Expression:
             return None
 
         if entry := self.lazy_values.get(source):
+            if entry.node is None:
+                return None
+
             helper.add_temporary(source)
+            self.lazy_stats.hits += 1
 
             with helper.ignore_source(source):
                 return entry.node.unroll(helper)
@@ -427,13 +1051,14 @@ class Expression:
         return None
 
     def evaluate_lazy(self, source: SourceTuple):
-        if entry := self.lazy_values.get(source):
+        if entry := self.lazy_values.pop(source, None):
             entry.emit = True
-            del self.lazy_values[source]
+            entry.release()
 
-    def emit_lazy(self, entry: LazyEntry):
-        if entry.emit:
-            self.inject_command(*entry.commands)
+    def discard_lazy(self, source: SourceTuple):
+        """Drop the lazy value of a source that is about to be overwritten."""
+        if entry := self.lazy_values.pop(source, None):
+            entry.release()
 
     def init(self):
         """Injects a function which creates `ConstantSource` fakeplayers"""
@@ -441,15 +1066,48 @@ class Expression:
         self.inject_command(f"function {path}")
         self.called_init = True
 
+    @property
+    def init_commands(self) -> list[str]:
+        """Raw commands added at the end of the init function."""
+        return self.init_function.commands
+
     def generate_init(self) -> Function:
+        commands = self.init_function.build(self.const_score)
         function = Function(
-            self.init_commands,
+            commands,
             prepend_tags=["minecraft:load"] if not self.called_init else None,
         )
 
-        if not self.init_commands:
+        if not commands:
             return function
 
+        if self.opts.guard_init:
+            # the raw init commands still run on every reload
+            scores = self.init_function.build_scores(self.const_score)
+            guard = self.guard_init(scores) if scores else []
+            function.lines = [*guard, *self.init_function.commands]
+
         self.ctx.generate(self.opts.init_path, function)
 
         return function
+
+    def guard_init(self, commands: list[str]) -> list[str]:
+        """Moves the objectives and constants to a function only run when they change.
+
+        A hash of the commands is kept in the temp storage once they ran, so
+        reloading the data pack doesn't reinstall the same objectives and constants.
+        """
+        digest = sha1("\n".join(commands).encode()).hexdigest()[:16]
+        storage = self.opts.temp_storage
+
+        install = self.ctx.generate(
+            f"{self.opts.init_path}/install",
+            Function(
+                [*commands, f'data modify storage {storage} init set value "{digest}"']
+            ),
+        )
+
+        return [
+            f'execute unless data storage {storage} {{init: "{digest}"}} '
+            f"run function {install}"
+        ]
@@ -79,6 +79,9 @@ class UnaryOperation(Operation):
         return IrUnary(op=self.op, target=target)
 
     def unroll(self, helper: UnrollHelper) -> tuple[Iterable[IrOperation], IrSource]:
+        if not self.in_place and (result := helper.reuse(self)):
+            return (), result
+
         target = convert_node(self.target, self.ctx)
 
         with helper.provide(ignore_lazy=not self.evaluates_target):
@@ -87,6 +90,12 @@ class UnaryOperation(Operation):
         if not isinstance(target_value, IrSource):
             raise ValueError("Operand must be a source node.")
 
+        key = (type(self), target_value)
+
+        if not self.in_place and (result := helper.lookup(key)):
+            helper.remember(self, key, result)
+            return target_nodes, result
+
         operations: list[IrOperation] = [*target_nodes]
 
         if self.in_place:
@@ -107,6 +116,11 @@ class UnaryOperation(Operation):
 
         operations.append(operation)
 
+        if self.in_place:
+            helper.invalidate()
+        else:
+            helper.remember(self, key, temp_var)
+
         return operations, temp_var
 
 
@@ -139,6 +153,9 @@ class BinaryOperation(Operation):
         return IrBinary(op=self.op, left=left, right=right)
 
     def unroll(self, helper: UnrollHelper) -> tuple[Iterable[IrOperation], IrSource]:
+        if not self.in_place and (result := helper.reuse(self)):
+            return (), result
+
         former = convert_node(self.former, self.ctx)
         latter = convert_node(self.latter, self.ctx)
 
@@ -146,15 +163,21 @@ class BinaryOperation(Operation):
             former_nodes, former_value = former.unroll(helper)
         latter_nodes, latter_value = latter.unroll(helper)
 
+        operations: list[IrOperation] = [*former_nodes, *latter_nodes]
+
         if self.commutative:
             former_priority = balance_priority(former_value, helper)
             latter_priority = balance_priority(latter_value, helper)
 
             if former_priority < latter_priority:
-                node = replace(self, former=latter, latter=former)
-                return node.unroll(helper)
+                former_value, latter_value = latter_value, former_value
+                operations = [*latter_nodes, *former_nodes]
 
-        operations: list[IrOperation] = [*former_nodes, *latter_nodes]
+        key = (type(self), former_value, latter_value)
+
+        if not self.in_place and (result := helper.lookup(key)):
+            helper.remember(self, key, result)
+            return operations, result
 
         if self.in_place and isinstance(former_value, IrSource):
             temp_var = former_value
@@ -172,6 +195,11 @@ class BinaryOperation(Operation):
 
         operations.append(operation)
 
+        if self.in_place:
+            helper.invalidate()
+        else:
+            helper.remember(self, key, temp_var)
+
         return operations, temp_var
 
 
@@ -293,17 +321,28 @@ class UnaryCondition(UnaryOperation):
     negated: ClassVar[bool] = False
 
     def unroll(self, helper: UnrollHelper) -> tuple[Iterable[IrOperation], IrSource]:
+        if result := helper.reuse(self):
+            return (), result
+
         target_nodes, target_var = convert_node(self.target, self.ctx).unroll(helper)
 
         if not isinstance(target_var, IrSource):
             raise ValueError("Operand must be a source node.")
 
+        key = (type(self), target_var)
+
+        if result := helper.lookup(key):
+            helper.remember(self, key, result)
+            return target_nodes, result
+
         condition = IrUnaryCondition(
             op=self.op, target=target_var, negated=self.negated
         )
         temp_var = helper.create_temporary(ResultType.score)
         op = IrSet(left=temp_var, right=condition)
 
+        helper.remember(self, key, temp_var)
+
         return (*target_nodes, op), temp_var
 
 
@@ -312,15 +351,26 @@ class BinaryCondition(BinaryOperation):
     negated: ClassVar[bool] = False
 
     def unroll(self, helper: UnrollHelper) -> tuple[Iterable[IrOperation], IrSource]:
+        if result := helper.reuse(self):
+            return (), result
+
         former_nodes, former_var = convert_node(self.former, self.ctx).unroll(helper)
         latter_nodes, latter_var = convert_node(self.latter, self.ctx).unroll(helper)
 
+        key = (type(self), former_var, latter_var)
+
+        if result := helper.lookup(key):
+            helper.remember(self, key, result)
+            return (*former_nodes, *latter_nodes), result
+
         temp_var = helper.create_temporary(ResultType.score)
         condition = IrBinaryCondition(
             op=self.op, left=former_var, right=latter_var, negated=self.negated
         )
         op = IrSet(left=temp_var, right=condition)
 
+        helper.remember(self, key, temp_var)
+
         return (*former_nodes, *latter_nodes, op), temp_var
 
 
@@ -1,9 +1,12 @@
+import re
 from abc import ABC
 from bisect import bisect_left
+from collections import Counter
 from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from enum import Enum
 from fractions import Fraction
+from functools import partial
 from types import TracebackType
 from typing import (
     Any,
@@ -26,6 +29,7 @@ from beet import Context
 from bolt.utils import internal
 from mecha import AbstractChildren, AbstractNode, AstNode
 from nbtlib import (  # type:ignore
+    Byte,
     Compound,
     CompoundMatch,
     Double,
@@ -33,9 +37,11 @@ from nbtlib import (  # type:ignore
     Int,
     List,
     ListIndex,
+    Long,
     NamedKey,
     Numeric,
     Path,
+    Short,
     String,
 )
 
@@ -60,6 +66,7 @@ __all__ = [
     "SmartRule",
     "SmartGenerator",
     "Optimizer",
+    "CostModel",
     "use_smart_generator",
     "smart_generator",
     "noncommutative_set_collapsing",
@@ -69,8 +76,17 @@ __all__ = [
     "multiply_divide_by_fraction",
     "multiply_divide_by_one_removal",
     "add_subtract_by_zero_removal",
+    "algebraic_simplification",
+    "KnownValues",
+    "interval_analysis",
+    "instruction_selection",
+    "data_load_forwarding",
+    "entity_snapshot_batching",
+    "sibling_write_merging",
+    "temp_cleanup",
     "set_to_self_removal",
     "set_and_get_cleanup",
+    "common_subexpression_elimination",
     "literal_to_constant_replacement",
     "DataTargetType",
     "IrNode",
@@ -100,6 +116,17 @@ class IrRaw(IrNode, Generic[AstNodeType]):
     node: AstNodeType
 
 
+@dataclass(frozen=True, kw_only=True, eq=False)
+class IrRawBlock(IrNode, Generic[AstNodeType]):
+    """Opaque reference to a list of AST nodes, converted as-is.
+
+    The list may still be filled after the IR is optimized, which lets branch
+    bodies be referenced without wrapping every command in an `IrRaw` node.
+    """
+
+    commands: list[AstNodeType]
+
+
 class IrChildren(AbstractChildren[IrNodeType]):
     @classmethod
     def from_ast(
@@ -326,6 +353,8 @@ class IrCast(IrBinary):
 
 @dataclass(frozen=True, kw_only=True)
 class IrBranch(IrUnary):
+    """Runs the children if the target is true, or always with a literal target."""
+
     op: str = field(default="branch", init=False)
     destructive: bool = field(default=False, init=False)
 
@@ -382,6 +411,9 @@ def is_copy_op(node: Any) -> TypeGuard[IrBinary]:
 
 SCORE_OPERATIONS = ("set", "add", "sub", "mul", "div", "mod", "min", "max")
 
+INT_MIN = -(2**31)
+INT_MAX = 2**31 - 1
+
 DATA_OPERATIONS = ("set", "remove", "insert", "append", "prepend", "merge")
 
 
@@ -479,6 +511,7 @@ class TempScoreManager:
 
     counter: int
     format: Callable[[int], str]
+    scratch_counter: int
 
     def __init__(
         self, objective: str, prefix: str, format: Callable[[int], str] | None = None
@@ -487,6 +520,7 @@ class TempScoreManager:
         self.prefix = prefix
         self.format = format if format is not None else lambda n: f"{self.prefix}{n}"
         self.counter = 0
+        self.scratch_counter = 0
 
     def __call__(self) -> ScoreTuple:
         name = self.format(self.counter)
@@ -494,6 +528,13 @@ class TempScoreManager:
 
         return ScoreTuple(name, self.objective)
 
+    def scratch(self) -> ScoreTuple:
+        """Returns a counter-based name for a temporary that is always renamed."""
+        name = f"{self.prefix}t{self.scratch_counter}"
+        self.scratch_counter += 1
+
+        return ScoreTuple(name, self.objective)
+
     @contextmanager
     def override(self, format: Callable[[int], str] | None = None, reset: bool = False):
         counter = self.counter
@@ -517,6 +558,7 @@ class TempDataManager:
 
     counter: int = field(default=0, init=False)
     format: Callable[[int], str] = field(default=lambda n: f"i{n}")  # type: ignore
+    scratch_counter: int = field(default=0, init=False)
 
     def __call__(self) -> DataTuple:
         name = self.format(self.counter)
@@ -524,6 +566,13 @@ class TempDataManager:
 
         return DataTuple(self.target_type, self.target, Path(name))
 
+    def scratch(self) -> DataTuple:
+        """Returns a counter-based name for a temporary that is always renamed."""
+        name = f"t{self.scratch_counter}"
+        self.scratch_counter += 1
+
+        return DataTuple(self.target_type, self.target, Path(name))
+
     @contextmanager
     def override(self, format: Callable[[int], str] | None = None, reset: bool = False):
         counter = self.counter
@@ -558,6 +607,77 @@ class ConstScoreManager:
     __call__ = create
 
 
+DEFAULT_COMMAND_COSTS: dict[str, float] = {
+    "command": 1,
+    "score_literal": 1,
+    "score_operation": 1,
+    "score_constant": 0.5,
+    "execute_store": 0.5,
+    "storage_read": 2,
+    "storage_write": 2,
+    "block_read": 5,
+    "block_write": 5,
+    "entity_read": 10,
+    "entity_write": 20,
+}
+
+
+@dataclass
+class CostModel:
+    """Estimates the runtime cost of the commands an operation is lowered to.
+
+    Scoreboard operations are cheap while reading and writing the nbt of entities
+    and blocks requires serializing their data. The costs can be overridden with
+    the `command_costs` option.
+    """
+
+    costs: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_COMMAND_COSTS))
+
+    def __post_init__(self):
+        if unknown := self.costs.keys() - DEFAULT_COMMAND_COSTS.keys():
+            raise ValueError(f"Unknown command costs {sorted(unknown)}.")
+
+        self.costs = {**DEFAULT_COMMAND_COSTS, **self.costs}
+
+    def read(self, node: Any) -> float:
+        if isinstance(node, IrData):
+            return self.costs[f"{node.type}_read"]
+
+        return 0
+
+    def write(self, node: Any) -> float:
+        if isinstance(node, IrData):
+            return self.costs[f"{node.type}_write"]
+
+        return 0
+
+    def operation(self, node: IrOperation) -> float:
+        if is_binary(node, SCORE_OPERATIONS) and isinstance(node.left, IrScore):
+            if not isinstance(node.right, IrLiteral):
+                cost = self.costs["score_operation"]
+            elif node.op in ("set", "add", "sub"):
+                cost = self.costs["score_literal"]
+            else:
+                cost = self.costs["score_operation"] + self.costs["score_constant"]
+        else:
+            cost = self.costs["command"]
+
+        operands = (*node.operands, *node.targets)
+
+        if any(isinstance(source, IrData) for source in operands) and any(
+            isinstance(source, IrScore) for source in operands
+        ):
+            cost += self.costs["execute_store"]
+
+        cost += sum(self.read(operand) for operand in node.operands)
+        cost += sum(self.write(target) for target in node.targets)
+
+        return cost
+
+    def __call__(self, nodes: Iterable[IrOperation]) -> float:
+        return sum(self.operation(node) for node in nodes)
+
+
 @dataclass
 class Optimizer:
     """Handles the operation of various optimization rules.
@@ -576,11 +696,20 @@ class Optimizer:
     temp_data: TempDataManager
     const_score: ConstScoreManager
     default_floating_nbt_type: str
+    costs: CostModel = field(default_factory=CostModel)
+    default_nbt_type: str = "int"
+    temp_hygiene: bool = False
 
     temp_sources: set[SourceTuple] = field(default_factory=set)
     defined_sources: set[SourceTuple] = field(default_factory=set)
 
     rules: list[tuple[str, Rule[IrOperation, []]]] = field(default_factory=list)
+    scratch_temps: bool = False
+
+    # compound the renamed storage temporaries are nested in, and the slots
+    # allocated by the last optimization
+    temp_root: str | None = None
+    allocated_temps: tuple[IrSource, ...] = ()
 
     def add_rules(self, index: int | None = None, /, **funcs: Rule[IrOperation, []]):
         """Registers new rules, also converts the decorated generator into a `SmartGenerator`"""
@@ -604,13 +733,25 @@ class Optimizer:
         """Performs the optimization by sending all nodes through the rules."""
 
         active_rules = {name: not disable_all for name, _ in self.rules} | rules
+        self.allocated_temps = ()
+
+        # temporaries created by the rules that run before `rename_temp_scores`
+        # are always renamed, so they skip the unique name generation
+        scratch = bool(active_rules.get("rename_temp_scores"))
 
         with self.temp(*temporaries) as temporaries:
-            for name, rule in self.rules:
-                if not active_rules.get(name):
-                    continue
+            try:
+                for name, rule in self.rules:
+                    if name == "rename_temp_scores":
+                        scratch = False
+
+                    if not active_rules.get(name):
+                        continue
 
-                nodes = tuple(rule(nodes))
+                    self.scratch_temps = scratch
+                    nodes = tuple(rule(nodes))
+            finally:
+                self.scratch_temps = False
 
             return tuple(nodes), temporaries
 
@@ -662,7 +803,11 @@ class Optimizer:
         return source in self.defined_sources
 
     def generate_score(self, temp: bool = True) -> IrScore:
-        source = self.temp_score()
+        if temp and self.scratch_temps:
+            source = self.temp_score.scratch()
+        else:
+            source = self.temp_score()
+
         if temp:
             self.add_temp(source)
 
@@ -673,7 +818,11 @@ class Optimizer:
         return IrScore(holder=holder, obj=obj)
 
     def generate_data(self, temp: bool = True) -> IrData:
-        source = self.temp_data()
+        if temp and self.scratch_temps:
+            source = self.temp_data.scratch()
+        else:
+            source = self.temp_data()
+
         if temp:
             self.add_temp(source)
 
@@ -960,7 +1109,7 @@ def get_source_usage(nodes: Iterable[IrOperation]) -> dict[SourceTuple, set[int]
             uses.add(i)
 
         if isinstance(node, IrBranch):
-            inner_usage = get_source_usage(node.children)
+            inner_usage = get_source_usage(filter(is_op, node.children))
 
             for source, inner_uses in inner_usage.items():
                 if inner_uses:
@@ -1326,264 +1475,1722 @@ def add_subtract_by_zero_removal(nodes: Iterable[IrOperation]):
             yield node
 
 
-def discard_casting(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
-    for node in nodes:
-        if isinstance(node, IrCast) and is_copy_op(node):
-            yield IrSet(left=node.left, right=node.right)
-        else:
-            yield node
-
+def wrap_int(value: int) -> int:
+    """Wraps a value to the 32-bit range of scoreboard scores."""
+    return (value - INT_MIN) % 2**32 + INT_MIN
 
-def discard_non_numerical_casting(
-    nodes: Iterable[IrOperation],
-) -> Iterable[IrOperation]:
-    for node in nodes:
-        if (
-            isinstance(node, IrCast)
-            and isinstance(node.left, IrData)
-            and isinstance(node.right, IrData)
-            and node.scale == 1
-            and not is_numeric_type(unwrap_optional_type(node.cast_type))
-        ):
-            yield IrSet(left=node.left, right=node.right)
-        else:
-            yield node
 
+def score_literal(node: Any) -> int | None:
+    """Returns the value of an integer literal that fits in a score."""
+    if not isinstance(node, IrLiteral):
+        return None
 
-def set_to_self_removal(nodes: Iterable[IrOperation]):
-    """Removes Set operations that have the same former and latter source.
-    Should run after "output_score_replacement" is applied to clean up
-    all the reduntant Sets created by the previous rule.
-    """
-    for node in nodes:
-        if is_copy_op(node):
-            if (
-                not isinstance(node.right, IrSource)
-                or type(node.left) is not type(node.right)
-                or node.left.to_tuple() != node.right.to_tuple()
-            ):
-                yield node
-        else:
-            yield node
+    value = node.value
 
+    if not isinstance(value, (Byte, Short, Int)) or not INT_MIN <= value <= INT_MAX:
+        return None
 
-def literal_to_constant_replacement(
-    opt: Optimizer,
-    nodes: Iterable[IrOperation],
-) -> Iterable[IrOperation]:
-    for node in nodes:
-        if (
-            is_binary(node, ("mul", "div", "min", "max", "mod"))
-            and isinstance(node.right, IrLiteral)
-            and isinstance(node.right.value, Numeric)
-        ):
-            value = int(node.right.value)
-            constant = opt.generate_const(value)
+    return int(value)
 
-            yield replace(node, right=constant)
-        else:
-            yield node
 
+def fold_score_operation(op: str, left: int, right: int) -> int | None:
+    """Computes a scoreboard operation the same way the game does.
 
-def set_and_get_cleanup(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
-    """
-    Removes unnecessary temp vars possibly originated from previous
-    optimizations.
-    ```
-    scoreboard players operation $i0 bolt.expr.temp = $value obj
-    execute store result storage demo out float 0.01 run scoreboard players get $i0 bolt.expr.temp
-    ```
-    ->
-    ```
-    execute store result storage demo out float 0.01 run scoreboard players get $value obj
-    ```
-    Examples to try:
-    >>> temp.out = obj["$value"] / 100
-    >>> temp.out = temp.value * 100 / 100
+    Division and modulo round towards negative infinity like python's `//` and
+    `%`, and dividing by zero makes the command fail.
     """
+    match op:
+        case "add":
+            return wrap_int(left + right)
+        case "sub":
+            return wrap_int(left - right)
+        case "mul":
+            return wrap_int(left * right)
+        case "div" if right:
+            return wrap_int(left // right)
+        case "mod" if right:
+            return left % right
+        case "min":
+            return min(left, right)
+        case "max":
+            return max(left, right)
+        case _:
+            return None
+
+
+def is_same_score(left: Any, right: Any) -> bool:
+    return (
+        isinstance(left, IrScore)
+        and isinstance(right, IrScore)
+        and left.to_tuple() == right.to_tuple()
+    )
 
-    nodes = tuple(nodes)
-    usage = get_source_usage(nodes)
-    definitions = get_source_definitions(nodes)
-
-    operations: list[IrOperation] = []
 
-    for node_i, node in enumerate(nodes):
-        operands: list[OperandType] = []
+def is_score_step(node: Any) -> TypeGuard[IrBinary]:
+    """Plain score operation that can be rewritten freely."""
+    return (
+        is_binary(node, SCORE_OPERATIONS)
+        and type(node) in (IrBinary, IrSet)
+        and isinstance(node.left, IrScore)
+        and not node.store
+    )
 
-        for operand in node.operands:
-            operands.append(operand)
 
-            if not isinstance(operand, IrSource):
-                continue
+def simplify_score_step(node: IrBinary) -> IrBinary | None:
+    """Simplifies a single score operation, returns None if it has no effect."""
+    if is_same_score(node.left, node.right) and not is_selector_holder(
+        node.left.holder
+    ):
+        match node.op:
+            case "sub" | "mod":
+                return IrSet(left=node.left, right=IrLiteral(value=Int(0)))
+            case "set" | "min" | "max":
+                return None
 
-            source = operand.to_tuple()
-            def_i = get_reaching_definition(definitions, source, node_i)
+    value = score_literal(node.right)
 
-            if def_i is None:
-                continue
+    if value is None:
+        return node
 
-            def_node = nodes[def_i]
+    match node.op, value:
+        case ("add" | "sub", 0) | ("mul" | "div", 1):
+            return None
+        case ("mul", 0) | ("mod", 1 | -1):
+            return IrSet(left=node.left, right=IrLiteral(value=Int(0)))
+        case ("add" | "sub", _) if value < 0 and value != INT_MIN:
+            # scoreboard add and remove only accept positive values
+            op = "sub" if node.op == "add" else "add"
+            return replace(node, op=op, right=IrLiteral(value=Int(-value)))
 
-            if (
-                not isinstance(def_node, (IrSet, IrCast))
-                or not isinstance(def_node.right, IrSource)
-                or def_node.left.to_tuple() != source
-                or operand in node.targets
-            ):
-                continue
+    return node
 
-            if isinstance(def_node, IrCast) and (
-                def_node.scale != 1.0
-                or not isinstance(def_node.left, IrScore)
-                or not isinstance(node, (IrSet, IrCast))
-            ):
-                continue
 
-            if any(
-                def_i < use_i < node_i
-                for use_i in get_source_usage_of_parent(usage, source)
-            ):
-                continue
+def merge_score_steps(first: IrBinary, second: IrBinary) -> IrBinary | None:
+    """Combines two consecutive operations on the same score, or returns None."""
+    if not is_same_score(first.left, second.left):
+        return None
 
-            operands[-1] = def_node.right
+    if (
+        second.op == "set"
+        and isinstance(second.right, (IrLiteral, IrScore))
+        and not is_same_score(second.left, second.right)
+    ):
+        return second
 
-        operations.append(replace_operation(node, operands=operands))
+    if (
+        first.op == "set"
+        and second.op in ("min", "max")
+        and is_same_score(first.right, second.right)
+        and not is_selector_holder(second.right.holder)
+    ):
+        # min(x, x) and max(x, x) are just x
+        return first
 
-    yield from convert_cast(operations)
+    first_value = score_literal(first.right)
+    value = score_literal(second.right)
 
+    if first_value is None or value is None:
+        return None
 
-def rename_temp_scores(
-    opt: Optimizer,
-    nodes: Iterable[IrOperation],
-) -> Iterable[IrOperation]:
-    nodes = tuple(nodes)
+    match first.op, second.op:
+        case "set", _:
+            result = fold_score_operation(second.op, first_value, value)
 
-    ignored_sources: set[IrSource] = set()
+        case "add" | "sub", "add" | "sub":
+            if first.op == "sub":
+                first_value = -first_value
+            if second.op == "sub":
+                value = -value
 
-    defs = get_source_definitions(nodes, ignore_parent=True, ignore_children=True)
-    for i, node in enumerate(nodes):
-        for source in get_node_operand_dependencies(node):
-            source_defs = defs.get(source.to_tuple(), [])
+            result = wrap_int(first_value + value)
 
-            if not any(def_i < i for def_i in source_defs):
-                ignored_sources.add(source)
+            if result == INT_MIN:
+                return None
 
-    with (
-        opt.temp_score.override(
-            format=lambda n: f"{opt.temp_score.prefix}i{n}", reset=True
-        ),
-        opt.temp_data.override(format=lambda n: f"i{n}", reset=True),
-    ):
-        replace_map: dict[SourceTuple, IrSource] = {}
+            return IrBinary(
+                op="add", left=first.left, right=IrLiteral(value=Int(result))
+            )
 
-        def map_source(node: IrSource) -> IrSource:
-            if node in ignored_sources:
-                return node
+        case "mul", "mul":
+            result = wrap_int(first_value * value)
 
-            replaced_node = replace_source(node, replace_map)
+        case "div", "div" if first_value > 0 and value > 0:
+            # floor(floor(x / a) / b) == floor(x / (a * b)) for positive divisors
+            result = first_value * value
 
-            if replaced_node != node:
-                return replaced_node
+            if result > INT_MAX:
+                return None
 
-            if not opt.is_temp(node):
-                return node
+        case ("min", "min") | ("max", "max"):
+            result = fold_score_operation(first.op, first_value, value)
 
-            node_tuple = node.to_tuple()
+        case _:
+            return None
 
-            if isinstance(node, IrScore):
-                replace_map[node_tuple] = opt.generate_score()
-            elif isinstance(node, IrData):
-                replace_map[node_tuple] = opt.generate_data()
-            else:
-                replace_map[node_tuple] = node
+    if result is None:
+        return None
 
-            return replace_map[node_tuple]
+    return replace(first, right=IrLiteral(value=Int(result)))
 
-        nodes = [map_node_sources(node, map_source) for node in nodes]
 
-    yield from nodes
+def count_score_references(nodes: Iterable[IrOperation]) -> Counter[ScoreTuple]:
+    references: Counter[ScoreTuple] = Counter()
 
+    def visit(source: IrSource) -> IrSource:
+        if isinstance(source, IrScore):
+            references[source.to_tuple()] += 1
+        return source
 
-def data_string_propagation(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
-    all_nodes = tuple(nodes)
-    defs = get_source_definitions(all_nodes)
+    for node in nodes:
+        map_node_sources(node, visit)
 
-    for i, node in enumerate(all_nodes):
-        if not is_binary(
-            node, ("append", "prepend", "merge", "insert", "set")
-        ) or not isinstance(node.right, IrSource):
-            yield node
-            continue
+    return references
 
-        cond_def_i = get_reaching_definition(defs, node.right.to_tuple(), i)
-        if cond_def_i is None:
-            yield node
-            continue
 
-        cond_def = all_nodes[cond_def_i]
+def replace_references(
+    references: Counter[ScoreTuple],
+    old: Iterable[IrOperation],
+    new: IrOperation | None,
+):
+    references.subtract(count_score_references(old))
+    if new is not None:
+        references.update(count_score_references((new,)))
 
-        if (
-            is_binary(cond_def, "set")
-            and isinstance(cond_def.right, IrDataString)
-            and cond_def.left.to_tuple() == node.right.to_tuple()
-        ):
-            yield replace(node, right=cond_def.right)
-            continue
 
-        yield node
+def coalesce_temp_copy(
+    steps: list[IrOperation],
+    node: IrOperation,
+    references: Counter[ScoreTuple],
+    opt: Optimizer,
+) -> bool:
+    """Computes a temporary directly into the score it gets copied to.
 
+    The trailing steps computing the temporary are renamed when the copy is the
+    only other reference to it.
+    """
+    if not (
+        is_score_step(node)
+        and node.op == "set"
+        and isinstance(node.right, IrScore)
+        and opt.is_temp(node.right)
+        and not is_same_score(node.left, node.right)
+    ):
+        return False
 
-def negate_condition(node: IrCondition):
-    if is_unary_condition(node, "not"):
-        return IrUnaryCondition(op="truthy", target=node.target)
+    temp = node.right
+    start = len(steps)
 
-    return replace(node, negated=not node.negated)
+    while start and is_score_step(steps[start - 1]):
+        if not is_same_score(steps[start - 1].left, temp):
+            break
+        start -= 1
 
+    run = cast(list[IrBinary], steps[start:])
 
-def boolean_condition_propagation(
-    nodes: Iterable[IrOperation],
-) -> Iterable[IrOperation]:
-    all_nodes = list(nodes)
-    defs = get_source_definitions(all_nodes)
+    if not run or run[0].op != "set" or is_same_score(run[0].right, temp):
+        return False
 
-    for i, node in enumerate(all_nodes):
-        if is_binary(node, "set") and is_unary_condition(node.right, "boolean"):
-            bool_cond = node.right
+    count = 1
 
-            cond_def_i = get_reaching_definition(defs, bool_cond.target.to_tuple(), i)
-            if cond_def_i is None:
-                continue
+    for step in run:
+        if not isinstance(step.right, (IrLiteral, IrScore)):
+            return False
+        if is_same_score(step.right, node.left):
+            return False
 
-            cond_node = all_nodes[cond_def_i]
+        count += 1 + is_same_score(step.right, temp)
 
-            if (
-                is_binary(cond_node, "set")
-                and is_condition(cond_node.right)
-                and cond_node.left.to_tuple() == bool_cond.target.to_tuple()
-            ):
-                right = (
-                    negate_condition(cond_node.right)
-                    if bool_cond.negated
-                    else cond_node.right
-                )
-                all_nodes[i] = replace(node, right=right)
+    if references[temp.to_tuple()] != count:
+        return False
 
-    yield from all_nodes
+    steps[start:] = [
+        replace(
+            step,
+            left=node.left,
+            right=node.left if is_same_score(step.right, temp) else step.right,
+        )
+        for step in run
+    ]
 
+    references[temp.to_tuple()] = 0
+    references[node.left.to_tuple()] += count - 2
 
-def branch_condition_propagation(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
-    all_nodes = tuple(nodes)
-    defs = get_source_definitions(all_nodes)
+    return True
 
-    for i, node in enumerate(all_nodes):
-        if not is_unary(node, "branch") or not isinstance(node.target, IrSource):
-            yield node
-            continue
 
-        cond_def_i = get_reaching_definition(defs, node.target.to_tuple(), i)
-        if cond_def_i is None:
-            yield node
+def algebraic_simplification(
+    nodes: Iterable[IrOperation], opt: Optimizer
+) -> Iterable[IrOperation]:
+    """Folds and simplifies consecutive integer operations on the same score.
+    ```
+    scoreboard players operation $i0 temp = $x obj
+    scoreboard players add $i0 temp 3
+    scoreboard players remove $i0 temp 1
+    scoreboard players operation $i0 temp *= $2 const
+    scoreboard players operation $i0 temp *= $5 const
+    ```
+    Becomes:
+    ```
+    scoreboard players operation $i0 temp = $x obj
+    scoreboard players add $i0 temp 2
+    scoreboard players operation $i0 temp *= $10 const
+    ```
+
+    Literals are folded into `set` operations and `x * 0` becomes `x = 0`.
+    Unless `x` is a selector, `x - x` becomes `x = 0` and `min(x, x)` becomes
+    `x`. Results wrap around like 32-bit scores and division and modulo round
+    towards negative infinity. Temporaries that are only copied into another
+    score are computed in place so that the steps of chained operations end up
+    next to each other.
+
+    Examples to try:
+    >>> abc["@s"] = (abc["#x"] + 3) - 1     # doctest: +SKIP
+    >>> abc["@s"] = abc["#x"] * 2 * 5       # doctest: +SKIP
+    """
+
+    nodes = tuple(nodes)
+    references = count_score_references(nodes)
+
+    simplified: list[IrOperation] = []
+
+    for node in nodes:
+        if coalesce_temp_copy(simplified, node, references, opt):
+            continue
+
+        if not is_score_step(node):
+            simplified.append(node)
+            continue
+
+        pending = simplify_score_step(node)
+        replace_references(references, (node,), pending)
+
+        while pending is not None and simplified and is_score_step(simplified[-1]):
+            merged = merge_score_steps(simplified[-1], pending)
+
+            if merged is None:
+                break
+
+            previous = simplified.pop()
+            merged = simplify_score_step(merged)
+            replace_references(references, (previous, pending), merged)
+            pending = merged
+
+        if pending is not None:
+            simplified.append(pending)
+
+    yield from simplified
+
+
+def is_selector_holder(holder: str) -> bool:
+    """Selectors and wildcards can refer to several holders at once."""
+    return holder.startswith(("@", "*"))
+
+
+RANDOM_SORT_REGEX = re.compile(r"sort\s*=\s*random")
+
+
+def is_random_selector(holder: str) -> bool:
+    """Random selectors can match a different entity every time they are read."""
+    return holder.startswith("@r") or RANDOM_SORT_REGEX.search(holder) is not None
+
+
+def reads_random_selector(source: Any) -> bool:
+    if isinstance(source, IrScore):
+        return is_random_selector(source.holder)
+    if isinstance(source, IrData) and source.type == "entity":
+        return is_random_selector(str(source.target))
+    return False
+
+
+def is_entity_holder(holder: str) -> bool:
+    """Player names and uuids are the only holders a selector can match."""
+    return re.fullmatch(r"[\w-]+", holder) is not None
+
+
+def selector_may_match(selector: str, holder: str) -> bool:
+    """Checks whether writing to a selector or wildcard can modify the holder.
+
+    `*` targets every holder of the objective, fake players included.
+    """
+    if selector.startswith("*"):
+        return True
+
+    return is_entity_holder(holder)
+
+
+def holders_may_alias(first: str, second: str) -> bool:
+    """Checks whether two score holders of an objective can share a score."""
+    if first == second:
+        return True
+    if is_selector_holder(first) and is_selector_holder(second):
+        return True
+    if is_selector_holder(first):
+        return selector_may_match(first, second)
+    if is_selector_holder(second):
+        return selector_may_match(second, first)
+    return False
+
+
+def paths_may_alias(tracked: Path, written: Path) -> bool:
+    """Checks whether writing a path can modify a path made of named keys."""
+    for tracked_accessor, written_accessor in zip(
+        path_accessors(tracked), path_accessors(written), strict=False
+    ):
+        if not isinstance(written_accessor, NamedKey):
+            return True
+        if tracked_accessor != written_accessor:
+            return False
+
+    return True
+
+
+@dataclass
+class KnownValues:
+    """Integer values of the sources written by the previous expressions.
+
+    Only scores of named holders and storage paths made of named keys are tracked
+    since they can only be modified by the commands of the function. Writing to a
+    selector forgets the scores of the players and entities of the objective,
+    writing to `*` forgets every score of the objective, and writing to a storage
+    path forgets the parent and child paths.
+    """
+
+    values: dict[SourceTuple, IrLiteral] = field(default_factory=dict)
+
+    def clear(self):
+        self.values.clear()
+
+    def discard(self, sources: Iterable[SourceTuple]):
+        for source in sources:
+            self.values.pop(source, None)
+
+    def lookup(self, source: Any) -> IrLiteral | None:
+        if isinstance(source, IrScore):
+            return self.values.get(source.to_tuple())
+
+        if not self.is_tracked_data(source):
+            return None
+
+        literal = self.values.get(source.to_tuple())
+
+        if literal is None or not self.matches_type(source, literal):
+            return None
+
+        return literal
+
+    def is_tracked_data(self, source: Any) -> TypeGuard[IrData]:
+        return (
+            type(source) is IrData
+            and source.type == "storage"
+            and source.scale in (None, 1)
+            and all(isinstance(ac, NamedKey) for ac in path_accessors(source.path))
+        )
+
+    def matches_type(self, source: IrData, literal: IrLiteral) -> bool:
+        nbt_type = unwrap_optional_type(source.nbt_type)
+        return nbt_type is Any or nbt_type is type(literal.value)
+
+    def invalidate(self, target: IrSource):
+        if isinstance(target, IrScore):
+            if not is_selector_holder(target.holder):
+                self.values.pop(target.to_tuple(), None)
+                return
+
+            for source in list(self.values):
+                if (
+                    isinstance(source, ScoreTuple)
+                    and source.obj == target.obj
+                    and selector_may_match(target.holder, source.holder)
+                ):
+                    del self.values[source]
+
+        elif isinstance(target, IrData) and target.type == "storage":
+            for source in list(self.values):
+                if (
+                    isinstance(source, DataTuple)
+                    and source.target == target.target
+                    and paths_may_alias(source.path, target.path)
+                ):
+                    del self.values[source]
+
+    def substitute(self, node: IrOperation) -> IrOperation:
+        """Replaces the operand and folds the operation if their values are known."""
+        if not is_binary(node) or type(node) not in (IrBinary, IrSet, IrCast):
+            return node
+
+        if node.store or (isinstance(node, IrCast) and not is_copy_op(node)):
+            return node
+
+        if isinstance(node.left, IrData) and not (
+            node.op in ("set", "cast")
+            and unwrap_optional_type(node.left.nbt_type) is Any
+        ):
+            return node
+
+        if isinstance(node.right, IrSource) and (
+            node.left.to_tuple() == node.right.to_tuple()
+        ):
+            return node
+
+        if literal := self.lookup(node.right):
+            node = replace(node, right=literal)
+
+        if not is_score_step(node) or node.op == "set":
+            return node
+
+        left = score_literal(self.lookup(node.left))
+        right = score_literal(node.right)
+
+        if left is None or right is None:
+            return node
+
+        value = fold_score_operation(node.op, left, right)
+
+        if value is None:
+            return node
+
+        return IrSet(left=node.left, right=IrLiteral(value=Int(value)))
+
+    def update(self, node: IrOperation):
+        """Records the values written by an operation."""
+        if isinstance(node, IrBranch):
+            self.clear()
+            return
+
+        copy = is_copy_op(node) and type(node) in (IrBinary, IrSet, IrCast)
+
+        if (
+            copy
+            and isinstance(node.right, IrSource)
+            and type(node.left) is type(node.right)
+            and not node.store
+            and node.left.to_tuple() == node.right.to_tuple()
+        ):
+            return
+
+        for target in node.targets:
+            self.invalidate(target)
+
+        if not copy or node.store or score_literal(node.right) is None:
+            return
+
+        literal = cast(IrLiteral, node.right)
+
+        if isinstance(node.left, IrScore):
+            if not is_selector_holder(node.left.holder):
+                self.values[node.left.to_tuple()] = literal
+        elif self.is_tracked_data(node.left) and self.matches_type(node.left, literal):
+            self.values[node.left.to_tuple()] = literal
+
+    def propagate(self, nodes: Iterable[IrOperation]) -> tuple[IrOperation, ...]:
+        """Substitutes the known values in the operations and records their writes."""
+        result: list[IrOperation] = []
+
+        for node in nodes:
+            node = self.substitute(node)
+            self.update(node)
+            result.append(node)
+
+        return tuple(result)
+
+
+Interval = tuple[int, int]
+
+NBT_TYPE_RANGES: dict[Any, Interval] = {
+    Byte: (-(2**7), 2**7 - 1),
+    Short: (-(2**15), 2**15 - 1),
+    Int: (INT_MIN, INT_MAX),
+}
+
+
+def checked_interval(values: Iterable[int]) -> Interval | None:
+    """Returns the bounds of the values, or None if a value overflows."""
+    values = tuple(values)
+    low, high = min(values), max(values)
+
+    if low < INT_MIN or high > INT_MAX:
+        return None
+
+    return (low, high)
+
+
+def operation_interval(op: str, left: Interval, right: Interval) -> Interval | None:
+    """Computes the range of a score operation on two ranges."""
+    match op:
+        case "add":
+            return checked_interval((left[0] + right[0], left[1] + right[1]))
+        case "sub":
+            return checked_interval((left[0] - right[1], left[1] - right[0]))
+        case "mul":
+            return checked_interval(a * b for a in left for b in right)
+        case "div" if right[0] > 0 or right[1] < 0:
+            return checked_interval(a // b for a in left for b in right)
+        case "mod" if right[0] > 0:
+            if left[0] >= 0:
+                return (0, min(left[1], right[1] - 1))
+            return (0, right[1] - 1)
+        case "mod" if right[1] < 0:
+            if left[1] <= 0:
+                return (max(left[0], right[0] + 1), 0)
+            return (right[0] + 1, 0)
+        case "min":
+            return (min(left[0], right[0]), min(left[1], right[1]))
+        case "max":
+            return (max(left[0], right[0]), max(left[1], right[1]))
+        case _:
+            return None
+
+
+def decide_comparison(op: str, left: Interval, right: Interval) -> bool | None:
+    """Returns the result of comparing two ranges if it doesn't depend on the values."""
+    match op:
+        case "less_than":
+            always, never = left[1] < right[0], left[0] >= right[1]
+        case "less_than_or_equal_to":
+            always, never = left[1] <= right[0], left[0] > right[1]
+        case "greater_than":
+            always, never = left[0] > right[1], left[1] <= right[0]
+        case "greater_than_or_equal_to":
+            always, never = left[0] >= right[1], left[1] < right[0]
+        case "equal":
+            always = left[0] == left[1] == right[0] == right[1]
+            never = left[1] < right[0] or right[1] < left[0]
+        case _:
+            return None
+
+    return True if always else False if never else None
+
+
+@dataclass
+class IntervalAnalysis:
+    """Ranges of the scores written by a sequence of operations.
+
+    Scores only get a range once they're written, so a score with a range is always
+    defined and conditions on it can't fail because of a missing score.
+    """
+
+    ranges: dict[ScoreTuple, Interval] = field(default_factory=dict)
+
+    def operand(self, node: Any) -> Interval | None:
+        if (value := score_literal(node)) is not None:
+            return (value, value)
+
+        if isinstance(node, IrScore):
+            return self.ranges.get(node.to_tuple())
+
+        return None
+
+    def source(self, node: Any) -> Interval | None:
+        """Range of a value copied into a score."""
+        if isinstance(node, IrCondition):
+            if self.condition(node):
+                return (1, 1)
+            return (0, 1)
+
+        if type(node) is IrData and node.scale in (None, 1):
+            return NBT_TYPE_RANGES.get(unwrap_optional_type(node.nbt_type))
+
+        return self.operand(node)
+
+    def truthiness(self, target: Any) -> bool | None:
+        """Decides a boolean condition on a score."""
+        if not isinstance(target, IrScore) or not (r := self.operand(target)):
+            return None
+
+        if isinstance(target, IrBoolScore):
+            return True if r == (1, 1) else False if not r[0] <= 1 <= r[1] else None
+
+        return False if r == (0, 0) else True if not r[0] <= 0 <= r[1] else None
+
+    def condition(self, node: IrCondition) -> bool | None:
+        """Decides a condition whose result doesn't depend on the runtime values."""
+        if is_unary_condition(node, "boolean"):
+            result = self.truthiness(node.target)
+        elif is_binary_condition(node):
+            left = self.operand(node.left)
+            right = self.operand(node.right)
+
+            if left is None or right is None:
+                return None
+
+            result = decide_comparison(node.op, left, right)
+        else:
+            return None
+
+        if result is None:
+            return None
+
+        return result != node.negated
+
+    def branch(self, node: IrBranch) -> bool | None:
+        """Decides whether a branch always or never runs."""
+        if node.store:
+            return None
+
+        if isinstance(node.target, IrCondition):
+            return self.condition(node.target)
+
+        return self.truthiness(node.target)
+
+    def simplify(self, node: IrOperation) -> IrOperation | None:
+        """Removes operations that can't change the score and folds conditions."""
+        if not is_score_step(node):
+            return node
+
+        if node.op == "set" and isinstance(node.right, IrCondition):
+            # conditions that always pass are kept so branches can still use them
+            if self.condition(node.right) is False:
+                return IrSet(left=node.left, right=IrLiteral(value=Int(0)))
+
+            return node
+
+        right = self.operand(node.right)
+
+        if isinstance(node.right, IrScore) and right and right[0] == right[1]:
+            node = replace(node, right=IrLiteral(value=Int(right[0])))
+
+        left = self.operand(node.left)
+
+        if left is None or right is None:
+            return node
+
+        match node.op:
+            case "min" if left[1] <= right[0]:
+                return None
+            case "max" if left[0] >= right[1]:
+                return None
+            case "min" if left[0] >= right[1]:
+                return IrSet(left=node.left, right=node.right)
+            case "max" if left[1] <= right[0]:
+                return IrSet(left=node.left, right=node.right)
+            case "mod" if left[0] >= 0 and left[1] < right[0]:
+                return None
+            case "mod" if right[1] < left[0] and left[1] <= 0:
+                return None
+            case _:
+                return node
+
+    def update(self, node: IrOperation):
+        """Records the ranges of the scores written by an operation."""
+        if isinstance(node, IrBranch):
+            self.ranges.clear()
+            return
+
+        result: Interval | None = None
+
+        if is_score_step(node):
+            if node.op == "set":
+                result = self.source(node.right)
+            elif right := self.operand(node.right):
+                # the operation creates the score if it doesn't exist yet
+                left = self.operand(node.left) or (INT_MIN, INT_MAX)
+                result = operation_interval(node.op, left, right)
+        elif (
+            isinstance(node, IrCast)
+            and isinstance(node.left, IrScore)
+            and node.scale == 1
+            and not node.store
+        ):
+            result = self.source(node.right)
+
+        for target in node.targets:
+            if isinstance(target, IrScore):
+                self.ranges.pop(target.to_tuple(), None)
+
+        if isinstance(node, IrGetLength):
+            for store in node.store:
+                if isinstance(store.value, IrScore) and store.scale == 1:
+                    self.ranges[store.value.to_tuple()] = (0, INT_MAX)
+
+        if result is not None and is_binary(node) and isinstance(node.left, IrScore):
+            self.ranges[node.left.to_tuple()] = result
+
+
+def interval_analysis(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    """Uses the ranges of scores to remove operations that can't change anything.
+    ```
+    execute store result score #x obj run data get storage demo:main flag
+    scoreboard players operation #x obj > $-200 const
+    scoreboard players operation $i0 temp = #x obj
+    scoreboard players operation $i0 temp %= $10 const
+    execute if score $i0 temp matches 21.. run say never
+    ```
+    Becomes, if `flag` is a byte:
+    ```
+    execute store result score #x obj run data get storage demo:main flag
+    ```
+
+    Ranges come from literals, the numeric type of data sources, conditions and
+    the operations themselves. Redundant `min`, `max` and `%` operations are
+    removed, conditions that always have the same result are folded, branches that
+    can never run are pruned and the body of branches that always run is emitted
+    without its condition.
+
+    Examples to try:
+    >>> obj["#x"] = max(storage.flag[Byte], -200)   # doctest: +SKIP
+    >>> if obj["#x"] % 10 > 20: ...                 # doctest: +SKIP
+    """
+
+    analysis = IntervalAnalysis()
+
+    for node in nodes:
+        if isinstance(node, IrBranch):
+            result = analysis.branch(node)
+
+            if result is False:
+                continue
+
+            analysis.update(node)
+
+            if result:
+                # the children no longer depend on the condition
+                node = replace(node, target=IrLiteral(value=Byte(1)))
+
+            yield node
+            continue
+
+        simplified = analysis.simplify(node)
+
+        if simplified is None:
+            continue
+
+        analysis.update(simplified)
+        yield simplified
+
+
+LoadKey = tuple[DataTuple, Any]
+
+
+def is_data_load(node: Any) -> TypeGuard[IrSet | IrCast]:
+    return (
+        type(node) in (IrSet, IrCast)
+        and isinstance(node.left, IrScore)
+        and type(node.right) is IrData
+        and not node.store
+    )
+
+
+def get_load_scale(node: IrSet | IrCast) -> Any:
+    return node.scale if isinstance(node, IrCast) else 1
+
+
+def is_stable_data_target(data: IrData) -> bool:
+    """Random selectors can pick a different entity every time they are read."""
+    return not (
+        data.type == "entity"
+        and (data.target.startswith("@r") or "sort=random" in data.target)
+    )
+
+
+SELECTOR_SCORES_REGEX = re.compile(r"scores\s*=\s*\{([^}]*)\}")
+
+
+def selector_depends_on_score(target: str, score: IrScore) -> bool:
+    """Checks whether writing to the score can change the entity selected.
+
+    Fake players can't be selected, and predicates can test any score so they
+    depend on every objective.
+    """
+    if not is_selector_holder(score.holder) and not is_entity_holder(score.holder):
+        return False
+
+    if "predicate=" in target:
+        return True
+
+    return any(
+        entry.split("=")[0].strip() == score.obj
+        for match in SELECTOR_SCORES_REGEX.finditer(target)
+        for entry in match.group(1).split(",")
+    )
+
+
+@dataclass
+class AvailableLoads:
+    """Scores that still hold the value of a data path read or written earlier.
+
+    Scores are only recorded for named holders, and only stores to a storage are
+    remembered since the game can reject, clamp or drop the nbt written to entities
+    and blocks. Writing to an entity or a block forgets every path of that kind
+    since different selectors and coordinates can refer to the same one, writing to
+    a storage path forgets the parent and child paths, and writing to a score
+    forgets the entities selected by that objective.
+    """
+
+    opt: Optimizer
+    values: dict[LoadKey, IrScore] = field(default_factory=dict)
+
+    def clear(self):
+        self.values.clear()
+
+    def invalidate(self, target: IrSource):
+        for key, score in list(self.values.items()):
+            data = key[0]
+
+            if isinstance(target, IrScore):
+                overwritten = target.obj == score.obj and (
+                    target.holder == score.holder
+                    or (
+                        is_selector_holder(target.holder)
+                        and selector_may_match(target.holder, score.holder)
+                    )
+                )
+                reselected = data.type == "entity" and selector_depends_on_score(
+                    data.target, target
+                )
+
+                if not overwritten and not reselected:
+                    continue
+
+            elif isinstance(target, IrData):
+                if target.type != data.type:
+                    continue
+                if target.type == "storage" and (
+                    target.target != data.target
+                    or not paths_may_alias(data.path, target.path)
+                ):
+                    continue
+
+            del self.values[key]
+
+    def record(self, data: IrData, scale: Any, score: IrScore):
+        if is_selector_holder(score.holder) or not is_stable_data_target(data):
+            return
+
+        self.values.setdefault((data.to_tuple(), scale), score)
+
+    def record_store(self, data: IrData, score: IrScore):
+        if data.type == "storage":
+            self.record(data, 1, score)
+
+    def substitute(self, node: IrOperation) -> IrOperation | None:
+        """Replaces a load with a copy of the score holding the same value."""
+        if not is_data_load(node):
+            return node
+
+        score = self.values.get((node.right.to_tuple(), get_load_scale(node)))
+
+        if score is None:
+            return node
+
+        if is_same_score(score, node.left):
+            return None
+
+        return IrSet(left=node.left, right=score)
+
+    def update(self, node: IrOperation):
+        if not isinstance(node, (IrBinary, IrUnary)) or isinstance(node, IrBranch):
+            self.clear()
+            return
+
+        if (
+            is_binary(node, "set")
+            and type(node.left) is IrData
+            and type(node.right) is IrData
+            and node.left.to_tuple() == node.right.to_tuple()
+            and not node.store
+        ):
+            return
+
+        for target in node.targets:
+            self.invalidate(target)
+
+        if is_data_load(node):
+            self.record(node.right, get_load_scale(node), node.left)
+
+        elif (
+            type(node) is IrCast
+            and type(node.left) is IrData
+            and isinstance(node.right, IrScore)
+            and node.scale == 1
+            and not node.store
+            and is_lossless_int_store(node, self.opt)
+        ):
+            self.record_store(node.left, node.right)
+
+
+def data_load_forwarding(
+    opt: Optimizer, nodes: Iterable[IrOperation]
+) -> Iterable[IrOperation]:
+    """Reuses the score that already holds the value of a data path.
+    ```
+    execute store result storage demo:main x int 1 run scoreboard players get #x obj
+    execute store result score #a obj run data get storage demo:main x 1
+    execute store result score $i0 temp run data get storage demo:main x 1
+    ```
+    Becomes:
+    ```
+    execute store result storage demo:main x int 1 run scoreboard players get #x obj
+    scoreboard players operation #a obj = #x obj
+    scoreboard players operation $i0 temp = #x obj
+    ```
+
+    A load is replaced as long as neither the score nor any path that can alias
+    the data source was written in between. Scores stored without losing
+    precision are forwarded to the loads that follow.
+    """
+
+    available = AvailableLoads(opt)
+
+    for node in nodes:
+        substituted = available.substitute(node)
+
+        if substituted is None:
+            continue
+
+        available.update(substituted)
+        yield substituted
+
+
+LOSSLESS_INT_TYPES = (Int, Long, Double)
+
+
+def is_lossless_int_store(node: IrCast, opt: Optimizer) -> bool:
+    """Checks that storing a score with the cast keeps its exact value."""
+    cast_type = unwrap_optional_type(node.cast_type)
+
+    if cast_type is Any:
+        cast_type = literal_types.get(opt.default_nbt_type)
+
+    return cast_type in LOSSLESS_INT_TYPES
+
+
+def is_single_holder(holder: str) -> bool:
+    return holder == "@s" or not is_selector_holder(holder)
+
+
+def is_score_copy(node: Any) -> TypeGuard[IrBinary]:
+    return (
+        is_score_step(node)
+        and node.op == "set"
+        and isinstance(node.right, IrScore)
+        and not is_same_score(node.left, node.right)
+    )
+
+
+def is_numeric_temp_store(node: Any, opt: Optimizer) -> TypeGuard[IrCast]:
+    """Score stored in a temporary storage path without losing precision."""
+    return (
+        isinstance(node, IrCast)
+        and type(node.left) is IrData
+        and isinstance(node.right, IrScore)
+        and opt.is_temp(node.left)
+        and node.scale == 1
+        and not node.store
+        and is_lossless_int_store(node, opt)
+    )
+
+
+def lowering_alternatives(
+    steps: list[IrOperation], node: IrOperation
+) -> Iterable[tuple[int, tuple[IrOperation, ...]]]:
+    """Equivalent operations for the node and how many previous steps they replace."""
+    if not is_score_step(node) or not isinstance(node.right, IrLiteral):
+        return
+
+    value = score_literal(node.right)
+    left = node.left
+
+    # a selector can match several holders which would all be added together
+    if node.op == "mul" and value == 2 and is_single_holder(left.holder):
+        yield 0, (IrBinary(op="add", left=left, right=left),)
+
+    if (
+        node.op in ("mul", "div")
+        and value == -1
+        and steps
+        and is_score_copy(previous := steps[-1])
+        and is_same_score(previous.left, left)
+        and is_single_holder(previous.right.holder)
+    ):
+        yield (
+            1,
+            (
+                IrSet(left=left, right=IrLiteral(value=Int(0))),
+                IrBinary(op="sub", left=left, right=previous.right),
+            ),
+        )
+
+
+def forward_numeric_temps(
+    nodes: tuple[IrOperation, ...], opt: Optimizer
+) -> tuple[IrOperation, ...]:
+    """Reads scores directly instead of going through a temporary storage path."""
+    references = Counter(
+        source.to_tuple()
+        for node in nodes
+        for source in (*get_node_operand_dependencies(node), *node.targets)
+    )
+    result = list(nodes)
+    removed: set[int] = set()
+
+    for i, node in enumerate(nodes):
+        if not is_numeric_temp_store(node, opt):
+            continue
+
+        temp, score = node.left, node.right
+
+        if references[temp.to_tuple()] != 2:
+            continue
+
+        for j in range(i + 1, len(nodes)):
+            other = nodes[j]
+
+            if (
+                isinstance(other, IrCast)
+                and type(other.right) is IrData
+                and other.right.to_tuple() == temp.to_tuple()
+                and other.right.scale in (None, 1)
+            ):
+                replacement = replace(other, right=score)
+
+                if opt.costs((replacement,)) < opt.costs((node, other)):
+                    removed.add(i)
+                    result[j] = replacement
+                break
+
+            if any(
+                target.to_tuple() in (temp.to_tuple(), score.to_tuple())
+                for target in other.targets
+            ) or isinstance(other, IrBranch):
+                break
+
+    return tuple(node for i, node in enumerate(result) if i not in removed)
+
+
+def instruction_selection(
+    nodes: Iterable[IrOperation], opt: Optimizer
+) -> Iterable[IrOperation]:
+    """Picks the cheapest equivalent commands according to the cost model.
+    ```
+    scoreboard players operation $i0 temp = $x obj
+    scoreboard players operation $i0 temp *= $-1 const
+    scoreboard players operation $i1 temp *= $2 const
+    ```
+    Becomes:
+    ```
+    scoreboard players set $i0 temp 0
+    scoreboard players operation $i0 temp -= $x obj
+    scoreboard players operation $i1 temp += $i1 temp
+    ```
+
+    Numbers stored in temporary storage paths are also read from the original
+    score when the temporary is only read once.
+
+    Examples to try:
+    >>> obj["#y"] = obj["#x"] * -1      # doctest: +SKIP
+    >>> obj["#y"] = obj["#x"] * 2       # doctest: +SKIP
+    """
+    steps: list[IrOperation] = []
+
+    for node in forward_numeric_temps(tuple(nodes), opt):
+        best: tuple[IrOperation, ...] = (node,)
+        best_replaced = 0
+        best_cost = opt.costs(best)
+
+        for replaced, alternative in lowering_alternatives(steps, node):
+            previous = steps[len(steps) - replaced :] if replaced else []
+            cost = opt.costs(alternative) - opt.costs(previous)
+
+            if cost < best_cost:
+                best, best_replaced, best_cost = alternative, replaced, cost
+
+        if best_replaced:
+            del steps[-best_replaced:]
+
+        steps.extend(best)
+
+    yield from steps
+
+
+def discard_casting(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    for node in nodes:
+        if isinstance(node, IrCast) and is_copy_op(node):
+            yield IrSet(left=node.left, right=node.right)
+        else:
+            yield node
+
+
+def discard_non_numerical_casting(
+    nodes: Iterable[IrOperation],
+) -> Iterable[IrOperation]:
+    for node in nodes:
+        if (
+            isinstance(node, IrCast)
+            and isinstance(node.left, IrData)
+            and isinstance(node.right, IrData)
+            and node.scale == 1
+            and not is_numeric_type(unwrap_optional_type(node.cast_type))
+        ):
+            yield IrSet(left=node.left, right=node.right)
+        else:
+            yield node
+
+
+PURE_SCORE_OPERATIONS = ("set", "add", "sub", "mul", "div", "mod", "min", "max")
+
+
+def is_score_computation_step(node: IrOperation, opt: Optimizer) -> bool:
+    return (
+        is_binary(node, PURE_SCORE_OPERATIONS)
+        and not node.store
+        and isinstance(node.left, IrScore)
+        and opt.is_temp(node.left)
+        and isinstance(node.right, (IrScore, IrLiteral))
+        and node.right != node.left
+    )
+
+
+def get_score_computations(
+    nodes: tuple[IrOperation, ...], opt: Optimizer
+) -> tuple[dict[SourceTuple, list[int]], dict[SourceTuple, set[int]]]:
+    """Collects the temporary scores computed by a chain of pure operations.
+
+    A chain starts with a set and must be complete before the score is read by any
+    other operation. Scores that are modified afterwards are discarded. Returns the
+    chains along with the indices of the operations reading each source.
+    """
+    chains: dict[SourceTuple, list[int]] = {}
+    closed: set[SourceTuple] = set()
+    invalid: set[SourceTuple] = set()
+    reads: dict[SourceTuple, set[int]] = {}
+
+    for i, node in enumerate(nodes):
+        if isinstance(node, IrBranch):
+            invalid.update(chains)
+
+        if is_score_computation_step(node, opt):
+            target = node.left.to_tuple()
+
+            if node.op == "set":
+                if target in chains:
+                    invalid.add(target)
+                chains.setdefault(target, []).append(i)
+            elif target not in chains or target in closed:
+                invalid.add(target)
+            else:
+                chains[target].append(i)
+
+            sources = get_node_operand_dependencies(node.right)
+        else:
+            sources = get_node_operand_dependencies(node)
+            invalid.update(t.to_tuple() for t in node.targets)
+
+        for source in sources:
+            source = source.to_tuple()
+            reads.setdefault(source, set()).add(i)
+            closed.add(source)
+
+    valid = {source: chain for source, chain in chains.items() if source not in invalid}
+    return valid, reads
+
+
+def common_subexpression_elimination(
+    nodes: Iterable[IrOperation], opt: Optimizer
+) -> Iterable[IrOperation]:
+    """
+    Reuses temporary scores holding the result of an identical computation
+    performed earlier, as long as none of the sources involved changed. Writes to
+    selectors and `*` change every score they can match, and computations reading
+    random selectors are never reused.
+    ```
+    scoreboard players operation $i0 bolt.expr.temp = $x obj
+    scoreboard players operation $i0 bolt.expr.temp *= $y obj
+    scoreboard players operation $a obj = $i0 bolt.expr.temp
+    scoreboard players operation $i1 bolt.expr.temp = $x obj
+    scoreboard players operation $i1 bolt.expr.temp *= $y obj
+    scoreboard players operation $b obj = $i1 bolt.expr.temp
+    ```
+    ->
+    ```
+    scoreboard players operation $i0 bolt.expr.temp = $x obj
+    scoreboard players operation $i0 bolt.expr.temp *= $y obj
+    scoreboard players operation $a obj = $i0 bolt.expr.temp
+    scoreboard players operation $b obj = $i0 bolt.expr.temp
+    ```
+    """
+    nodes = tuple(nodes)
+    chains, reads = get_score_computations(nodes, opt)
+
+    if len(chains) < 2:
+        yield from nodes
+        return
+
+    branches = [i for i, node in enumerate(nodes) if isinstance(node, IrBranch)]
+
+    signatures: dict[SourceTuple, Any] = {}
+    leaves: dict[SourceTuple, set[SourceTuple]] = {}
+    starts: dict[SourceTuple, int] = {}
+    weights: dict[SourceTuple, int] = {}
+
+    def analyze(source: SourceTuple):
+        if source in signatures:
+            return
+
+        chain = chains[source]
+        parts: list[Any] = []
+        source_leaves: set[SourceTuple] = set()
+        start = chain[0]
+        weight = len(chain)
+
+        for i in chain:
+            node = cast(IrBinary, nodes[i])
+            operand = node.right
+
+            if isinstance(operand, IrScore) and operand.to_tuple() in chains:
+                inner = operand.to_tuple()
+                analyze(inner)
+                operand = signatures[inner]
+                source_leaves.update(leaves[inner])
+                start = min(start, starts[inner])
+                weight += weights[inner]
+            elif isinstance(operand, IrScore):
+                source_leaves.add(operand.to_tuple())
+
+            parts.append((node.op, operand))
+
+        signatures[source] = tuple(parts)
+        leaves[source] = source_leaves
+        starts[source] = start
+        weights[source] = weight
+
+    def unchanged(previous: SourceTuple, current: SourceTuple) -> bool:
+        start = starts[previous]
+        end = chains[current][-1]
+
+        if any(start < i < end for i in branches):
+            return False
+
+        for leaf in leaves[previous]:
+            if not isinstance(leaf, ScoreTuple):
+                continue
+
+            if is_random_selector(leaf.holder):
+                return False
+
+            for i in range(start + 1, end + 1):
+                if any(
+                    isinstance(target, IrScore)
+                    and target.obj == leaf.obj
+                    and holders_may_alias(target.holder, leaf.holder)
+                    for target in nodes[i].targets
+                ):
+                    return False
+
+        return True
+
+    removed: set[int] = set()
+    replace_map: dict[SourceTuple, IrScore] = {}
+
+    def remove(source: SourceTuple):
+        chain = chains[source]
+        removed.update(chain)
+
+        for i in chain:
+            operand = cast(IrBinary, nodes[i]).right
+
+            if not isinstance(operand, IrScore):
+                continue
+
+            inner = operand.to_tuple()
+
+            if inner in chains and reads.get(inner, set()) <= removed:
+                remove(inner)
+
+    computed: dict[Any, SourceTuple] = {}
+
+    for source in sorted(chains, key=lambda s: chains[s][-1]):
+        analyze(source)
+
+        signature = signatures[source]
+        previous = computed.get(signature)
+
+        if (
+            previous is None
+            or chains[previous][0] in removed
+            or weights[source] < 2
+            or not unchanged(previous, source)
+        ):
+            computed[signature] = source
+            continue
+
+        holder, obj = previous
+        replace_map[source] = IrScore(holder=holder, obj=obj)
+        reads.setdefault(previous, set()).update(reads.get(source, ()))
+        remove(source)
+
+    if not replace_map:
+        yield from nodes
+        return
+
+    for i, node in enumerate(nodes):
+        if i in removed:
+            continue
+
+        yield map_node_sources(
+            node,
+            lambda s: replace_map.get(s.to_tuple(), s),
+        )
+
+
+def set_to_self_removal(nodes: Iterable[IrOperation]):
+    """Removes Set operations that have the same former and latter source.
+    Should run after "output_score_replacement" is applied to clean up
+    all the reduntant Sets created by the previous rule.
+    """
+    for node in nodes:
+        if is_copy_op(node):
+            if (
+                not isinstance(node.right, IrSource)
+                or type(node.left) is not type(node.right)
+                or node.left.to_tuple() != node.right.to_tuple()
+            ):
+                yield node
+        else:
+            yield node
+
+
+def literal_to_constant_replacement(
+    opt: Optimizer,
+    nodes: Iterable[IrOperation],
+) -> Iterable[IrOperation]:
+    for node in nodes:
+        if (
+            is_binary(node, ("mul", "div", "min", "max", "mod"))
+            and isinstance(node.right, IrLiteral)
+            and isinstance(node.right.value, Numeric)
+        ):
+            value = int(node.right.value)
+            constant = opt.generate_const(value)
+
+            yield replace(node, right=constant)
+        else:
+            yield node
+
+
+def set_and_get_cleanup(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    """
+    Removes unnecessary temp vars possibly originated from previous
+    optimizations.
+    ```
+    scoreboard players operation $i0 bolt.expr.temp = $value obj
+    execute store result storage demo out float 0.01 run scoreboard players get $i0 bolt.expr.temp
+    ```
+    ->
+    ```
+    execute store result storage demo out float 0.01 run scoreboard players get $value obj
+    ```
+    Examples to try:
+    >>> temp.out = obj["$value"] / 100
+    >>> temp.out = temp.value * 100 / 100
+    """
+
+    nodes = tuple(nodes)
+    usage = get_source_usage(nodes)
+    definitions = get_source_definitions(nodes)
+
+    operations: list[IrOperation] = []
+
+    for node_i, node in enumerate(nodes):
+        operands: list[OperandType] = []
+
+        for operand in node.operands:
+            operands.append(operand)
+
+            if not isinstance(operand, IrSource):
+                continue
+
+            source = operand.to_tuple()
+            def_i = get_reaching_definition(definitions, source, node_i)
+
+            if def_i is None:
+                continue
+
+            def_node = nodes[def_i]
+
+            if (
+                not isinstance(def_node, (IrSet, IrCast))
+                or not isinstance(def_node.right, IrSource)
+                or def_node.left.to_tuple() != source
+                or operand in node.targets
+            ):
+                continue
+
+            if isinstance(def_node, IrCast) and (
+                def_node.scale != 1.0
+                or not isinstance(def_node.left, IrScore)
+                or not isinstance(node, (IrSet, IrCast))
+            ):
+                continue
+
+            # copying the score is cheaper than reading the data a second time
+            if (
+                isinstance(def_node.left, IrScore)
+                and isinstance(def_node.right, IrData)
+                and isinstance(node.left, IrScore)
+            ):
+                continue
+
+            if any(
+                def_i < use_i < node_i
+                for use_i in get_source_usage_of_parent(usage, source)
+            ):
+                continue
+
+            operands[-1] = def_node.right
+
+        operations.append(replace_operation(node, operands=operands))
+
+    yield from convert_cast(operations)
+
+
+def get_temp_root(opt: Optimizer, source: IrSource) -> SourceTuple | None:
+    """Returns the temporary that the source is stored in, if any."""
+    if isinstance(source, IrData):
+        parents = get_data_source_parents(source)
+    else:
+        parents = (source,)
+
+    for parent in parents:
+        if opt.is_temp(parent):
+            return parent.to_tuple()
+
+    return None
+
+
+def get_temp_live_ranges(
+    opt: Optimizer,
+    nodes: tuple[IrOperation, ...],
+    ignored_sources: set[IrSource],
+) -> dict[SourceTuple, tuple[int, int]]:
+    """Returns the index of the first and last node referencing each temporary.
+
+    Nested operations count as part of their top-level node, and the ranges are
+    ordered by first reference.
+    """
+    ranges: dict[SourceTuple, tuple[int, int]] = {}
+
+    for i, node in enumerate(nodes):
+
+        def visit(source: IrSource, i: int = i) -> IrSource:
+            if source not in ignored_sources and (root := get_temp_root(opt, source)):
+                ranges[root] = (ranges.get(root, (i, i))[0], i)
+
+            return source
+
+        map_node_sources(node, visit)
+
+    return ranges
+
+
+def allocate_temporaries(
+    ranges: dict[SourceTuple, tuple[int, int]],
+    generate: Callable[[], IrSource],
+) -> dict[SourceTuple, IrSource]:
+    """Assigns slots to temporaries with a linear scan over their live ranges.
+
+    A slot is handed to the next temporary once the last node referencing its
+    current occupant has been passed, so values that are never alive at the
+    same time share the same fake player or storage key.
+    """
+    slots: list[IrSource] = []
+    slot_ends: list[int] = []
+    allocation: dict[SourceTuple, IrSource] = {}
+
+    for source, (start, end) in ranges.items():
+        index = next((n for n, last in enumerate(slot_ends) if last < start), None)
+
+        if index is None:
+            index = len(slots)
+            slots.append(generate())
+            slot_ends.append(end)
+
+        slot_ends[index] = end
+        allocation[source] = slots[index]
+
+    return allocation
+
+
+def rename_temp_scores(
+    opt: Optimizer,
+    nodes: Iterable[IrOperation],
+) -> Iterable[IrOperation]:
+    nodes = tuple(nodes)
+
+    ignored_sources: set[IrSource] = set()
+
+    defs = get_source_definitions(nodes, ignore_parent=True, ignore_children=True)
+    for i, node in enumerate(nodes):
+        for source in get_node_operand_dependencies(node):
+            # child paths are defined by writing to any of their parents
+            parents = (
+                get_data_source_parents(source)
+                if isinstance(source, IrData)
+                else (source,)
+            )
+            source_defs = [
+                def_i for parent in parents for def_i in defs.get(parent.to_tuple(), [])
+            ]
+
+            if not any(def_i < i for def_i in source_defs):
+                ignored_sources.add(source)
+
+    ranges = get_temp_live_ranges(opt, nodes, ignored_sources)
+
+    with (
+        opt.temp_score.override(
+            format=lambda n: f"{opt.temp_score.prefix}i{n}", reset=True
+        ),
+        opt.temp_data.override(
+            format=lambda n: f"{opt.temp_root}.i{n}" if opt.temp_root else f"i{n}",
+            reset=True,
+        ),
+    ):
+        # scores and storage temporaries are allocated from separate pools
+        replace_map: dict[SourceTuple, IrSource] = {
+            **allocate_temporaries(
+                {k: v for k, v in ranges.items() if isinstance(k, ScoreTuple)},
+                opt.generate_score,
+            ),
+            **allocate_temporaries(
+                {k: v for k, v in ranges.items() if isinstance(k, DataTuple)},
+                opt.generate_data,
+            ),
+        }
+
+        def map_source(node: IrSource) -> IrSource:
+            if node in ignored_sources:
+                return node
+
+            return replace_source(node, replace_map)
+
+        nodes = [map_node_sources(node, map_source) for node in nodes]
+
+    opt.allocated_temps = tuple(dict.fromkeys(replace_map.values()))
+
+    yield from nodes
+
+
+def temp_cleanup(opt: Optimizer, nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    """Resets the temporaries once the operations are done with them.
+    ```
+    scoreboard players operation $i0 bolt.expr.temp = #x obj
+    execute store result storage bolt.expr:temp 2384k242hd495.i0 int 1 run ...
+    ```
+    Becomes, with the `temp_hygiene` option:
+    ```
+    scoreboard players operation $i0 bolt.expr.temp = #x obj
+    execute store result storage bolt.expr:temp 2384k242hd495.i0 int 1 run ...
+    scoreboard players reset $i0 bolt.expr.temp
+    data remove storage bolt.expr:temp 2384k242hd495
+    ```
+
+    Storage temporaries nested in the compound of the function are removed all at
+    once, so the scoreboard and the storage don't keep every temporary around.
+    """
+
+    yield from nodes
+
+    if opt.temp_hygiene:
+        yield from get_temp_cleanup(opt, opt.allocated_temps)
+
+
+def get_temp_cleanup(
+    opt: Optimizer, temporaries: Iterable[IrSource]
+) -> list[IrOperation]:
+    """Returns the operations resetting the scores and removing the storage roots."""
+    resets: list[IrOperation] = []
+    roots: dict[SourceTuple, IrData] = {}
+
+    for slot in temporaries:
+        if isinstance(slot, IrScore):
+            resets.append(IrUnary(op="reset", target=slot))
+        elif isinstance(slot, IrData):
+            if opt.temp_root:
+                slot = replace(slot, path=Path(opt.temp_root))
+            roots.setdefault(slot.to_tuple(), slot)
+
+    return resets + [IrUnary(op="remove", target=root) for root in roots.values()]
+
+
+def data_string_propagation(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    all_nodes = tuple(nodes)
+    defs = get_source_definitions(all_nodes)
+
+    for i, node in enumerate(all_nodes):
+        if not is_binary(
+            node, ("append", "prepend", "merge", "insert", "set")
+        ) or not isinstance(node.right, IrSource):
+            yield node
+            continue
+
+        cond_def_i = get_reaching_definition(defs, node.right.to_tuple(), i)
+        if cond_def_i is None:
+            yield node
+            continue
+
+        cond_def = all_nodes[cond_def_i]
+
+        if (
+            is_binary(cond_def, "set")
+            and isinstance(cond_def.right, IrDataString)
+            and cond_def.left.to_tuple() == node.right.to_tuple()
+        ):
+            yield replace(node, right=cond_def.right)
+            continue
+
+        yield node
+
+
+def negate_condition(node: IrCondition):
+    if is_unary_condition(node, "not"):
+        return IrUnaryCondition(op="truthy", target=node.target)
+
+    return replace(node, negated=not node.negated)
+
+
+def boolean_condition_propagation(
+    nodes: Iterable[IrOperation],
+) -> Iterable[IrOperation]:
+    all_nodes = list(nodes)
+    defs = get_source_definitions(all_nodes)
+
+    for i, node in enumerate(all_nodes):
+        if is_binary(node, "set") and is_unary_condition(node.right, "boolean"):
+            bool_cond = node.right
+
+            cond_def_i = get_reaching_definition(defs, bool_cond.target.to_tuple(), i)
+            if cond_def_i is None:
+                continue
+
+            cond_node = all_nodes[cond_def_i]
+
+            if (
+                is_binary(cond_node, "set")
+                and is_condition(cond_node.right)
+                and cond_node.left.to_tuple() == bool_cond.target.to_tuple()
+            ):
+                right = (
+                    negate_condition(cond_node.right)
+                    if bool_cond.negated
+                    else cond_node.right
+                )
+                all_nodes[i] = replace(node, right=right)
+
+    yield from all_nodes
+
+
+def branch_condition_propagation(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    all_nodes = tuple(nodes)
+    defs = get_source_definitions(all_nodes)
+
+    for i, node in enumerate(all_nodes):
+        if not is_unary(node, "branch") or not isinstance(node.target, IrSource):
+            yield node
+            continue
+
+        cond_def_i = get_reaching_definition(defs, node.target.to_tuple(), i)
+        if cond_def_i is None:
+            yield node
             continue
 
         cond_def = all_nodes[cond_def_i]
@@ -1599,8 +3206,343 @@ def branch_condition_propagation(nodes: Iterable[IrOperation]) -> Iterable[IrOpe
         yield node
 
 
+SiblingKey = tuple[str, str, Path]
+
+
+def is_literal_sibling_write(node: Any) -> TypeGuard[IrSet]:
+    """Literal written to a named key that a merge on the parent can set as well.
+
+    Compounds are left out since merging them would keep the existing keys.
+    """
+    if not (
+        type(node) is IrSet
+        and type(node.left) is IrData
+        and isinstance(node.right, IrLiteral)
+        and not isinstance(node.right.value, Compound)
+        and not node.store
+    ):
+        return False
+
+    accessors = path_accessors(node.left.path)
+
+    return bool(accessors) and all(isinstance(ac, NamedKey) for ac in accessors)
+
+
+def get_sibling_writes(key: SiblingKey, node: IrOperation) -> set[str] | None:
+    """Returns the keys of the compound the node writes to without reading them.
+
+    Returns None if the node reads the compound or modifies it in any other way.
+    """
+    data_type, target, parent = key
+    parent_accessors = path_accessors(parent)
+    targets = [source.to_tuple() for source in node.targets]
+    sources: list[IrData] = []
+
+    def collect(source: IrSource) -> IrSource:
+        if isinstance(source, IrData) and source.type == data_type:
+            sources.append(source)
+
+        return source
+
+    map_node_sources(node, collect)
+
+    written: set[str] = set()
+
+    for source in sources:
+        if data_type == "storage" and (
+            source.target != target
+            or not (
+                paths_may_alias(parent, source.path)
+                or paths_may_alias(source.path, parent)
+            )
+        ):
+            continue
+
+        accessors = path_accessors(source.path)
+
+        if (
+            source.target != target
+            or source.to_tuple() not in targets
+            or sources.count(source) > 1
+            or len(accessors) != len(parent_accessors) + 1
+            or accessors[:-1] != parent_accessors
+            or not isinstance(accessors[-1], NamedKey)
+        ):
+            return None
+
+        written.add(accessors[-1].key)
+
+    return written
+
+
+def sibling_write_merging(nodes: Iterable[IrOperation]) -> Iterable[IrOperation]:
+    """Merges literal writes to the keys of the same compound.
+    ```
+    data modify storage demo:main a.x set value 1
+    execute store result storage demo:main a.s int 1 run scoreboard players get #x obj
+    data modify storage demo:main a.y set value "s"
+    data modify entity @s Fire set value 20
+    data modify entity @s NoGravity set value 1b
+    ```
+    Becomes:
+    ```
+    data modify storage demo:main a merge value {x: 1, y: "s"}
+    execute store result storage demo:main a.s int 1 run scoreboard players get #x obj
+    data merge entity @s {Fire: 20, NoGravity: 1b}
+    ```
+
+    Writes are moved up to the first one as long as nothing in between reads the
+    compound. Other writes to its keys stay in place and stop the literal writes
+    to the same key from moving before them. Data of other entities or blocks in
+    between stops the merge since different selectors or coordinates can refer
+    to the same target.
+    """
+
+    result: list[IrOperation | None] = []
+    groups: dict[SiblingKey, tuple[int, list[IrSet], set[str]]] = {}
+
+    def close(key: SiblingKey):
+        index, writes, _ = groups.pop(key)
+
+        if len(writes) == 1:
+            result[index] = writes[0]
+            return
+
+        _, _, parent = key
+        value = Compound(
+            {
+                cast(NamedKey, path_accessors(write.left.path)[-1]).key: cast(
+                    IrLiteral, write.right
+                ).value
+                for write in writes
+            }
+        )
+        result[index] = IrBinary(
+            op="merge",
+            left=replace(writes[0].left, path=parent, nbt_type=Any),
+            right=IrLiteral(value=value),
+        )
+
+    for node in nodes:
+        if not isinstance(node, (IrBinary, IrUnary)) or isinstance(node, IrBranch):
+            for key in list(groups):
+                close(key)
+
+            result.append(node)
+            continue
+
+        key: SiblingKey | None = None
+
+        if is_literal_sibling_write(node):
+            accessors = path_accessors(node.left.path)
+            key = (
+                node.left.type,
+                node.left.target,
+                Path.from_accessors(accessors[:-1]),  # type: ignore
+            )
+
+            if key in groups and accessors[-1].key in groups[key][2]:
+                close(key)
+
+        for other in list(groups):
+            if other == key:
+                continue
+
+            if (written := get_sibling_writes(other, node)) is None:
+                close(other)
+            else:
+                groups[other][2].update(written)
+
+        if key is None:
+            result.append(node)
+        elif key in groups:
+            groups[key][1].append(cast(IrSet, node))
+        else:
+            groups[key] = (len(result), [cast(IrSet, node)], set())
+            result.append(None)
+
+    for key in list(groups):
+        close(key)
+
+    yield from (node for node in result if node is not None)
+
+
+def entity_read_prefix(sources: Iterable[IrData]) -> Path:
+    """Returns the longest path made of named keys shared by the sources."""
+    paths = [path_accessors(source.path) for source in sources]
+    prefix: list[Accessor] = []
+
+    for accessors in zip(*paths, strict=False):
+        first = accessors[0]
+
+        if not isinstance(first, NamedKey) or any(ac != first for ac in accessors):
+            break
+
+        prefix.append(first)
+
+    return Path.from_accessors(tuple(prefix))  # type: ignore
+
+
+def redirect_entity_read(
+    source: IrSource, target: str, snapshot: IrData, prefix_length: int
+) -> IrSource:
+    """Reads the path of the entity from the snapshot instead."""
+    if not (
+        type(source) is IrData and source.type == "entity" and source.target == target
+    ):
+        return source
+
+    path = path_accessors(snapshot.path)
+    path += path_accessors(source.path)[prefix_length:]
+
+    return replace(
+        snapshot,
+        path=Path.from_accessors(path),  # type: ignore
+        nbt_type=source.nbt_type,
+        scale=source.scale,
+    )
+
+
+def snapshot_entity_reads(
+    opt: Optimizer, nodes: list[IrOperation]
+) -> list[IrOperation]:
+    reads: dict[str, list[IrData]] = {}
+
+    def collect(source: IrSource) -> IrSource:
+        if (
+            type(source) is IrData
+            and source.type == "entity"
+            and is_stable_data_target(source)
+        ):
+            reads.setdefault(source.target, []).append(source)
+
+        return source
+
+    for node in nodes:
+        map_node_sources(node, collect)
+
+    for target, sources in reads.items():
+        if len(sources) < 2:
+            continue
+
+        prefix = entity_read_prefix(sources)
+        prefix_length = len(path_accessors(prefix))
+        snapshot = opt.generate_data()
+
+        redirect = partial(
+            redirect_entity_read,
+            target=target,
+            snapshot=snapshot,
+            prefix_length=prefix_length,
+        )
+
+        rewritten: list[IrOperation] = []
+        copied = False
+
+        for node in nodes:
+            new_node = map_node_sources(node, redirect)
+
+            if not copied and new_node != node:
+                # resetting the snapshot first makes the reads fail like the
+                # original ones if the entity doesn't exist
+                rewritten.append(
+                    IrSet(left=snapshot, right=IrLiteral(value=Compound()))
+                )
+                rewritten.append(
+                    IrSet(
+                        left=snapshot,
+                        right=IrData(type="entity", target=target, path=prefix),
+                    )
+                )
+                copied = True
+
+            rewritten.append(new_node)
+
+        if opt.costs(rewritten) < opt.costs(nodes):
+            nodes = rewritten
+
+    return nodes
+
+
+def entity_snapshot_batching(
+    opt: Optimizer, nodes: Iterable[IrOperation]
+) -> Iterable[IrOperation]:
+    """Copies entity nbt to storage once when it's read several times.
+    ```
+    execute store result score #x obj run data get entity @s Pos[0] 1
+    execute store result score #y obj run data get entity @s Pos[1] 1
+    execute store result score #z obj run data get entity @s Pos[2] 1
+    ```
+    Becomes:
+    ```
+    data modify storage bolt.expr:temp i0 set value {}
+    data modify storage bolt.expr:temp i0 set from entity @s Pos
+    execute store result score #x obj run data get storage bolt.expr:temp i0[0] 1
+    execute store result score #y obj run data get storage bolt.expr:temp i0[1] 1
+    execute store result score #z obj run data get storage bolt.expr:temp i0[2] 1
+    ```
+
+    Reading entity nbt serializes the whole entity, so the reads of a target
+    between two writes to entities are redirected to a copy of their longest
+    common path when the cost model says the copy pays off. Writing to an objective
+    a selector filters on also starts a new copy since the selector can then match
+    another entity.
+    """
+
+    nodes = tuple(nodes)
+    result: list[IrOperation] = []
+    reads: list[IrOperation] = []
+    selectors: set[str] = set()
+
+    def collect(source: IrSource) -> IrSource:
+        if type(source) is IrData and source.type == "entity":
+            selectors.add(source.target)
+        return source
+
+    for node in nodes:
+        map_node_sources(node, collect)
+
+    def changes_entities(target: IrSource) -> bool:
+        if isinstance(target, IrData):
+            return target.type == "entity"
+        if isinstance(target, IrScore):
+            return any(selector_depends_on_score(s, target) for s in selectors)
+        return False
+
+    for node in nodes:
+        if (
+            not isinstance(node, (IrBinary, IrUnary))
+            or isinstance(node, IrBranch)
+            or any(changes_entities(target) for target in node.targets)
+        ):
+            result.extend(snapshot_entity_reads(opt, reads))
+            result.append(node)
+            reads = []
+        else:
+            reads.append(node)
+
+    result.extend(snapshot_entity_reads(opt, reads))
+
+    yield from result
+
+
 def deadcode_elimination(
     nodes: Iterable[IrOperation], opt: Optimizer
+) -> Iterable[IrOperation]:
+    """Removes writes to temporaries that are never read, until none are left."""
+    nodes = tuple(nodes)
+
+    while True:
+        result = tuple(eliminate_dead_writes(nodes, opt))
+
+        if len(result) == len(nodes):
+            return result
+
+        nodes = result
+
+
+def eliminate_dead_writes(
+    nodes: Iterable[IrOperation], opt: Optimizer
 ) -> Iterable[IrOperation]:
     all_nodes = tuple(nodes)
     usage = get_source_usage_old(all_nodes)
@@ -2069,6 +4011,12 @@ def source_copy_elision(
             if not deps:
                 continue
 
+            if any(
+                deps[0] < use_i < node_i and use_i not in deps
+                for use_i in get_source_usage_of_parent(usage, source)
+            ):
+                continue
+
             if any(
                 deps[0] < target_use_i < node_i
                 for target_use_i in get_source_usage_of_parent(usage, target)
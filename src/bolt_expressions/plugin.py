@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass, field
 from functools import partial
 from typing import Any
@@ -9,23 +10,28 @@ from mecha import Mecha
 
 import bolt_expressions as bolt_expressions_module
 
-from .api import Data, Scoreboard
-from .ast import (
-    ConstantScoreChecker,
-    ObjectiveChecker,
-    RunExecuteTransformer,
-    SourceNBTConverter,
-)
-from .expose import wrapped_len, wrapped_max, wrapped_min
-from .node import Expression
-
 __all__ = [
     "beet_default",
     "bolt_expressions",
 ]
 
 
+logger = logging.getLogger("bolt_expressions")
+
+
 def bolt_expressions(ctx: Context):
+    # resolving the plugin only needs this module, the rest of the package is
+    # imported when the plugin runs
+    from .api import Data, Scoreboard
+    from .ast import (
+        ConstantScoreChecker,
+        ObjectiveChecker,
+        RunExecuteTransformer,
+        SourceNBTConverter,
+    )
+    from .expose import wrapped_len, wrapped_max, wrapped_min
+    from .node import Expression
+
     ctx.require("bolt_control_flow")
 
     expr = ctx.inject(Expression)
@@ -34,15 +40,18 @@ def bolt_expressions(ctx: Context):
 
     mc = ctx.inject(Mecha)
     mc.transform.extend(RunExecuteTransformer())
-    mc.check.extend(
-        ConstantScoreChecker(
-            objective=expr.opts.const_objective, callback=scoreboard.add_constant
-        ),
-        ObjectiveChecker(
-            whitelist=scoreboard.objectives,
-            callback=scoreboard.add_objective,
-        ),
-    )
+    expr.score_callback = scoreboard.register_score
+
+    if expr.opts.scan_constants:
+        mc.check.extend(
+            ConstantScoreChecker(
+                objective=expr.opts.const_objective, callback=scoreboard.add_constant
+            ),
+            ObjectiveChecker(
+                whitelist=scoreboard.objectives,
+                callback=scoreboard.add_objective,
+            ),
+        )
 
     runtime = ctx.inject(Runtime)
 
@@ -69,6 +78,13 @@ def bolt_expressions(ctx: Context):
 
     expr.generate_init()
 
+    if expr.opts.temp_hygiene and expr.temp_stats.peak_location:
+        logger.info(
+            "At most %d temporaries used at once, in %s.",
+            expr.temp_stats.peak,
+            expr.temp_stats.peak_location,
+        )
+
 
 beet_default = bolt_expressions
 
@@ -0,0 +1,231 @@
+import json
+from functools import reduce
+from hashlib import sha1
+from operator import or_
+from pathlib import Path
+from types import new_class
+from typing import Any, ForwardRef, NotRequired, TypedDict
+
+from beet import Cache, Context
+from nbtlib import ByteArray, IntArray, LongArray, String  # type: ignore
+
+from .exceptions import SchemaError
+from .node import expression_options
+from .typing import NbtType, convert_type, literal_types
+
+__all__ = [
+    "SchemaLoader",
+    "parse_schema",
+]
+
+SCHEMA_FORMAT = 1
+
+
+schema_primitives: dict[str, Any] = {
+    **literal_types,
+    "any": Any,
+    "byte_array": ByteArray,
+    "int_array": IntArray,
+    "long_array": LongArray,
+}
+
+
+# Schemas are parsed into a json-serializable tree of `[kind, argument]` pairs
+# which is what gets cached on disk:
+#   ["type", "int"]        primitive type
+#   ["ref", "item"]        reference to another schema
+#   ["list", node]         list of node
+#   ["dict", node]         compound with arbitrary keys of type node
+#   ["compound", [[key, node, optional], ...]]
+#   ["union", [node, ...]]
+SchemaNode = list[Any]
+
+
+def parse_schema(value: Any, where: str = "") -> SchemaNode:
+    """Parse the json description of an nbt type.
+
+    - `"int"`, `"string"`, `"int_array"`, `"any"`, ... are primitive types,
+      any other name is a reference to another schema, and `"a | b"` is a union.
+    - `[T]` is a list of T.
+    - `{"key": T, "other?": T}` is a compound with fixed keys, keys ending with
+      `?` are optional.
+    - `{"*": T}` is a compound with arbitrary keys of type T.
+    """
+
+    if isinstance(value, str):
+        options = [option.strip() for option in value.split("|")]
+
+        if not all(options):
+            raise SchemaError(f'Invalid type "{value}" at "{where}".')
+
+        nodes = [
+            ["type", option] if option in schema_primitives else ["ref", option]
+            for option in options
+        ]
+
+        return nodes[0] if len(nodes) == 1 else ["union", nodes]
+
+    if isinstance(value, list):
+        if len(value) != 1:  # type: ignore
+            raise SchemaError(
+                f'List type at "{where}" must contain exactly one element type.'
+            )
+
+        return ["list", parse_schema(value[0], f"{where}[]")]
+
+    if isinstance(value, dict):
+        value: dict[str, Any]
+
+        if list(value) == ["*"]:
+            return ["dict", parse_schema(value["*"], f"{where}.*")]
+
+        fields: list[Any] = []
+        for key, field in value.items():
+            optional = key.endswith("?")
+            key = key.removesuffix("?")
+            fields.append([key, parse_schema(field, f"{where}.{key}"), optional])
+
+        return ["compound", fields]
+
+    raise SchemaError(f'Invalid type "{value}" at "{where}".')
+
+
+class SchemaLoader:
+    """Loads the json nbt schemas matched by the `schemas` option.
+
+    Each file defines the schema named after its stem. Parsed schemas are cached
+    on disk by file hash, and the resulting types are built once per build and
+    shared by every lookup. Compound schemas become
+    TypedDicts, and references to a schema that is still being built are forward
+    references resolved through the `__nbt_schemas__` namespace of the TypedDict.
+    """
+
+    ctx: Context
+    patterns: list[str]
+
+    types: dict[str, NbtType]
+    nodes: dict[str, SchemaNode]
+    pending: dict[str, int]
+    depth: int
+    loaded: bool
+
+    def __init__(self, ctx: Context):
+        self.ctx = ctx
+        self.patterns = ctx.inject(expression_options).schemas
+
+        self.types = {}
+        self.nodes = {}
+        self.pending = {}
+        self.depth = 0
+        self.loaded = False
+
+    def __getitem__(self, name: str) -> NbtType:
+        if not self.loaded:
+            self.load()
+
+        return self.resolve(name)
+
+    def load(self):
+        self.loaded = True
+        cache = self.ctx.cache["bolt_expressions"]
+
+        for path in self.find_files():
+            name = path.stem
+
+            if name in self.nodes:
+                raise SchemaError(f'Duplicate schema "{name}" in "{path}".')
+
+            self.nodes[name] = self.load_file(path, cache)
+
+    def find_files(self) -> list[Path]:
+        files: dict[Path, None] = {}
+
+        for pattern in self.patterns:
+            for path in sorted(self.ctx.directory.glob(pattern)):
+                files.setdefault(path, None)
+
+        return list(files)
+
+    def load_file(self, path: Path, cache: Cache) -> SchemaNode:
+        content = path.read_bytes()
+        digest = sha1(content).hexdigest()
+        cache_path = cache.get_path(f"schema-{SCHEMA_FORMAT}-{digest}.json")
+
+        if cache_path.is_file():
+            return json.loads(cache_path.read_text("utf-8"))
+
+        try:
+            value = json.loads(content)
+        except ValueError as exc:
+            raise SchemaError(f'Invalid json in schema "{path}".') from exc
+
+        node = parse_schema(value, path.stem)
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(node), "utf-8")
+        return node
+
+    def resolve(self, name: str) -> Any:
+        if (t := self.types.get(name)) is not None:
+            return t
+
+        if name in self.pending:
+            # the reference is only evaluated once the compound it is part of is
+            # built, so only cycles that don't go through a compound are rejected
+            if self.pending[name] == self.depth:
+                raise SchemaError(f'Circular reference to schema "{name}".')
+
+            return ForwardRef(name)
+
+        if name not in self.nodes:
+            raise SchemaError(f'Unknown schema "{name}".')
+
+        self.pending[name] = self.depth
+
+        try:
+            t = self.types[name] = self.build(self.nodes[name], name)
+        finally:
+            del self.pending[name]
+
+        return t
+
+    def build(self, node: SchemaNode, name: str) -> Any:
+        kind, argument = node
+
+        if kind == "type":
+            return convert_type(schema_primitives[argument]) or Any
+
+        if kind == "ref":
+            return self.resolve(argument)
+
+        if kind == "list":
+            return list[self.build(argument, name)]  # type: ignore
+
+        if kind == "dict":
+            return dict[String, self.build(argument, name)]  # type: ignore
+
+        if kind == "union":
+            return reduce(or_, (self.build(option, name) for option in argument))
+
+        if kind == "compound":
+            return self.build_compound(name, argument)
+
+        raise SchemaError(f'Invalid schema node "{kind}" in "{name}".')
+
+    def build_compound(self, name: str, fields: list[Any]) -> type[TypedDict]:
+        annotations: dict[str, Any] = {}
+        self.depth += 1
+
+        try:
+            for key, node, optional in fields:
+                t = self.build(node, f"{name}.{key}")
+                annotations[key] = NotRequired[t] if optional else t
+        finally:
+            self.depth -= 1
+
+        def exec_body(namespace: dict[str, Any]):
+            namespace["__annotations__"] = annotations
+            namespace["__module__"] = __name__
+            namespace["__nbt_schemas__"] = self.types
+
+        return new_class(name, (TypedDict,), {}, exec_body)
@@ -79,7 +79,7 @@ from .typing import (
     is_type,
     literal_types,
 )
-from .utils import insert_nested_commands, type_name
+from .utils import return_command, type_name
 
 __all__ = [
     "Source",
@@ -132,9 +132,9 @@ def resolve(
 
 def get_source_from_tuple(expr: Expression, t: SourceTuple) -> "Source":
     if isinstance(t, DataTuple):
-        return DataSource(t.type, t.target, t.path, ctx=expr)
+        return DataSource.create(t.type, t.target, t.path, ctx=expr)
 
-    return ScoreSource(t.holder, t.obj, ctx=expr)
+    return ScoreSource.create(t.holder, t.obj, ctx=expr)
 
 
 @overload
@@ -152,11 +152,11 @@ def create_result(
 def create_result(expr: Expression, result_type: ResultType) -> "Source":
     if result_type == ResultType.score:
         holder, obj = expr.temp_score()
-        return ScoreSource(holder, obj, ctx=expr)
+        return ScoreSource.create(holder, obj, ctx=expr)
 
     if result_type == ResultType.data:
         target_type, target, path = expr.temp_data()
-        return DataSource(target_type, target, path, ctx=expr)
+        return DataSource.create(target_type, target, path, ctx=expr)
 
     raise ValueError(f"Invalid operation result type {result_type}.")
 
@@ -196,13 +196,16 @@ def multibranch(
 
     dup = source.__dup__()
 
-    if dup_exists:
-        with source.expr.optimizer.defined(dup.to_tuple()):
+    with source.expr.cleanup_temporaries(dup.to_tuple()):
+        if dup_exists:
+            with source.expr.optimizer.defined(dup.to_tuple()):
+                yield MultiBranchCase(
+                    target=dup, is_nested=False, runtime=runtime, mecha=mecha
+                )
+        else:
             yield MultiBranchCase(
                 target=dup, is_nested=False, runtime=runtime, mecha=mecha
             )
-    else:
-        yield MultiBranchCase(target=dup, is_nested=False, runtime=runtime, mecha=mecha)
 
 
 @dataclass(kw_only=True)
@@ -228,9 +231,8 @@ class MultiBranchCase(WrappedCases):
                 with self.runtime.scope() as cmds:
                     yield CaseResult.maybe()
 
-                cmd = self.mecha.parse("return:\n  ...", using="command")
                 root = AstRoot(commands=AstChildren(cmds))
-                self.runtime.commands.append(insert_nested_commands(cmd, root))
+                self.runtime.commands.append(return_command(root))
         else:
             yield CaseResult.maybe()
 
@@ -402,10 +404,22 @@ def binary_operator(
     return (OperatorMethod(decorator, lazy=True), OperatorMethod(reversed, lazy=True))
 
 
-@dataclass(order=False, eq=False, kw_only=True)
+@dataclass(order=False, eq=False, kw_only=True, slots=True, weakref_slot=True)
 class Source(ExpressionNode, ABC):
+    _tuple: SourceTuple = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        ExpressionNode.__post_init__(self)
+
+        self._tuple = self.create_tuple()
+        self._hash = hash((type(self), self.intern_key()))
+
+    def __hash__(self) -> int:
+        return self._hash
+
     def is_lazy(self) -> bool:
-        return self.to_tuple() in self.expr.lazy_values
+        return self._tuple in self.expr.lazy_values
 
     def evaluate(self):
         if self.is_lazy():
@@ -446,14 +460,34 @@ class Source(ExpressionNode, ABC):
     def component(self) -> dict[str, Any]: ...
 
     @abstractmethod
-    def to_tuple(self) -> SourceTuple: ...
+    def create_tuple(self) -> SourceTuple: ...
+
+    @abstractmethod
+    def intern_key(self) -> tuple[Any, ...]: ...
+
+    def to_tuple(self) -> SourceTuple:
+        return self._tuple
+
+
+def get_expression(ctx: Any) -> Expression:
+    return ctx if isinstance(ctx, Expression) else ctx.inject(Expression)
 
 
-@dataclass(unsafe_hash=True, order=False, eq=False)
+@dataclass(order=False, eq=False, slots=True)
 class ScoreSource(Source):
     scoreholder: str
     objective: str
 
+    @classmethod
+    def create(cls, scoreholder: str, objective: str, *, ctx: Any) -> "ScoreSource":
+        """Get a score source, reusing the interned instance if there is one."""
+        expr = get_expression(ctx)
+
+        return expr.intern(
+            (cls, scoreholder, objective),
+            lambda: cls(scoreholder, objective, ctx=ctx),
+        )
+
     __add__, __radd__ = binary_operator(Add, reverse=True)
     __sub__, __rsub__ = binary_operator(Subtract, reverse=True)
     __mul__, __rmul__ = binary_operator(Multiply, reverse=True)
@@ -465,6 +499,7 @@ class ScoreSource(Source):
     __ge__ = binary_operator(GreaterThanOrEqualTo)
     __eq__ = binary_operator(Equal)  # type: ignore
     __ne__ = binary_operator(NotEqual)  # type: ignore
+    __hash__ = Source.__hash__
     __not__ = unary_operator(Not)
     __branch__ = branch
     __multibranch__ = partial(multibranch, dup_exists=True)
@@ -485,7 +520,7 @@ class ScoreSource(Source):
 
     def __str__(self):
         return f"{self.scoreholder} {self.objective}"
-    
+
     def __repr__(self):
         return f'{self.__class__.__name__}("{str(self)}")'
 
@@ -497,8 +532,14 @@ class ScoreSource(Source):
         }
 
     def to_tuple(self) -> ScoreTuple:
+        return t.cast(ScoreTuple, self._tuple)
+
+    def create_tuple(self) -> ScoreTuple:
         return ScoreTuple(self.scoreholder, self.objective)
 
+    def intern_key(self) -> tuple[Any, ...]:
+        return (self.scoreholder, self.objective)
+
     def unroll(self, helper: UnrollHelper):
         if r := self.expr.unroll_lazy(self.to_tuple(), helper):
             return r[0], r[1]
@@ -714,7 +755,7 @@ class DataSourceOperator:
         )
 
 
-@dataclass(unsafe_hash=True, order=False)
+@dataclass(order=False, eq=False, slots=True)
 class DataSource(Source):
     _type: DataTargetType
     _target: str
@@ -722,7 +763,46 @@ class DataSource(Source):
     _scale: float = 1
     writetype: NbtType = Any
 
-    _constructed: bool = field(hash=False, default=False, init=False)
+    _constructed: bool = field(default=False, init=False)
+
+    @classmethod
+    def create(
+        cls,
+        type: DataTargetType,
+        target: str,
+        path: Path | None = None,
+        scale: float = 1,
+        writetype: NbtType = Any,
+        *,
+        ctx: Any,
+    ) -> "DataSource":
+        """Get a data source, reusing the interned instance if there is one."""
+        expr = get_expression(ctx)
+
+        if path is None:
+            path = Path()
+
+        return expr.intern(
+            (cls, type, target, path, scale, writetype),
+            lambda: cls(type, target, path, scale, writetype, ctx=ctx),
+        )
+
+    def derive(
+        self,
+        *,
+        path: Path | None = None,
+        scale: float | None = None,
+        writetype: NbtType | None = None,
+    ) -> "DataSource":
+        """Create a data source with some of the properties replaced."""
+        return self.create(
+            self._type,
+            self._target,
+            self._path if path is None else path,
+            self._scale if scale is None else scale,
+            self.writetype if writetype is None else writetype,
+            ctx=self.ctx,
+        )
 
     __add__ = DataSourceOperator(_not_implemented)
     __radd__ = DataSourceOperator(_not_implemented)
@@ -743,6 +823,7 @@ class DataSource(Source):
     __eq__ = DataSourceOperator(_not_implemented)  # type: ignore
     __ne__ = DataSourceOperator(_not_implemented)  # type: ignore
     __not__ = DataSourceOperator(_not_implemented)
+    __hash__ = Source.__hash__
     # __len__ = DataSourceOperator()
 
     @property
@@ -765,7 +846,7 @@ class DataSource(Source):
         return GenericOperatorHandler(self)
 
     def __post_init__(self):
-        super().__post_init__()
+        Source.__post_init__(self)
 
         self._constructed = True
 
@@ -774,8 +855,14 @@ class DataSource(Source):
         return self.writetype
 
     def to_tuple(self) -> DataTuple:
+        return t.cast(DataTuple, self._tuple)
+
+    def create_tuple(self) -> DataTuple:
         return DataTuple(self._type, self._target, self._path)
 
+    def intern_key(self) -> tuple[Any, ...]:
+        return (self._type, self._target, self._path, self._scale, self.writetype)
+
     def unroll(self, helper: UnrollHelper):
         if r := self.expr.unroll_lazy(self.to_tuple(), helper):
             return r[0], r[1]
@@ -805,8 +892,13 @@ class DataSource(Source):
 
     @internal
     def __setattr__(self, key: str, value):
-        if not self._constructed:
-            super().__setattr__(key, value)
+        try:
+            constructed = object.__getattribute__(self, "_constructed")
+        except AttributeError:
+            constructed = False
+
+        if not constructed:
+            object.__setattr__(self, key, value)
         else:
             self.__setitem__(key, value)
 
@@ -826,7 +918,7 @@ class DataSource(Source):
             return result
 
         if is_type(key, allow_dict=False):
-            return replace(self, writetype=convert_type(key) or Any)
+            return self.derive(writetype=convert_type(key) or Any)
 
         if isinstance(key, str):
             if method := self.operator_handler.get(key):
@@ -874,7 +966,7 @@ class DataSource(Source):
         writetype = access_type(self.writetype, accessor, self.expr.ctx) or Any
         path = Path.from_accessors((*self._path, accessor))  # type: ignore
 
-        source = replace(self, _path=path, writetype=writetype)
+        source = self.derive(path=path, writetype=writetype)
 
         if not len(rest):
             return source
@@ -913,11 +1005,7 @@ class DataSource(Source):
 
         writetype = literal_types[type] if type else self.writetype
 
-        return replace(
-            self,
-            _scale=scale if scale is not None else self._scale,
-            writetype=writetype,
-        )
+        return self.derive(scale=scale, writetype=writetype)
 
     def __str__(self):
         return f"{self._type} {self._target} {self._path}"
@@ -1,8 +1,10 @@
-from types import GenericAlias, NoneType, UnionType
+from dataclasses import dataclass
+from types import GenericAlias, MappingProxyType, NoneType, UnionType
 from typing import (
     Any,
     Iterable,
     Literal,
+    Mapping,
     TypedDict,
     TypeGuard,
     Union,
@@ -34,12 +36,28 @@ from nbtlib import (
 
 from .utils import format_name, get_globals, type_name  # type: ignore
 
-__all__ = ["is_type", "convert_type", "literal_types"]
+__all__ = [
+    "AnySchema",
+    "ArraySchema",
+    "CompoundSchema",
+    "FixedCompoundSchema",
+    "ListSchema",
+    "NbtSchema",
+    "NumericSchema",
+    "StringSchema",
+    "UnionSchema",
+    "compile_schema",
+    "convert_type",
+    "is_type",
+    "literal_types",
+]
 
 
 NBT_TYPE_STRING = ("byte", "short", "int", "long", "float", "double")
 NbtTypeString = Literal["byte", "short", "int", "long", "float", "double"]
 
+SCHEMA_CACHE_SIZE = 4096
+
 
 NumericNbtValue = Byte | Short | Int | Long | Float | Double
 NbtValue = NumericNbtValue | String | List | Array | Compound
@@ -81,6 +99,9 @@ def format_type(t: Any, *, __refs: list[Any] | None = None) -> str:
     if __refs is None:
         __refs = []
 
+    if isinstance(t, NbtSchema):
+        t = t.type
+
     circular_ref = t in __refs
     __refs.append(t)
 
@@ -100,7 +121,7 @@ def format_type(t: Any, *, __refs: list[Any] | None = None) -> str:
         return f"{origin}[{', '.join(args)}]"
 
     if is_typeddict_guard(t) and t.__name__ == "__anonymous_dict__":
-        t = get_dict_fields(t)
+        t = dict(compile_schema(t).fields)
     if isinstance(t, dict):
         t_dict = cast(dict[str, Any], t)
 
@@ -245,7 +266,9 @@ def get_dict_fields(
         fields = t
     else:
         globalns = get_globals(t, ctx)
-        fields = get_type_hints(t, globalns=globalns)
+        # schemas loaded from json refer to each other through their namespace
+        localns = getattr(t, "__nbt_schemas__", None)
+        fields = get_type_hints(t, globalns=globalns, localns=localns)
 
     result: dict[str, NbtType] = {}
 
@@ -266,6 +289,31 @@ def is_type(value: Any, allow_dict: bool = True) -> TypeGuard[NbtType]:
     )
 
 
+anonymous_dicts: dict[tuple[tuple[str, NbtType], ...], type[TypedDict]] = {}
+
+
+def anonymous_dict(fields: dict[str, NbtType]) -> type[TypedDict]:
+    """Returns a shared anonymous TypedDict with the given fields."""
+
+    key = tuple(fields.items())
+
+    try:
+        return anonymous_dicts[key]
+    except KeyError:
+        cacheable = True
+    except TypeError:
+        cacheable = False
+
+    t: type[TypedDict] = TypedDict("__anonymous_dict__", fields)  # type: ignore
+
+    if cacheable:
+        if len(anonymous_dicts) >= SCHEMA_CACHE_SIZE:
+            anonymous_dicts.clear()
+        anonymous_dicts[key] = t
+
+    return t
+
+
 def convert_type(
     value: Any, is_origin: bool = False, globalns: dict[str, Any] | None = None
 ) -> NbtType | None:
@@ -283,7 +331,7 @@ def convert_type(
             val_type = convert_type(val, globalns=globalns)
             type_dict[key] = val_type if val_type is not None else Any
 
-        return TypedDict("__anonymous_dict__", type_dict)  # type: ignore
+        return anonymous_dict(type_dict)
 
     if is_typeddict(value):
         return value  # type: ignore
@@ -387,88 +435,189 @@ def infer_type(value: Any, shallow: bool = False) -> NbtType | None:
     return convert_type(type(value))
 
 
-def access_typeddict(
-    t: type[TypedDict], accessor: Accessor, ctx: Context | None = None
-) -> NbtType | None:
-    if isinstance(accessor, CompoundMatch):
-        return t
+NUMERIC_ORDER = (Byte, Short, Int, Long, Float, Double)
+
 
-    if isinstance(accessor, NamedKey):
-        key = accessor.key
+@dataclass(frozen=True, slots=True, eq=False)
+class NbtSchema:
+    """Compiled descriptor of an nbt type.
 
-        fields = get_dict_fields(t, ctx)
+    Schemas are created once per source type by `compile_schema` and hold
+    everything the type checker and the caster need to know about the type, so
+    that the type never has to be introspected again.
+    """
 
-        if attr_type := fields.get(key):
-            result = convert_type(attr_type)
-            return result if result is not None else Any
+    type: Any
 
-    return None
+    def access(self, accessor: Accessor) -> NbtType | None:
+        return None
 
 
-def access_compound_alias(
-    t: type[dict[str, Any]], accessor: Accessor
-) -> NbtType | None:
-    if isinstance(accessor, CompoundMatch):
-        return t
+@dataclass(frozen=True, slots=True, eq=False)
+class AnySchema(NbtSchema):
+    def access(self, accessor: Accessor) -> NbtType | None:
+        return self.type
 
-    if isinstance(accessor, NamedKey):
-        args = get_args(t)
 
-        if not args:
-            return Any
+@dataclass(frozen=True, slots=True, eq=False)
+class NumericSchema(NbtSchema):
+    order: int | None = None
 
-        return args[-1]
 
-    return None
+@dataclass(frozen=True, slots=True, eq=False)
+class StringSchema(NbtSchema): ...
 
 
-def access_list(t: type[list[Any]], accessor: Accessor) -> NbtType | None:
-    if isinstance(accessor, ListIndex):
-        if is_alias(t, list):
-            arg = get_args(t)
-            return arg[0] if arg else Any
+@dataclass(frozen=True, slots=True, eq=False)
+class ListSchema(NbtSchema):
+    element: NbtType | None = None
 
-        if isinstance(t, type) and issubclass(t, List):
-            if t.subtype is End:
-                return Any
-            return t.subtype
+    def access(self, accessor: Accessor) -> NbtType | None:
+        if isinstance(accessor, ListIndex):
+            return self.element
 
-    return None
+        return None
 
 
-def access_array(t: type[Array], accessor: Accessor) -> NbtType | None:
-    if isinstance(accessor, ListIndex):
-        wrapper = t.wrapper
-        return wrapper if wrapper is not None else Any
+@dataclass(frozen=True, slots=True, eq=False)
+class ArraySchema(ListSchema): ...
 
-    return None
 
+@dataclass(frozen=True, slots=True, eq=False)
+class CompoundSchema(NbtSchema):
+    """Compound with arbitrary keys sharing the same value type."""
 
-def access_type(
-    current_type: NbtType | None, accessor: Accessor, ctx: Context | None = None
-) -> NbtType | None:
-    if current_type in (Any, None):
-        return current_type
+    value: NbtType = Any
+
+    def access(self, accessor: Accessor) -> NbtType | None:
+        if isinstance(accessor, CompoundMatch):
+            return self.type
+
+        if isinstance(accessor, NamedKey):
+            return self.value
+
+        return None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FixedCompoundSchema(NbtSchema):
+    """Compound with a fixed set of keys."""
+
+    fields: Mapping[str, NbtType] = MappingProxyType({})
+    optional_keys: frozenset[str] = frozenset()
+    required_types: Mapping[str, NbtType] = MappingProxyType({})
+
+    def access(self, accessor: Accessor) -> NbtType | None:
+        if isinstance(accessor, CompoundMatch):
+            return self.type
+
+        if isinstance(accessor, NamedKey):
+            return self.fields.get(accessor.key)
 
-    if is_numeric_type(current_type) or is_string_type(current_type):
         return None
 
-    if is_union(current_type):
-        args = get_args(current_type)
-        subtypes = tuple(access_type(arg, accessor) for arg in args)
 
+@dataclass(frozen=True, slots=True, eq=False)
+class UnionSchema(NbtSchema):
+    members: tuple[NbtSchema, ...] = ()
+    optional: bool = False
+    required: NbtType | None = None
+
+    def access(self, accessor: Accessor) -> NbtType | None:
+        subtypes = tuple(member.access(accessor) for member in self.members)
         return convert_type(Union[subtypes])  # type: ignore
 
-    if is_typeddict_guard(current_type):
-        return access_typeddict(current_type, accessor, ctx)
 
-    if is_compound_alias(current_type):
-        return access_compound_alias(current_type, accessor)
+schema_cache: dict[Any, NbtSchema] = {}
+
+
+def compile_schema(t: Any, ctx: Context | None = None) -> NbtSchema:
+    """Returns the cached schema of the nbt type `t`, compiling it if needed."""
+
+    if isinstance(t, NbtSchema):
+        return t
+
+    try:
+        return schema_cache[t]
+    except KeyError:
+        cacheable = True
+    except TypeError:
+        cacheable = False
+
+    schema = create_schema(t, ctx)
+
+    if cacheable:
+        if len(schema_cache) >= SCHEMA_CACHE_SIZE:
+            schema_cache.clear()
+        schema_cache[t] = schema
+
+    return schema
+
+
+def create_schema(t: Any, ctx: Context | None = None) -> NbtSchema:
+    if t is Any:
+        return AnySchema(type=t)
+
+    if t is None:
+        return NbtSchema(type=t)
+
+    if is_union(t):
+        args = get_args(t)
+        return UnionSchema(
+            type=t,
+            members=tuple(compile_schema(arg, ctx) for arg in args),
+            optional=NoneType in args,
+            required=unwrap_optional_type(t),
+        )
+
+    if is_fixed_compound(t):
+        fields: dict[str, NbtType] = {}
+        for key, value in get_dict_fields(t, ctx).items():
+            value_type = convert_type(value)
+            fields[key] = value_type if value_type is not None else Any
+
+        optional_keys = set(getattr(t, "__optional_keys__", ()))
+        optional_keys.update(key for key, value in fields.items() if is_optional(value))
+
+        return FixedCompoundSchema(
+            type=t,
+            fields=MappingProxyType(fields),
+            optional_keys=frozenset(optional_keys),
+            required_types=MappingProxyType(
+                {key: unwrap_optional_type(value) for key, value in fields.items()}
+            ),
+        )
+
+    if is_compound_alias(t):
+        args = get_args(t)
+        return CompoundSchema(type=t, value=args[-1] if args else Any)
+
+    if is_list_type(t):
+        if is_alias(t, list):
+            args = get_args(t)
+            element = args[0] if args else Any
+        elif isinstance(t, type) and issubclass(t, List):
+            element = Any if t.subtype is End else t.subtype
+        else:
+            element = None
 
-    if is_list_type(current_type):
-        return access_list(current_type, accessor)
+        return ListSchema(type=t, element=element)
 
-    if is_array_type(current_type):
-        return access_array(current_type, accessor)
+    if is_array_type(t):
+        wrapper = t.wrapper
+        return ArraySchema(type=t, element=wrapper if wrapper is not None else Any)
+
+    if is_numeric_type(t):
+        order = NUMERIC_ORDER.index(t) if t in NUMERIC_ORDER else None
+        return NumericSchema(type=t, order=order)
+
+    if is_string_type(t):
+        return StringSchema(type=t)
+
+    return NbtSchema(type=t)
 
-    return None
+
+def access_type(
+    current_type: NbtType | None, accessor: Accessor, ctx: Context | None = None
+) -> NbtType | None:
+    return compile_schema(current_type, ctx).access(accessor)
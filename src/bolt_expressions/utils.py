@@ -1,17 +1,19 @@
 import sys
 from contextlib import contextmanager
 from dataclasses import replace
+from functools import cache
 from types import NoneType
-from typing import Any, Dict, is_typeddict  # type: ignore
+from typing import Any, is_typeddict  # type: ignore
 
 from beet import Context
 from bolt import Runtime
-from mecha import AstChildren, AstCommand, AstRoot
-from nbtlib import Base  # type: ignore
+from mecha import AstChildren, AstCommand, AstResourceLocation, AstRoot
+from nbtlib import Base, Compound, List  # type: ignore
 
 __all__ = [
     "type_name",
     "identifier_generator",
+    "patch_nbt_hash",
     "get_globals",
     "assert_exception",
 ]
@@ -37,19 +39,34 @@ def format_name(t: Any) -> str:
 def identifier_generator(ctx: Context | None = None):
     if ctx:
         runtime = ctx.inject(Runtime)
-        incr: Dict[str, int] = {}
+        incr: dict[str, int] = {}
+        prefixes: dict[str, str] = {}
 
         while True:
             path = runtime.modules.current_path
             incr[path] = incr.setdefault(path, -1) + 1
 
-            yield ctx.generate.format(f"{{hash}}_{incr[path]}", path)
+            if (prefix := prefixes.get(path)) is None:
+                prefix = prefixes[path] = ctx.generate.format("{hash}_", path)
+
+            yield f"{prefix}{incr[path]}"
     else:
         counter = 0
         while True:
             yield str(f"i{counter}")
 
 
+@cache
+def patch_nbt_hash():
+    """Make nbtlib compounds and lists hashable, applied once per process."""
+
+    def patched_hash(self: Any):
+        return hash(str(self))
+
+    Compound.__hash__ = patched_hash
+    List.__hash__ = patched_hash
+
+
 def get_globals(obj: Any, ctx: Context | Runtime | None = None) -> dict[str, Any]:
     if isinstance(ctx, Context):
         runtime = ctx.inject(Runtime)
@@ -96,3 +113,22 @@ def insert_nested_commands(execute: AstCommand, root: AstRoot) -> AstCommand:
     inserted = insert_nested_commands(subcommand, root)
     arguments = AstChildren((*execute.arguments[:-1], inserted))
     return replace(execute, arguments=arguments)
+
+
+def execute_function_command(location: str, root: AstRoot) -> AstCommand:
+    """Builds `execute function <location>:` with nested commands."""
+
+    function = AstCommand(
+        identifier="function:name:commands",
+        arguments=AstChildren((AstResourceLocation.from_value(location), root)),
+    )
+    run = AstCommand(
+        identifier="execute:run:subcommand", arguments=AstChildren((function,))
+    )
+    return AstCommand(identifier="execute:subcommand", arguments=AstChildren((run,)))
+
+
+def return_command(root: AstRoot) -> AstCommand:
+    """Builds `return:` with nested commands."""
+
+    return AstCommand(identifier="return:commands", arguments=AstChildren((root,)))
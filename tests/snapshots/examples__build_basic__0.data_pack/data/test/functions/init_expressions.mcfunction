@@ -1,2 +1,2 @@
-scoreboard objectives add abc.settings trigger
 scoreboard objectives add load.status dummy
+scoreboard objectives add abc.settings trigger
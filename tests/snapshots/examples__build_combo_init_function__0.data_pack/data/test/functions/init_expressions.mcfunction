@@ -1,12 +1,7 @@
 scoreboard objectives add bolt.expr.temp dummy
 scoreboard objectives add bolt.expr.const dummy
-scoreboard players set $2 bolt.expr.const 2
-scoreboard players set $5 bolt.expr.const 5
-scoreboard players set $3 bolt.expr.const 3
-scoreboard players set $4 bolt.expr.const 4
-scoreboard players set $6 bolt.expr.const 6
-scoreboard players set $7 bolt.expr.const 7
-scoreboard players set $8 bolt.expr.const 8
 scoreboard players set $-5 bolt.expr.const -5
+scoreboard players set $5 bolt.expr.const 5
+scoreboard players set $50 bolt.expr.const 50
 scoreboard players set $123 bolt.expr.const 123
-scoreboard players set $0 bolt.expr.const 0
+scoreboard players set $4032 bolt.expr.const 4032
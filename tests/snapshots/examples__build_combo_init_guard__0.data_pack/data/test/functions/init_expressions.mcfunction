@@ -0,0 +1,2 @@
+execute unless data storage bolt.expr:temp {init: "848fd89f4fc28e8d"} run function test:init_expressions/install
+say reloaded
@@ -0,0 +1,8 @@
+scoreboard objectives add abc.main dummy
+scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard players set $3 bolt.expr.const 3
+scoreboard players set $5 bolt.expr.const 5
+scoreboard players set $7 bolt.expr.const 7
+scoreboard players set $100 bolt.expr.const 100
+data modify storage bolt.expr:temp init set value "848fd89f4fc28e8d"
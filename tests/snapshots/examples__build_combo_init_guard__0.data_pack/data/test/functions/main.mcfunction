@@ -0,0 +1,9 @@
+scoreboard players operation @s abc.main = #value abc.main
+scoreboard players operation @s abc.main *= $3 bolt.expr.const
+scoreboard players add @s abc.main 1
+scoreboard players operation $i0 bolt.expr.temp = #denom abc.main
+scoreboard players operation $i0 bolt.expr.temp *= $5 bolt.expr.const
+scoreboard players operation @s abc.main /= $i0 bolt.expr.temp
+scoreboard players operation #max abc.main = #value abc.main
+scoreboard players operation #max abc.main > $100 bolt.expr.const
+scoreboard players operation #max abc.main *= $7 bolt.expr.const
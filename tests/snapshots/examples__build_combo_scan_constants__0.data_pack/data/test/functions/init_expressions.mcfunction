@@ -0,0 +1,4 @@
+scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard players set $3 bolt.expr.const 3
+scoreboard players set $7 bolt.expr.const 7
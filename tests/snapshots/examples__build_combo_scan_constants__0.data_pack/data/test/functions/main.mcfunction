@@ -0,0 +1 @@
+scoreboard players operation @s abc.obj *= $3 bolt.expr.const
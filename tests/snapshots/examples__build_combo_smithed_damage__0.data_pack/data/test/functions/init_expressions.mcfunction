@@ -1,7 +1,7 @@
-scoreboard objectives add bolt.expr.const dummy
 scoreboard objectives add bolt.expr.temp dummy
-scoreboard players set $10 bolt.expr.const 10
+scoreboard objectives add bolt.expr.const dummy
 scoreboard players set $5 bolt.expr.const 5
-scoreboard players set $400 bolt.expr.const 400
-scoreboard players set $200 bolt.expr.const 200
+scoreboard players set $10 bolt.expr.const 10
 scoreboard players set $25 bolt.expr.const 25
+scoreboard players set $200 bolt.expr.const 200
+scoreboard players set $400 bolt.expr.const 400
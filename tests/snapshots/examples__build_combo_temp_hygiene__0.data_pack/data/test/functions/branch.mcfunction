@@ -0,0 +1,7 @@
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+scoreboard players operation $i0 bolt.expr.temp *= $3 bolt.expr.const
+scoreboard players operation $i1 bolt.expr.temp = #b obj
+scoreboard players add $i1 bolt.expr.temp 2
+execute if score $i0 bolt.expr.temp > $i1 bolt.expr.temp run say greater
+scoreboard players reset $i0 bolt.expr.temp
+scoreboard players reset $i1 bolt.expr.temp
@@ -0,0 +1,7 @@
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+scoreboard players operation $i0 bolt.expr.temp *= $3 bolt.expr.const
+execute store success score $2384k242hd495_33 bolt.expr.temp if score $i0 bolt.expr.temp > #b obj
+scoreboard players reset $i0 bolt.expr.temp
+execute unless score $2384k242hd495_33 bolt.expr.temp matches 0 run say high
+execute if score $2384k242hd495_33 bolt.expr.temp matches 0 run function test:chain/nested_execute_0
+scoreboard players reset $2384k242hd495_33 bolt.expr.temp
@@ -0,0 +1,5 @@
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+scoreboard players operation $i0 bolt.expr.temp += $i0 bolt.expr.temp
+execute if score $i0 bolt.expr.temp > #b obj run return run function test:chain/nested_return_0
+scoreboard players reset $i0 bolt.expr.temp
+say low
@@ -0,0 +1,3 @@
+scoreboard players reset $2384k242hd495_33 bolt.expr.temp
+scoreboard players reset $i0 bolt.expr.temp
+say mid
@@ -0,0 +1,2 @@
+scoreboard players reset $i0 bolt.expr.temp
+return 1
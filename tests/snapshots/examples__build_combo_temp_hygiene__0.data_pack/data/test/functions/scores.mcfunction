@@ -0,0 +1,12 @@
+scoreboard players operation #a obj = #x obj
+scoreboard players operation #a obj += #a obj
+scoreboard players operation #a obj += #b obj
+scoreboard players operation $i0 bolt.expr.temp = #c obj
+scoreboard players add $i0 bolt.expr.temp 1
+scoreboard players operation #a obj *= $i0 bolt.expr.temp
+scoreboard players operation #b obj = #x obj
+scoreboard players operation #b obj *= #x obj
+scoreboard players operation $i0 bolt.expr.temp = #c obj
+scoreboard players operation $i0 bolt.expr.temp *= #c obj
+scoreboard players operation #b obj += $i0 bolt.expr.temp
+scoreboard players reset $i0 bolt.expr.temp
@@ -0,0 +1,6 @@
+data modify storage bolt.expr:temp 2384k242hd495.i0 set value {}
+data modify storage bolt.expr:temp 2384k242hd495.i0 set from entity @e[type=pig, limit=1, sort=nearest]
+execute store result score #a obj run data get storage bolt.expr:temp 2384k242hd495.i0.Health 1
+execute store result score #b obj run data get storage bolt.expr:temp 2384k242hd495.i0.Air 1
+execute store result score #c obj run data get storage bolt.expr:temp 2384k242hd495.i0.Fire 1
+data remove storage bolt.expr:temp 2384k242hd495
@@ -0,0 +1,7 @@
+data modify storage test:temp list append value 0
+execute store result storage test:temp list[-1] int 1 run scoreboard players get #x obj
+execute store result score $i0 bolt.expr.temp run data get storage test:temp item 1
+scoreboard players operation $i0 bolt.expr.temp += #x obj
+data modify storage test:temp list append value 0
+execute store result storage test:temp list[-1] int 1 run scoreboard players get $i0 bolt.expr.temp
+scoreboard players reset $i0 bolt.expr.temp
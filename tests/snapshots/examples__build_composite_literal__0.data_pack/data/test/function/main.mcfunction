@@ -26,11 +26,11 @@ data modify storage name:path vec4 set value [B; 0b, 0b, 0b]
 execute store result storage name:path vec4[0] byte 1 run scoreboard players get $a obj.main
 execute store result storage name:path vec4[1] byte 1 run scoreboard players get $b obj.main
 execute store result storage name:path vec4[2] byte 1 run scoreboard players get $c obj.main
-data modify storage bolt.expr:temp 2384k242hd495_34 set value {x: 0, y: 0, z: 0}
-execute store result storage bolt.expr:temp 2384k242hd495_34.x int 1 run scoreboard players get $x obj.main
-execute store result storage bolt.expr:temp 2384k242hd495_34.y int 1 run scoreboard players get $y obj.main
-execute store result storage bolt.expr:temp 2384k242hd495_34.z int 1 run scoreboard players get $z obj.main
-function test:main/nested_macro_0 with storage bolt.expr:temp 2384k242hd495_34
+data modify storage bolt.expr:temp 2384k242hd495_26 set value {x: 0, y: 0, z: 0}
+execute store result storage bolt.expr:temp 2384k242hd495_26.x int 1 run scoreboard players get $x obj.main
+execute store result storage bolt.expr:temp 2384k242hd495_26.y int 1 run scoreboard players get $y obj.main
+execute store result storage bolt.expr:temp 2384k242hd495_26.z int 1 run scoreboard players get $z obj.main
+function test:main/nested_macro_0 with storage bolt.expr:temp 2384k242hd495_26
 say ---
 data modify storage name:path config set value {pack_name: "", version: [], data: {flag0: 0b, flag1: 0b}}
 data modify storage name:path config.version set value [0s, 0s, 0s]
@@ -44,8 +44,8 @@ data modify storage bolt.expr:temp i0 set value {id: "", Count: 0b}
 data modify storage bolt.expr:temp i0.id set from storage name:path selected_item
 execute store result storage bolt.expr:temp i0.Count byte 1 run scoreboard players get $count obj.main
 data modify storage name:path items append from storage bolt.expr:temp i0
-data modify storage bolt.expr:temp 2384k242hd495_43 set value {x: 0, y: 0, z: 0}
-execute store result storage bolt.expr:temp 2384k242hd495_43.x int 1 run scoreboard players get $x obj.main
-execute store result storage bolt.expr:temp 2384k242hd495_43.y int 1 run scoreboard players get $y obj.main
-execute store result storage bolt.expr:temp 2384k242hd495_43.z int 1 run scoreboard players get $z obj.main
-function test:main/nested_macro_1 with storage bolt.expr:temp 2384k242hd495_43
+data modify storage bolt.expr:temp 2384k242hd495_30 set value {x: 0, y: 0, z: 0}
+execute store result storage bolt.expr:temp 2384k242hd495_30.x int 1 run scoreboard players get $x obj.main
+execute store result storage bolt.expr:temp 2384k242hd495_30.y int 1 run scoreboard players get $y obj.main
+execute store result storage bolt.expr:temp 2384k242hd495_30.z int 1 run scoreboard players get $z obj.main
+function test:main/nested_macro_1 with storage bolt.expr:temp 2384k242hd495_30
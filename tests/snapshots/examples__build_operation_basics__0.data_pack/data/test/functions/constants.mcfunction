@@ -13,8 +13,8 @@ scoreboard players operation $f abc.main *= $157 bolt.expr.const
 scoreboard players operation $f abc.main /= $50 bolt.expr.const
 scoreboard players operation $g abc.main *= $12353 bolt.expr.const
 scoreboard players operation $g abc.main /= $25000 bolt.expr.const
-scoreboard players operation $h abc.main *= $2 bolt.expr.const
+scoreboard players operation $h abc.main += $h abc.main
 scoreboard players operation $i abc.main *= $100 bolt.expr.const
 scoreboard players operation $i abc.main /= $33 bolt.expr.const
-scoreboard players operation $j abc.main *= $2 bolt.expr.const
+scoreboard players operation $j abc.main += $j abc.main
 scoreboard players operation $j abc.main /= $3 bolt.expr.const
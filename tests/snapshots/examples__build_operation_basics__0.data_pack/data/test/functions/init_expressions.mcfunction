@@ -1,15 +1,15 @@
 scoreboard objectives add bolt.expr.const dummy
-scoreboard players set $30 bolt.expr.const 30
-scoreboard players set $40 bolt.expr.const 40
-scoreboard players set $50 bolt.expr.const 50
 scoreboard players set $-1 bolt.expr.const -1
 scoreboard players set $2 bolt.expr.const 2
+scoreboard players set $3 bolt.expr.const 3
 scoreboard players set $10 bolt.expr.const 10
+scoreboard players set $30 bolt.expr.const 30
+scoreboard players set $33 bolt.expr.const 33
+scoreboard players set $40 bolt.expr.const 40
+scoreboard players set $50 bolt.expr.const 50
+scoreboard players set $100 bolt.expr.const 100
 scoreboard players set $123 bolt.expr.const 123
-scoreboard players set $1000 bolt.expr.const 1000
 scoreboard players set $157 bolt.expr.const 157
+scoreboard players set $1000 bolt.expr.const 1000
 scoreboard players set $12353 bolt.expr.const 12353
 scoreboard players set $25000 bolt.expr.const 25000
-scoreboard players set $100 bolt.expr.const 100
-scoreboard players set $33 bolt.expr.const 33
-scoreboard players set $3 bolt.expr.const 3
@@ -0,0 +1,6 @@
+scoreboard players set #c abc.main 0
+scoreboard players operation @e abc.main -= @e abc.main
+scoreboard players operation @e abc.main %= @e abc.main
+scoreboard players operation #d abc.main = #c abc.main
+scoreboard players operation #e abc.main = #c abc.main
+scoreboard players operation @a abc.main < @a abc.main
@@ -0,0 +1,8 @@
+scoreboard players operation $i0 bolt.expr.temp = $x obj
+scoreboard players add $i0 bolt.expr.temp 1
+scoreboard players operation $c obj = $i0 bolt.expr.temp
+scoreboard players operation $c obj *= $y obj
+scoreboard players operation $x obj = $i0 bolt.expr.temp
+scoreboard players operation $d obj = $i0 bolt.expr.temp
+scoreboard players add $d obj 1
+scoreboard players operation $d obj *= $y obj
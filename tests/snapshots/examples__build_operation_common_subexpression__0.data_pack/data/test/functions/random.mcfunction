@@ -0,0 +1,9 @@
+scoreboard players operation $a obj = @r obj
+scoreboard players operation $a obj *= $3 bolt.expr.const
+scoreboard players operation $i0 bolt.expr.temp = @r obj
+scoreboard players operation $i0 bolt.expr.temp *= $3 bolt.expr.const
+scoreboard players operation $a obj += $i0 bolt.expr.temp
+scoreboard players operation $b obj = @e[sort=random, limit=1] obj
+scoreboard players operation $b obj *= $3 bolt.expr.const
+scoreboard players operation $c obj = @e[sort=random, limit=1] obj
+scoreboard players operation $c obj *= $3 bolt.expr.const
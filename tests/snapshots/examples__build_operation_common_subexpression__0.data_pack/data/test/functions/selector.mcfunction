@@ -0,0 +1,9 @@
+scoreboard players operation $i0 bolt.expr.temp = $x obj
+scoreboard players operation $i0 bolt.expr.temp *= $y obj
+scoreboard players operation $b obj = $i0 bolt.expr.temp
+scoreboard players operation $c obj = @p obj
+scoreboard players operation $c obj *= $y obj
+scoreboard players set @a obj 7
+scoreboard players operation $d obj = $i0 bolt.expr.temp
+scoreboard players operation $a obj = @p obj
+scoreboard players operation $a obj *= $y obj
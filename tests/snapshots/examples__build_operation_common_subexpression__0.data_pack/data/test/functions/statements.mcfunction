@@ -0,0 +1,6 @@
+scoreboard players operation $i0 bolt.expr.temp = $x obj
+scoreboard players add $i0 bolt.expr.temp 1
+scoreboard players operation $i0 bolt.expr.temp *= $y obj
+scoreboard players operation $c obj = $i0 bolt.expr.temp
+scoreboard players operation $d obj = $i0 bolt.expr.temp
+scoreboard players operation $d obj -= $i0 bolt.expr.temp
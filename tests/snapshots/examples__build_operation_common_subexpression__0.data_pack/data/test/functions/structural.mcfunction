@@ -0,0 +1,6 @@
+scoreboard players operation $i0 bolt.expr.temp = $a obj
+scoreboard players operation $i0 bolt.expr.temp *= $b obj
+scoreboard players operation $i1 bolt.expr.temp = $i0 bolt.expr.temp
+scoreboard players operation $i1 bolt.expr.temp %= $c obj
+scoreboard players operation $d obj = $i0 bolt.expr.temp
+scoreboard players operation $d obj += $i1 bolt.expr.temp
@@ -0,0 +1,5 @@
+scoreboard players operation $b obj = $x obj
+scoreboard players operation $b obj *= $y obj
+scoreboard players set * obj 7
+scoreboard players operation $c obj = $x obj
+scoreboard players operation $c obj *= $y obj
@@ -1,4 +1,3 @@
-scoreboard objectives add bolt.expr.temp dummy
 scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
 scoreboard players set $5 bolt.expr.const 5
-scoreboard players set $2 bolt.expr.const 2
@@ -30,27 +30,27 @@ execute store result score $i1 bolt.expr.temp run data get storage test:temp y 1
 execute store success score $a obj if score $i0 bolt.expr.temp > $i1 bolt.expr.temp
 scoreboard players operation $i0 bolt.expr.temp = $a obj
 scoreboard players operation $i0 bolt.expr.temp += $b obj
-execute store success score $2384k242hd495_60 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
-execute unless score $2384k242hd495_60 bolt.expr.temp matches 0 run scoreboard players set $a obj 1
-execute if score $2384k242hd495_60 bolt.expr.temp matches 0 run say a is not zero
+execute store success score $2384k242hd495_54 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
+execute unless score $2384k242hd495_54 bolt.expr.temp matches 0 run scoreboard players set $a obj 1
+execute if score $2384k242hd495_54 bolt.expr.temp matches 0 run say a is not zero
 execute if score $a obj matches 1.. run say a is positive
 scoreboard players operation $i0 bolt.expr.temp = $a obj
 scoreboard players operation $i0 bolt.expr.temp += $b obj
-execute store success score $2384k242hd495_70 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
-execute unless score $2384k242hd495_70 bolt.expr.temp matches 0 run scoreboard players set $b obj 0
-execute if score $2384k242hd495_70 bolt.expr.temp matches 0 run scoreboard players set $a obj 1
-scoreboard players operation $2384k242hd495_75 bolt.expr.temp = $a obj
-execute unless score $2384k242hd495_75 bolt.expr.temp matches 0 run say value exists
-execute if score $2384k242hd495_75 bolt.expr.temp matches 0 run function test:main/nested_execute_0
+execute store success score $2384k242hd495_64 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
+execute unless score $2384k242hd495_64 bolt.expr.temp matches 0 run scoreboard players set $b obj 0
+execute if score $2384k242hd495_64 bolt.expr.temp matches 0 run scoreboard players set $a obj 1
+scoreboard players operation $2384k242hd495_69 bolt.expr.temp = $a obj
+execute unless score $2384k242hd495_69 bolt.expr.temp matches 0 run say value exists
+execute if score $2384k242hd495_69 bolt.expr.temp matches 0 run function test:main/nested_execute_0
 scoreboard players operation $i0 bolt.expr.temp = $a obj
 scoreboard players add $i0 bolt.expr.temp 5
-execute store success score $2384k242hd495_81 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
-execute unless score $2384k242hd495_81 bolt.expr.temp matches ..-1 unless score $2384k242hd495_81 bolt.expr.temp matches 1.. run scoreboard players operation $2384k242hd495_81 bolt.expr.temp = $b obj
-scoreboard players operation $c obj = $2384k242hd495_81 bolt.expr.temp
-scoreboard players operation $2384k242hd495_86 bolt.expr.temp = $a obj
-execute unless score $2384k242hd495_86 bolt.expr.temp matches 0 run say it's a!
-execute if score $2384k242hd495_86 bolt.expr.temp matches 0 run function test:main/nested_execute_1
+execute store success score $2384k242hd495_75 bolt.expr.temp if score $i0 bolt.expr.temp matches 1..
+execute unless score $2384k242hd495_75 bolt.expr.temp matches ..-1 unless score $2384k242hd495_75 bolt.expr.temp matches 1.. run scoreboard players operation $2384k242hd495_75 bolt.expr.temp = $b obj
+scoreboard players operation $c obj = $2384k242hd495_75 bolt.expr.temp
+scoreboard players operation $2384k242hd495_80 bolt.expr.temp = $a obj
+execute unless score $2384k242hd495_80 bolt.expr.temp matches 0 run say it's a!
+execute if score $2384k242hd495_80 bolt.expr.temp matches 0 run function test:main/nested_execute_1
 execute store result score $i0 bolt.expr.temp run data get storage test:temp x 1
-execute store success score $2384k242hd495_91 bolt.expr.temp if score $i0 bolt.expr.temp = $a obj
-execute unless score $2384k242hd495_91 bolt.expr.temp matches 0 run say "a"
-execute if score $2384k242hd495_91 bolt.expr.temp matches 0 run function test:main/nested_execute_2
+execute store success score $2384k242hd495_84 bolt.expr.temp if score $i0 bolt.expr.temp = $a obj
+execute unless score $2384k242hd495_84 bolt.expr.temp matches 0 run say "a"
+execute if score $2384k242hd495_84 bolt.expr.temp matches 0 run function test:main/nested_execute_2
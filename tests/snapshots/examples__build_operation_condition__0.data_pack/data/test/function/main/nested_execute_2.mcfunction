@@ -5,9 +5,9 @@ data modify storage bolt.expr:temp i0 set from storage test:temp x
 execute if data storage test:temp x if data storage test:temp y store success score $i0 bolt.expr.temp run data modify storage bolt.expr:temp i0 set from storage test:temp y
 execute if score $i0 bolt.expr.temp matches 0 run return run say "c"
 execute if data storage test:temp {x: 5} run return run say "d"
-data remove storage bolt.expr:temp 2384k242hd495_111
-data modify storage bolt.expr:temp 2384k242hd495_111 set from storage test:temp x[0]
-execute if data storage bolt.expr:temp {2384k242hd495_111: 5} run return run say "e"
+data remove storage bolt.expr:temp 2384k242hd495_97
+data modify storage bolt.expr:temp 2384k242hd495_97 set from storage test:temp x[0]
+execute if data storage bolt.expr:temp {2384k242hd495_97: 5} run return run say "e"
 execute if data storage test:temp {x: "hello"} run return run say "f"
 scoreboard players set $i0 bolt.expr.temp 1
 data modify storage bolt.expr:temp i0 set from storage test:temp x
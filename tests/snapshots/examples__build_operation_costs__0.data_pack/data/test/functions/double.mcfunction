@@ -0,0 +1,6 @@
+scoreboard players operation #a obj = #x obj
+scoreboard players operation #a obj += #a obj
+scoreboard players operation #b obj = #x obj
+scoreboard players add #b obj 1
+scoreboard players operation #b obj += #b obj
+scoreboard players operation @a obj *= $2 bolt.expr.const
@@ -0,0 +1,5 @@
+scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard players set $-1 bolt.expr.const -1
+scoreboard players set $2 bolt.expr.const 2
+scoreboard players set $10 bolt.expr.const 10
@@ -0,0 +1,7 @@
+scoreboard players set #a obj 0
+scoreboard players operation #a obj -= #x obj
+scoreboard players set #b obj 0
+scoreboard players operation #b obj -= #x obj
+scoreboard players operation #a obj *= $-1 bolt.expr.const
+scoreboard players operation #b obj = @a obj
+scoreboard players operation #b obj *= $-1 bolt.expr.const
@@ -0,0 +1,7 @@
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+scoreboard players operation $i0 bolt.expr.temp *= $10 bolt.expr.const
+scoreboard players add $i0 bolt.expr.temp 1
+execute store result storage test:temp value double 0.1 run scoreboard players get $i0 bolt.expr.temp
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+execute store result storage bolt.expr:temp i0 float 1 run scoreboard players add $i0 bolt.expr.temp 1
+execute store result storage test:temp small double 0.1 run data get storage bolt.expr:temp i0 1
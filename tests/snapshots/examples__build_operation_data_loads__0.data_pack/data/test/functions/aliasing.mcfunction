@@ -0,0 +1,11 @@
+execute store result score #a obj run data get storage test:temp pos.y 1
+execute store result score $i0 bolt.expr.temp run data get entity @s Health 1
+scoreboard players operation #a obj *= $i0 bolt.expr.temp
+data modify storage test:temp pos.z set value 1
+execute store result score #b obj run data get storage test:temp pos.y 1
+scoreboard players operation #b obj *= $i0 bolt.expr.temp
+data modify storage test:temp pos set value {y: 2}
+data modify entity @s Air set value 3
+execute store result score #c obj run data get storage test:temp pos.y 1
+execute store result score $i0 bolt.expr.temp run data get entity @s Health 1
+scoreboard players operation #c obj *= $i0 bolt.expr.temp
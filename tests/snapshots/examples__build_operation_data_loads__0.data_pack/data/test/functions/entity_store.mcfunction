@@ -0,0 +1,3 @@
+execute store result entity @s CustomTag int 1 run scoreboard players get #x obj
+execute store result score #a obj run data get entity @s CustomTag 1
+scoreboard players add #a obj 1
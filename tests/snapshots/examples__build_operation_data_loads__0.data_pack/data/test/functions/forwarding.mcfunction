@@ -0,0 +1,6 @@
+execute store result storage test:temp x int 1 run scoreboard players get #x obj
+scoreboard players operation #a obj = #x obj
+scoreboard players add #a obj 1
+execute store result storage test:temp pos.y int 2 run scoreboard players get #x obj
+execute store result score #b obj run data get storage test:temp pos.y 1
+execute store result score #c obj run data get storage test:temp pos.y 3
@@ -0,0 +1 @@
+scoreboard objectives add bolt.expr.temp dummy
@@ -0,0 +1,10 @@
+execute store result score #a obj run data get storage test:temp x 1
+scoreboard players add #a obj 1
+data modify storage test:temp x set value 4
+execute store result score #b obj run data get storage test:temp x 1
+scoreboard players add #b obj 1
+execute store result score #c obj run data get entity @s Health 1
+scoreboard players add #c obj 1
+say hi
+execute store result score #a obj run data get entity @s Health 1
+scoreboard players add #a obj 1
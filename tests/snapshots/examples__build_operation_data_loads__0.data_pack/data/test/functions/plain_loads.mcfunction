@@ -0,0 +1,2 @@
+execute store result score #a obj run data get storage test:temp v 1
+scoreboard players operation #b obj = #a obj
@@ -0,0 +1,9 @@
+execute store result score $i0 bolt.expr.temp run data get storage test:temp x 1
+scoreboard players operation $i0 bolt.expr.temp *= $i0 bolt.expr.temp
+scoreboard players operation #a obj = $i0 bolt.expr.temp
+execute store result score $i0 bolt.expr.temp run data get storage test:temp y 1
+scoreboard players operation #a obj += $i0 bolt.expr.temp
+execute store result score #b obj run data get storage test:temp x 1
+scoreboard players add #b obj 1
+execute store result score #c obj run data get storage test:temp x 1
+scoreboard players operation #c obj -= $i0 bolt.expr.temp
@@ -0,0 +1,6 @@
+data modify storage bolt.expr:temp i0 set value {}
+data modify storage bolt.expr:temp i0 set from entity @e[type=pig, limit=1, sort=nearest]
+execute store result score #x obj run data get storage bolt.expr:temp i0.Health 1
+execute store result score #y obj run data get storage bolt.expr:temp i0.Air 1
+execute store result score #z obj run data get storage bolt.expr:temp i0.Fire 1
+execute store result score #a obj run data get storage bolt.expr:temp i0.Motion[1] 100
@@ -0,0 +1,6 @@
+execute store result score #x obj run data get entity @s Pos[0] 1
+execute store result score #y obj run data get entity @s Pos[1] 1
+data modify entity @s Motion[1] set value 0
+execute store result score #z obj run data get entity @s Pos[2] 1
+execute store result score #a obj run data get entity @s Pos[0] 1
+scoreboard players operation #a obj += #z obj
@@ -0,0 +1,5 @@
+data modify storage bolt.expr:temp i0 set value {}
+data modify storage bolt.expr:temp i0 set from entity @s Pos
+execute store result score #x obj run data get storage bolt.expr:temp i0[0] 1
+execute store result score #y obj run data get storage bolt.expr:temp i0[1] 1
+execute store result score #z obj run data get storage bolt.expr:temp i0[2] 1
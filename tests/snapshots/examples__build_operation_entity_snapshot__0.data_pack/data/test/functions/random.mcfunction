@@ -0,0 +1,3 @@
+execute store result score #x obj run data get entity @e[sort=random, limit=1] Health 1
+execute store result score #y obj run data get entity @e[sort=random, limit=1] Air 1
+execute store result score #z obj run data get entity @e[sort=random, limit=1] Fire 1
@@ -0,0 +1,7 @@
+execute store result score #x obj run data get entity @e[scores={obj=1..}, limit=1] Health 1
+scoreboard players set @s obj 0
+data modify storage bolt.expr:temp i0 set value {}
+data modify storage bolt.expr:temp i0 set from entity @e[scores={obj=1..}, limit=1]
+execute store result score #y obj run data get storage bolt.expr:temp i0.Air 1
+execute store result score #z obj run data get storage bolt.expr:temp i0.Fire 1
+execute store result score #a obj run data get storage bolt.expr:temp i0.FallDistance 1
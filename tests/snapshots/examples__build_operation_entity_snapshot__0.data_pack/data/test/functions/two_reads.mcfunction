@@ -0,0 +1,2 @@
+execute store result score #x obj run data get entity @s Pos[0] 1
+execute store result score #y obj run data get entity @s Pos[1] 1
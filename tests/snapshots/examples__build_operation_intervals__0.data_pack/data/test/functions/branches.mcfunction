@@ -0,0 +1,4 @@
+say always
+scoreboard players operation $i0 bolt.expr.temp = #x obj
+scoreboard players operation $i0 bolt.expr.temp %= $10 bolt.expr.const
+execute if score $i0 bolt.expr.temp matches 6.. run say sometimes
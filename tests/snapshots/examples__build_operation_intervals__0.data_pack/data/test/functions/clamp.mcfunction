@@ -0,0 +1,7 @@
+execute store result score #a obj run data get storage test:temp flag 1
+execute store result score #b obj run data get storage test:temp count 1
+execute store result score #c obj run data get storage test:temp count 1
+scoreboard players operation #c obj < $100 bolt.expr.const
+scoreboard players operation #c obj > $0 bolt.expr.const
+execute store result score #x obj run data get storage test:temp value 1
+scoreboard players operation #x obj < $10 bolt.expr.const
@@ -0,0 +1,3 @@
+scoreboard players set #a obj 1
+scoreboard players set #b obj 0
+scoreboard players set #c obj 0
@@ -0,0 +1,6 @@
+scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard players set $0 bolt.expr.const 0
+scoreboard players set $10 bolt.expr.const 10
+scoreboard players set $100 bolt.expr.const 100
+scoreboard players set $200 bolt.expr.const 200
@@ -0,0 +1,7 @@
+scoreboard players operation #a obj = #x obj
+scoreboard players operation #a obj %= $10 bolt.expr.const
+execute store result score #b obj run data get storage test:temp flag 1
+scoreboard players operation #b obj %= $200 bolt.expr.const
+scoreboard players operation #c obj = #x obj
+scoreboard players operation #c obj %= $10 bolt.expr.const
+scoreboard players add #c obj 5
@@ -0,0 +1 @@
+scoreboard players set #c obj 1
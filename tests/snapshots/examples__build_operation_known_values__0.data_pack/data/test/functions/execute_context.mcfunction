@@ -0,0 +1,4 @@
+scoreboard players set #a obj 5
+execute as @e[type=pig] run function test:execute_context/nested_execute_0
+scoreboard players operation #c obj = #a obj
+scoreboard players add #c obj 1
@@ -0,0 +1,2 @@
+scoreboard players operation #b obj = #a obj
+scoreboard players add #b obj 1
@@ -0,0 +1,4 @@
+scoreboard players set #a obj 5
+function test:main
+scoreboard players operation #b obj = #a obj
+scoreboard players add #b obj 1
@@ -0,0 +1,5 @@
+scoreboard players set #a obj 5
+scoreboard players set #b obj 11
+scoreboard players set #c obj 6
+scoreboard players set #a obj 11
+scoreboard players set #x obj 1
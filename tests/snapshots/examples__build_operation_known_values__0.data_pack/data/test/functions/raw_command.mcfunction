@@ -0,0 +1,5 @@
+scoreboard players set #a obj 5
+scoreboard players set #b obj 6
+scoreboard players add #a obj 1
+scoreboard players operation #c obj = #a obj
+scoreboard players add #c obj 1
@@ -0,0 +1,6 @@
+scoreboard players set #a obj 5
+scoreboard players set #b obj 6
+scoreboard players set @s obj 3
+scoreboard players set #c obj 11
+scoreboard players set @a obj 2
+scoreboard players set #c obj 11
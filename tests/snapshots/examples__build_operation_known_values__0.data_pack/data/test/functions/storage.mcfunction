@@ -0,0 +1,9 @@
+data modify storage demo:main x set value 3
+data modify storage demo:main nested.y set value 4
+scoreboard players set #a obj 12
+data modify storage demo:main nested set value {}
+scoreboard players set #b obj 3
+execute store result score $i0 bolt.expr.temp run data get storage demo:main nested.y 1
+scoreboard players operation #b obj += $i0 bolt.expr.temp
+execute store result storage demo:main x int 1 run scoreboard players get #a obj
+execute store result score #c obj run data get storage demo:main x 1
@@ -0,0 +1,6 @@
+scoreboard players set #a obj 5
+scoreboard players operation #b obj = #x obj
+scoreboard players add #b obj 5
+scoreboard players operation #a obj = #x obj
+scoreboard players operation #c obj = #a obj
+scoreboard players add #c obj 1
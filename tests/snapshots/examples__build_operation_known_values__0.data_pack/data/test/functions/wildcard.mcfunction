@@ -0,0 +1,4 @@
+scoreboard players set #x obj 3
+scoreboard players set * obj 5
+scoreboard players operation #a obj = #x obj
+scoreboard players add #a obj 1
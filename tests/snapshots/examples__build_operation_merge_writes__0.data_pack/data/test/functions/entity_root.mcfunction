@@ -0,0 +1 @@
+data merge entity @s {Motion: [0.0d, 1.0d, 0.0d], Fire: 20, NoGravity: 1b}
@@ -0,0 +1,4 @@
+data modify storage test:temp a.x set value 1
+execute store result score #y obj run data get storage test:temp a.y 1
+data modify storage test:temp a merge value {y: 2, z: 3}
+data modify storage test:temp b.x set value 1
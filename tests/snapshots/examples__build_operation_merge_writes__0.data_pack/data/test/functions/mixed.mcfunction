@@ -0,0 +1,4 @@
+data modify storage test:temp a merge value {x: 1, y: 2, z: 3}
+execute store result storage test:temp a.s int 1 run scoreboard players get #x obj
+scoreboard players set #x obj 3
+execute store result storage test:temp a.t int 1 run scoreboard players get #y obj
@@ -0,0 +1,2 @@
+data modify storage test:temp a merge value {x: 1, y: 2}
+data modify storage test:temp a.b set value {c: 1}
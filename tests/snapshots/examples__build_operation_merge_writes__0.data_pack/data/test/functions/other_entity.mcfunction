@@ -0,0 +1,3 @@
+data modify entity @s Fire set value 20
+data modify entity @p Air set value 3
+data modify entity @s NoGravity set value 1b
@@ -0,0 +1,3 @@
+data modify storage test:temp a.x set value 1
+execute store result storage test:temp a.y int 1 run scoreboard players get #x obj
+data modify storage test:temp a merge value {y: 2, z: 3}
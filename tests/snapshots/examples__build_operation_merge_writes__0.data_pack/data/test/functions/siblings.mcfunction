@@ -0,0 +1 @@
+data modify storage test:temp a merge value {x: 1, y: 2, z: "s"}
@@ -1,11 +1,11 @@
-scoreboard objectives add bolt.expr.temp dummy
 scoreboard objectives add bolt.expr.const dummy
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard players set $-1 bolt.expr.const -1
+scoreboard players set $0 bolt.expr.const 0
+scoreboard players set $3 bolt.expr.const 3
+scoreboard players set $4 bolt.expr.const 4
 scoreboard players set $10 bolt.expr.const 10
 scoreboard players set $20 bolt.expr.const 20
 scoreboard players set $30 bolt.expr.const 30
 scoreboard players set $40 bolt.expr.const 40
-scoreboard players set $0 bolt.expr.const 0
 scoreboard players set $100 bolt.expr.const 100
-scoreboard players set $-1 bolt.expr.const -1
-scoreboard players set $3 bolt.expr.const 3
-scoreboard players set $4 bolt.expr.const 4
@@ -42,5 +42,5 @@ execute store result storage example:main value int 1 run scoreboard players ope
 execute store result score $result abc.main run data get storage example:main b 1
 execute store result score $i0 bolt.expr.temp run data get storage example:main c 1
 scoreboard players operation $result abc.main < $i0 bolt.expr.temp
-execute store result score $i1 bolt.expr.temp run data get storage example:main a 1
-scoreboard players operation $result abc.main < $i1 bolt.expr.temp
+execute store result score $i0 bolt.expr.temp run data get storage example:main a 1
+scoreboard players operation $result abc.main < $i0 bolt.expr.temp
@@ -1,3 +1,3 @@
-scoreboard objectives add bolt.expr.const dummy
 scoreboard objectives add bolt.expr.temp dummy
+scoreboard objectives add bolt.expr.const dummy
 scoreboard players set $60 bolt.expr.const 60
@@ -1,4 +1,4 @@
-scoreboard objectives add bolt.expr.const dummy
 scoreboard objectives add bolt.expr.temp dummy
-scoreboard players set $1200 bolt.expr.const 1200
+scoreboard objectives add bolt.expr.const dummy
 scoreboard players set $20 bolt.expr.const 20
+scoreboard players set $1200 bolt.expr.const 1200
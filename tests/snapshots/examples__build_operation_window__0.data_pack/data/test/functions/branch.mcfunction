@@ -0,0 +1,7 @@
+scoreboard players operation $a obj = $x obj
+scoreboard players operation $a obj += $a obj
+scoreboard players operation $b obj = $a obj
+scoreboard players add $b obj 1
+execute if score $a obj matches 11.. run function test:branch/nested_execute_0
+scoreboard players operation $c obj = $b obj
+scoreboard players operation $c obj += $a obj
@@ -0,0 +1,4 @@
+scoreboard players operation $c obj = $a obj
+scoreboard players remove $c obj 1
+scoreboard players operation $b obj = $c obj
+scoreboard players operation $b obj += $b obj
@@ -0,0 +1,9 @@
+scoreboard players operation $a obj = $x obj
+scoreboard players add $a obj 1
+scoreboard players operation $b obj = $a obj
+scoreboard players operation $b obj += $b obj
+say separate window
+scoreboard players operation $c obj = $a obj
+scoreboard players operation $c obj -= $b obj
+scoreboard players operation $b obj = $c obj
+scoreboard players operation $b obj *= $c obj
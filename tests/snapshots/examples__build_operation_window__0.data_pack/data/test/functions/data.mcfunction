@@ -0,0 +1,3 @@
+execute store result storage demo:main value int 2 run scoreboard players get $x obj
+data modify storage demo:main other set from storage demo:main value
+execute store result score $a obj run data get storage demo:main value 1
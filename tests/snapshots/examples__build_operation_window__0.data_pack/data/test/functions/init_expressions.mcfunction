@@ -0,0 +1,3 @@
+scoreboard objectives add bolt.expr.temp dummy
+scoreboard objectives add bolt.expr.const dummy
+scoreboard players set $3 bolt.expr.const 3
@@ -0,0 +1,4 @@
+scoreboard players operation $a obj = $x obj
+scoreboard players operation $a obj *= $3 bolt.expr.const
+execute as @a run function test:nested/nested_execute_0
+scoreboard players add $c obj 1
@@ -0,0 +1,4 @@
+scoreboard players operation $b obj = $a obj
+scoreboard players operation $b obj += $x obj
+scoreboard players operation $c obj = $b obj
+scoreboard players operation $c obj *= $b obj
@@ -0,0 +1,13 @@
+scoreboard players operation $i0 bolt.expr.temp = $x obj
+scoreboard players add $i0 bolt.expr.temp 1
+scoreboard players operation $i1 bolt.expr.temp = $x obj
+scoreboard players add $i1 bolt.expr.temp 2
+scoreboard players operation $a obj = $i0 bolt.expr.temp
+scoreboard players operation $a obj *= $i1 bolt.expr.temp
+scoreboard players operation $i1 bolt.expr.temp = $x obj
+scoreboard players remove $i1 bolt.expr.temp 2
+scoreboard players operation $b obj = $i0 bolt.expr.temp
+scoreboard players operation $b obj *= $i1 bolt.expr.temp
+scoreboard players operation $c obj = $b obj
+scoreboard players operation $c obj *= $3 bolt.expr.const
+scoreboard players operation $c obj += $a obj
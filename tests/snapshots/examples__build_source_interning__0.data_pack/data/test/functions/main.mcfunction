@@ -0,0 +1,11 @@
+say True
+say False
+say True
+say True
+say False
+say True
+say True
+scoreboard players operation $c obj = $a obj
+scoreboard players operation $c obj += $b obj
+execute store result storage demo:temp foo.bar int 2 run scoreboard players get $c obj
+data modify storage demo:temp list append from storage demo:temp foo.bar
@@ -1,5 +1,5 @@
 scoreboard objectives add bolt.expr.const dummy
 scoreboard objectives add bolt.expr.temp dummy
 scoreboard players set $2 bolt.expr.const 2
-scoreboard players set $100 bolt.expr.const 100
 scoreboard players set $5 bolt.expr.const 5
+scoreboard players set $100 bolt.expr.const 100
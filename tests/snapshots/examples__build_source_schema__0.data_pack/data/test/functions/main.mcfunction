@@ -0,0 +1,8 @@
+data modify storage demo:item Count set value 1b
+execute store result storage demo:item Slot byte 1 run scoreboard players get @s obj
+execute store result storage demo:item tag.Damage int 2 run scoreboard players get $damage obj
+data modify storage demo:item tag.display.Lore append value "Shiny"
+data modify block ~ ~ ~ Items append value {id: "minecraft:stone", Count: 64b}
+data modify block ~ ~ ~ Items[0].tag.BlockEntityTag.Items append from storage demo:item
+data modify block ~ ~ ~ CustomData.power set value 5
+execute store result score $count obj run data get block ~ ~ ~ Items[0].Count 1
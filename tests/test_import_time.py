@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+LOOKUP_BUDGET_US = 50_000
+
+LOOKUP_SCRIPT = """
+import json, sys, time
+import beet, bolt, mecha
+
+start = time.perf_counter()
+from bolt_expressions import beet_default
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": int(elapsed * 1e6), "modules": sorted(sys.modules)}))
+"""
+
+
+def plugin_lookup() -> tuple[int, list[str]]:
+    """Times the `beet_default` lookup beet performs for `require: bolt_expressions`.
+
+    Beet, bolt and mecha are imported beforehand since the pipeline already loaded
+    them by the time the plugin is resolved.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", LOOKUP_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    data = json.loads(result.stdout)
+
+    return data["elapsed"], data["modules"]
+
+
+def test_plugin_lookup_time():
+    elapsed, modules = plugin_lookup()
+
+    assert "bolt_expressions.plugin" in modules
+    assert "bolt_expressions.node" not in modules
+    assert "bolt_expressions.optimizer" not in modules
+    assert elapsed < LOOKUP_BUDGET_US
+
+
+def test_exports():
+    import bolt_expressions
+
+    for module, names in bolt_expressions.SUBMODULE_EXPORTS.items():
+        submodule = __import__(f"bolt_expressions.{module}", fromlist=["__all__"])
+        assert list(names) == submodule.__all__
+
+    assert bolt_expressions.Scoreboard.__module__ == "bolt_expressions.api"